@@ -6,7 +6,7 @@ termination of long-running or streaming operations via cooperative polling.
 
 from __future__ import annotations
 
-from threading import Lock
+from threading import Event, Lock
 from typing import List
 
 from .state import State
@@ -18,11 +18,18 @@ class CancellationToken:
 
     Thread-safe for basic ``cancel`` + ``raise_if_cancelled`` usage. Child tokens
     inherit cancellation when the parent is cancelled.
+
+    Attributes:
+        is_cancelled: Plain boolean flag for hot polling loops (one attribute
+            read, no call). Written only by ``cancel``; treat as read-only.
     """
 
     def __init__(self, *, parent: "CancellationToken | None" = None) -> None:
         self._state = State()
+        self.is_cancelled = False
         self._lock = Lock()
+        # Set on cancel so waiters (e.g. retry backoff) wake immediately.
+        self._event = Event()
         self._children: List[CancellationToken] = []
         if parent is not None:
             parent.link_child(self)
@@ -30,7 +37,7 @@ class CancellationToken:
     @property
     def cancelled(self) -> bool:  # noqa: D401 - short form
         """Whether cancellation has been requested."""
-        return self._state.cancelled
+        return self.is_cancelled
 
     @property
     def reason(self) -> str | None:  # noqa: D401 - short form
@@ -44,6 +51,9 @@ class CancellationToken:
                 return
             self._state.cancelled = True
             self._state.reason = reason
+            # Reason first: pollers that see the flag also see the reason.
+            self.is_cancelled = True
+            self._event.set()
             children = list(self._children)
         for child in children:
             child.cancel(reason)
@@ -60,9 +70,17 @@ class CancellationToken:
 
     def raise_if_cancelled(self) -> None:
         """Raise ``CancelledError`` if token is cancelled."""
-        if self._state.cancelled:
+        if self.is_cancelled:
             raise CancelledError(self._state.reason or "operation cancelled")
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block up to ``timeout`` seconds; return True as soon as cancelled.
+
+        Returns False when the timeout elapses without cancellation. Use in
+        place of ``time.sleep`` so cancelled operations stop waiting at once.
+        """
+        return self._event.wait(timeout)
+
     def child(self) -> "CancellationToken":
         """Create and link a child token (shortcut)."""
         return CancellationToken(parent=self)
@@ -17,8 +17,13 @@ from .core import (
     merge_capabilities,
     should_attempt,
 )
-from .observed import load_observed, record_observation
-from .void_profile import apply_void_enrichment
+from .observed import (
+    load_observed,
+    observed_generation,
+    record_observation,
+    record_observation_once,
+)
+from .void_profile import apply_void_enrichment, has_void_defaults
 
 __all__ = [
     # constants
@@ -37,7 +42,10 @@ __all__ = [
     "should_attempt",
     # observed persistence
     "load_observed",
+    "observed_generation",
     "record_observation",
+    "record_observation_once",
     # Void-oriented enrichment
     "apply_void_enrichment",
+    "has_void_defaults",
 ]
@@ -13,6 +13,7 @@ Storage
 Functions
 - ``load_observed(provider, providers_root=None)`` → mapping by model id
 - ``record_observation(provider, model_id, feature, value, providers_root=None)``
+- ``observed_generation()`` → in-process write counter for cache invalidation
 
 Notes
 - The ``providers_root`` parameter is accepted for signature compatibility but
@@ -22,8 +23,14 @@ Notes
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+# Observations already persisted by this process, keyed by
+# ``(provider, model_id, feature)`` and mapped to the recorded value.
+_RECORDED: Dict[Tuple[str, str, str], bool] = {}
+
+# Bumped on every write so in-process readers can tell cached mappings are stale.
+_GENERATION = 0
 
 
 def _now_iso() -> str:
@@ -66,7 +73,7 @@ def record_observation(
     feature: str,
     value: bool,
     providers_root: Optional[object] = None,
-) -> None:
+) -> bool:
     """Record an observed capability for a model.
 
     This function is idempotent and merges with existing observations.
@@ -77,7 +84,11 @@ def record_observation(
         feature: Capability name (e.g., "vision").
         value: True if supported (observed success), False if explicitly unsupported.
         providers_root: Ignored; present for backward compatibility.
+
+    Returns:
+        True when the observation was persisted, False when the write failed.
     """
+    global _GENERATION
     try:
         from ...service import db as _db  # lazy: avoid import-time inner->outer edge
 
@@ -85,9 +96,53 @@ def record_observation(
         _db.record_observed_capability(
             provider, model_id, feature, value, updated_at=_now_iso()
         )
+        _GENERATION += 1
+        return True
     except Exception:
         # Best-effort persistence; do not raise
+        return False
+
+
+def record_observation_once(provider: str, model_id: str, feature: str, value: bool) -> None:
+    """Record an observation unless this process already persisted the same value.
+
+    Hot paths (e.g., every stream's first delta) observe the same capability
+    repeatedly. Since :func:`record_observation` is idempotent, repeats are
+    skipped with a dict lookup instead of a database round-trip. A changed
+    value is always written through.
+
+    Parameters:
+        provider: Provider name.
+        model_id: Model identifier.
+        feature: Capability name (e.g., "streaming").
+        value: Observed support flag.
+
+    Side effects:
+        Persists via :func:`record_observation` on first sight of a value and
+        updates the in-process cache only when the write succeeded, so a
+        failed write (e.g., before the DB is initialized) is retried on the
+        next call. Never raises.
+    """
+    key = (provider, model_id, feature)
+    flag = bool(value)
+    if _RECORDED.get(key) is flag:
         return
+    if record_observation(provider, model_id, feature, value):
+        _RECORDED[key] = flag
+
+
+def observed_generation() -> int:
+    """Return a counter that changes whenever this process records an observation.
+
+    Callers caching :func:`load_observed` results compare it against the value
+    captured at load time; writes from other processes are not reflected.
+    """
+    return _GENERATION
 
 
-__all__ = ["load_observed", "record_observation"]
+__all__ = [
+    "load_observed",
+    "observed_generation",
+    "record_observation",
+    "record_observation_once",
+]
@@ -245,7 +245,7 @@ def apply_void_enrichment(provider: str, model_id: str, caps: Dict[str, Any] | N
     - Base capabilities come from provider metadata and
       [`_normalize_capabilities()`](crux/crux_providers/base/get_models_base.py:238).
     - Observed runtime flags are merged in
-      [`ModelRegistryRepository._apply_observed()`](crux/crux_providers/base/repositories/model_registry/repository_parts/model_registry_repository.py:64).
+      [`ModelRegistryRepository._apply_enrichments()`](crux/crux_providers/base/repositories/model_registry/repository_parts/model_registry_repository.py:143).
     - This function then fills missing defaults, producing a mapping suitable
       for Void and other orchestrators.
 
@@ -271,4 +271,13 @@ def apply_void_enrichment(provider: str, model_id: str, caps: Dict[str, Any] | N
     return base
 
 
-__all__ = ["apply_void_enrichment"]
\ No newline at end of file
+def has_void_defaults(provider: str) -> bool:
+    """Return True when :func:`apply_void_enrichment` has defaults for ``provider``.
+
+    Callers enriching many models can use this to skip the per-model call
+    (which would only copy the mapping) for providers without a profile.
+    """
+    return (provider or "").lower().strip() in _PROVIDER_DEFAULTS
+
+
+__all__ = ["apply_void_enrichment", "has_void_defaults"]
\ No newline at end of file
@@ -85,19 +85,35 @@ def _heuristic_from_message(msg: str) -> Optional[ErrorCode]:  # pragma: no cove
     return None
 
 
+# Exact-type fast path for exceptions whose code is fully determined by their
+# type. Only type-determined classifications are cached here: generic
+# exceptions are classified by HTTP status or message, which vary per instance.
+_TYPE_TO_CODE: Dict[type, ErrorCode] = {
+    TimeoutError: ErrorCode.TIMEOUT,
+    asyncio.TimeoutError: ErrorCode.TIMEOUT,
+}
+
+
 def classify_exception(exc: Exception) -> ErrorCode:
     """Classify an exception into a normalized :class:`ErrorCode`.
 
     Precedence:
         1. ProviderError passthrough.
-        2. Timeout exceptions (sync/async).
+        2. Timeout exceptions (sync/async), resolved via an exact-type table.
         3. HTTP status mapping.
         4. Legacy substring heuristics.
         5. ``UNKNOWN`` fallback.
     """
     if isinstance(exc, ProviderError):
         return exc.code
+    exc_type = type(exc)
+    code = _TYPE_TO_CODE.get(exc_type)
+    if code is not None:
+        return code
     if isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        # Timeout subclasses always classify as TIMEOUT; remember the concrete
+        # type so later occurrences resolve with a single dict lookup.
+        _TYPE_TO_CODE[exc_type] = ErrorCode.TIMEOUT
         return ErrorCode.TIMEOUT
     status = _extract_status(exc)
     if status is not None and status in _HTTP_STATUS_MAP:
@@ -201,6 +201,8 @@ def log_event(
     ------------
     Writes a single line JSON payload to the configured logger handler.
     """
+    if not info_enabled(logger):
+        return
     payload = {"event": event}
     if ctx:
         payload |= ctx.to_dict()
@@ -211,6 +213,17 @@ def log_event(
     logger.info(json.dumps(payload, ensure_ascii=False))
 
 
+def info_enabled(logger: Any) -> bool:
+    """Return True when ``logger`` would emit an INFO record.
+
+    Call sites use this to skip building log payloads when the level is
+    filtered out. Logger stubs without ``isEnabledFor`` are treated as enabled
+    so they keep receiving events.
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return is_enabled_for is None or bool(is_enabled_for(logging.INFO))
+
+
 # ---------------------- Normalization Layer ---------------------------------
 REQUIRED_NORMALIZED_KEYS = (
     "structured",
@@ -268,7 +281,11 @@ def normalized_log_event(  # noqa: PLR0913,C901  # pylint: disable=too-many-argu
         - Keys in the normalized schema are guaranteed to be present, with one exception:
             ``error_code`` is omitted when ``None`` to reflect "no error" more naturally
             and remain compatible with legacy expectations in unit tests.
+        - Returns immediately when the logger has INFO disabled, before any
+          payload is built.
     """
+    if not info_enabled(logger):
+        return
     base_fields: Dict[str, Any] = {
         "structured": structured,
         "phase": phase,
@@ -299,6 +316,7 @@ __all__ = [
     "get_logger",
     "configure_logger",
     "log_event",
+    "info_enabled",
     "normalized_log_event",
     "REQUIRED_NORMALIZED_KEYS",
 ]
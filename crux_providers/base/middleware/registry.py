@@ -6,6 +6,8 @@ dependencies minimal and respect one-class-per-file guidance.
 
 from __future__ import annotations
 
+from ..logging import LogContext
+from ..models import ChatRequest, ChatResponse
 from .chain import ChatMiddlewareChain
 
 _GLOBAL_CHAIN: ChatMiddlewareChain = ChatMiddlewareChain(items=[])
@@ -26,3 +28,44 @@ def get_middleware_chain() -> ChatMiddlewareChain:
     """Return the global middleware chain (empty by default)."""
 
     return _GLOBAL_CHAIN
+
+
+def safe_run_before_chat(ctx: LogContext, request: ChatRequest) -> ChatRequest:
+    """Run the global ``before_chat`` hooks, returning the input on failure.
+
+    Uses a single local ``try`` instead of a ``contextlib.suppress`` context
+    manager so the hot path allocates nothing; an empty chain returns the
+    request untouched without entering the chain at all.
+    """
+
+    chain = _GLOBAL_CHAIN
+    if not chain.items:
+        return request
+    try:
+        return chain.run_before_chat(ctx, request)
+    except Exception:  # noqa: BLE001 - middleware failures must not break chat
+        return request
+
+
+def safe_run_after_chat(ctx: LogContext, response: ChatResponse) -> ChatResponse:
+    """Run the global ``after_chat`` hooks, returning the input on failure."""
+
+    chain = _GLOBAL_CHAIN
+    if not chain.items:
+        return response
+    try:
+        return chain.run_after_chat(ctx, response)
+    except Exception:  # noqa: BLE001 - middleware failures must not break chat
+        return response
+
+
+def safe_run_before_stream(ctx: LogContext, request: ChatRequest) -> ChatRequest:
+    """Run the global ``before_stream`` hooks, returning the input on failure."""
+
+    chain = _GLOBAL_CHAIN
+    if not chain.items:
+        return request
+    try:
+        return chain.run_before_stream(ctx, request)
+    except Exception:  # noqa: BLE001 - middleware failures must not break streaming
+        return request
@@ -11,7 +11,7 @@ from dataclasses import dataclass, asdict, field
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
     """A single model listing entry.
 
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from .model_info import ModelInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelRegistrySnapshot:
     """Snapshot of available models for a specific provider.
 
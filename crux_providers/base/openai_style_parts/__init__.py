@@ -11,9 +11,11 @@ Re-exports provide a stable import surface for convenience.
 from .base import BaseOpenAIStyleProvider
 from .client_protocol import _ChatCompletionsClient
 from .provider_init import _ProviderInit
+from .response_cache import ResponseCache
 
 __all__ = [
     "BaseOpenAIStyleProvider",
     "_ChatCompletionsClient",
     "_ProviderInit",
+    "ResponseCache",
 ]
@@ -0,0 +1,211 @@
+"""Native async chat/stream surface for OpenAI-style providers.
+
+Purpose:
+- Provide ``chat_async`` and ``stream_chat_async`` so async gateways can await
+  provider calls directly instead of offloading the synchronous path to a
+  thread per request.
+
+External dependencies:
+- Concrete providers opt in by returning an async SDK client (for example
+  ``openai.AsyncOpenAI``) from ``_make_async_client``. No network I/O happens
+  in this module itself.
+
+Fallback semantics:
+- The async client is built only after middleware, prerequisite checks and
+  the response cache; a missing API key yields the same error response or
+  terminal event as the synchronous path instead of an SDK exception.
+- When no async client is available, ``chat_async`` runs the synchronous
+  invocation via ``asyncio.to_thread`` and ``stream_chat_async`` drains the
+  synchronous adapter on a worker thread, preserving behavior at the cost of
+  the thread hop.
+- Prerequisite failures, middleware, logging, and error shaping are shared
+  with the synchronous path.
+
+Timeout strategy:
+- The start phase is bounded with ``asyncio.wait_for`` using
+  ``get_timeout_config().start_timeout_seconds`` (the async analogue of
+  ``operation_timeout``). Mid-stream timing is not enforced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Optional
+
+from ..logging import LogContext
+from ..middleware.registry import (
+    safe_run_after_chat,
+    safe_run_before_chat,
+    safe_run_before_stream,
+)
+from ..models import ChatRequest, ChatResponse
+from ..streaming import BaseStreamingAdapter, ChatStreamEvent
+from ..timeouts import get_timeout_config
+from ..capabilities import record_observation_once
+from .nonstream_helpers import (
+    build_nonstream_success_response,
+    nonstream_error_response,
+    run_nonstream_with_timeout_and_retry_async,
+)
+from .structured_stream import StreamingStructuredTranslator
+from .style_helpers import (
+    ainvoke_create,
+    build_chat_params,
+    build_stream_params,
+    extract_messages_and_format,
+    extract_openai_text,
+    prepare_response_format,
+)
+
+_STREAM_END = object()
+
+
+class _AsyncChatMixin:
+    """Async counterparts of ``chat``/``stream_chat`` for ``BaseOpenAIStyleProvider``.
+
+    Relies on the host class for ``provider_name``, ``_model``, ``_logger``,
+    ``_response_cache``, prerequisite checks, logging helpers, and retry
+    configuration.
+    """
+
+    def _make_async_client(self) -> Optional[Any]:
+        """Return an async SDK client, or ``None`` to use the threaded fallback.
+
+        Subclasses override this when their SDK ships an async client exposing
+        an awaitable ``chat.completions.create(**params)``.
+        """
+        return None
+
+    def _try_make_async_client(self) -> Optional[Any]:
+        """Build the async client, or return ``None`` to use the threaded fallback.
+
+        Called only after prerequisite checks pass, so a request will be sent.
+        A construction failure falls back to the synchronous path, which builds
+        its own client and reports errors exactly like ``chat``/``stream_chat``.
+        """
+        try:
+            return self._make_async_client()
+        except Exception as e:  # noqa: BLE001 - reported by the sync fallback
+            self._logger.debug("async client unavailable; using threaded fallback: %s", e)
+            return None
+
+    async def chat_async(self, request: ChatRequest) -> ChatResponse:
+        """Perform a non-streaming chat completion without blocking the event loop.
+
+        Mirrors :meth:`chat`: middleware, start logging, prerequisite checks,
+        the optional response cache, timeout + retry, and response shaping
+        behave identically. The async client is built only once a request
+        will actually be sent.
+        """
+        model = request.model or self._model
+        ctx = LogContext(provider=self.provider_name, model=model)
+        request = safe_run_before_chat(ctx, request)
+        self._log_chat_start(ctx, request)
+        pre = self._check_nonstream_prereqs(model)
+        if pre is not None:
+            return pre
+
+        cache = self._response_cache
+        key = cache.key_for(model, request) if cache is not None else None
+        cached = cache.get(key) if key is not None else None
+        if cached is not None:
+            return safe_run_after_chat(ctx, cached)
+
+        client = self._try_make_async_client()
+        if client is None:
+            resp = await asyncio.to_thread(self._invoke_nonstream_chat, model=model, request=request, ctx=ctx)
+        else:
+            resp = await self._invoke_nonstream_chat_async(client, model=model, request=request, ctx=ctx)
+        if key is not None:
+            cache.put(key, resp)
+        return safe_run_after_chat(ctx, resp)
+
+    async def _invoke_nonstream_chat_async(
+        self, client: Any, *, model: str, request: ChatRequest, ctx: LogContext
+    ) -> ChatResponse:
+        """Async counterpart of ``_invoke_nonstream_chat`` over ``client``."""
+        messages, response_format, is_structured = extract_messages_and_format(request)
+        params = build_chat_params(model, messages, request, response_format)
+        try:
+            resp, latency_ms = await run_nonstream_with_timeout_and_retry_async(
+                invoke_fn=ainvoke_create,
+                invoke_args=(client, params, model, self.provider_name),
+                ctx=ctx,
+                logger=self._logger,
+                retry_config_factory=lambda: self._build_retry_config(ctx, phase="start"),
+                start_timeout_seconds=get_timeout_config().start_timeout_seconds,
+            )
+            return build_nonstream_success_response(
+                provider_name=self.provider_name,
+                model=model,
+                text=extract_openai_text(resp),
+                is_structured=is_structured,
+                latency_ms=latency_ms,
+            )
+        except Exception as e:  # noqa: BLE001
+            return nonstream_error_response(
+                provider_name=self.provider_name,
+                model=model,
+                ctx=ctx,
+                logger=self._logger,
+                exc=e,
+            )
+
+    async def stream_chat_async(self, request: ChatRequest) -> AsyncIterator[ChatStreamEvent]:
+        """Stream chat deltas with ``async for`` over the SDK's async stream.
+
+        Events, metrics, and terminal semantics match :meth:`stream_chat`. The
+        async client is built only after prerequisites pass; without one the
+        same adapter is drained synchronously on a worker thread.
+        """
+        model = request.model or self._model
+        ctx = LogContext(provider=self.provider_name, model=model)
+        request = safe_run_before_stream(ctx, request)
+        failed = self._check_stream_prereqs(request)
+        if failed is not None:
+            yield failed
+            return
+        self._log_stream_start(ctx, request)
+
+        messages = self._build_stream_messages(request)
+        response_format, _ = prepare_response_format(request)
+        client = self._try_make_async_client()
+        async_starter = None
+        if client is not None:
+            params = build_stream_params(model, messages, request, response_format)
+
+            async def async_starter():
+                return await ainvoke_create(client, params, model, self.provider_name)
+
+        adapter = BaseStreamingAdapter(
+            ctx=ctx,
+            provider_name=self.provider_name,
+            model=model,
+            starter=self._build_stream_starter(
+                model=model, request=request, messages=messages, response_format=response_format, ctx=ctx
+            ),
+            async_starter=async_starter,
+            translator=self._translate_openai_delta,
+            structured_translator=StreamingStructuredTranslator(),
+            retry_config_factory=lambda phase: self._build_retry_config(ctx, phase=phase),
+            logger=self._logger,
+        )
+        events = adapter.run_async() if async_starter is not None else _drain_in_thread(adapter.run())
+        observed = False
+        async for ev in events:
+            if not observed and ev.delta:
+                observed = True
+                record_observation_once(self.provider_name, model, "streaming", True)
+            yield ev
+
+
+async def _drain_in_thread(events) -> AsyncIterator[ChatStreamEvent]:
+    """Drain a synchronous event iterator on a worker thread, one event per hop."""
+    while True:
+        ev = await asyncio.to_thread(next, events, _STREAM_END)
+        if ev is _STREAM_END:
+            return
+        yield ev
+
+
+__all__ = ["_AsyncChatMixin"]
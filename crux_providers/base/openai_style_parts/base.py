@@ -20,19 +20,24 @@ Timeout strategy:
 from __future__ import annotations
 
 import asyncio
+import functools
 from typing import Iterator, Optional
-from contextlib import suppress
 
 from ..constants import MISSING_API_KEY_ERROR, STRUCTURED_STREAMING_UNSUPPORTED
 from ..errors import ErrorCode, ProviderError, classify_exception
 from ..interfaces import HasDefaultModel, LLMProvider, SupportsJSONOutput, SupportsStreaming
-from ..logging import LogContext, get_logger, normalized_log_event
+from ..logging import LogContext, get_logger, info_enabled, normalized_log_event
 from ..models import ChatRequest, ChatResponse, ProviderMetadata
-from ..resilience.retry import RetryConfig, retry
+from ..resilience.retry import RetryConfig, retry_call
 from ..streaming import BaseStreamingAdapter, ChatStreamEvent, streaming_supported
-from ..middleware.registry import get_middleware_chain
+from ..middleware.registry import (
+    safe_run_after_chat,
+    safe_run_before_chat,
+    safe_run_before_stream,
+)
 from ..timeouts import get_timeout_config, operation_timeout
 from .style_helpers import (
+    build_openai_messages,
     extract_openai_text,
     prepare_response_format,
     extract_messages_and_format,
@@ -40,10 +45,10 @@ from .style_helpers import (
     build_stream_params,
     invoke_create,
 )
-from .structured import translate_openai_structured_chunk
-from ..utils.messages import extract_system_and_user
+from .structured_stream import StreamingStructuredTranslator
 from ...config import get_provider_config
-from ..capabilities import record_observation
+from ..capabilities import record_observation_once
+from .async_chat import _AsyncChatMixin
 from .client_protocol import _ChatCompletionsClient
 from .provider_init import _ProviderInit
 from .nonstream_helpers import (
@@ -52,8 +57,10 @@ from .nonstream_helpers import (
     build_nonstream_success_response,
 )
 
+_SDK_MISSING_ERROR = "openai SDK not installed"
+
 
-class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel, SupportsStreaming):
+class BaseOpenAIStyleProvider(_AsyncChatMixin, LLMProvider, SupportsJSONOutput, HasDefaultModel, SupportsStreaming):
     """Reusable base class for OpenAI-compatible providers.
 
     Subclasses must implement:
@@ -61,7 +68,8 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
     - ``_make_client()``: create and return an SDK client implementing
       :class:`_ChatCompletionsClient` semantics.
 
-    They may also override ``supports_streaming`` if SDK gating differs.
+    They may also override ``supports_streaming`` if SDK gating differs, and
+    ``_make_async_client()`` to enable native ``chat_async``/``stream_chat_async``.
     """
 
     def __init__(self, init: _ProviderInit) -> None:
@@ -76,6 +84,20 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         self._logger = get_logger(init.logger_name)
         self._sdk_sentinel = init.sdk_sentinel
         self._structured_streaming_supported = init.structured_streaming_supported
+        self._response_cache = init.response_cache
+        # Prerequisites are immutable after construction; evaluate them once so
+        # the per-request checks reduce to a single attribute read.
+        self._streaming_supported = streaming_supported(
+            self._sdk_sentinel,
+            require_api_key=True,
+            api_key_getter=lambda: self._api_key,
+        )
+        self._nonstream_prereq_error: Optional[str] = None
+        if self._sdk_sentinel is None:
+            self._nonstream_prereq_error = _SDK_MISSING_ERROR
+        elif not self._api_key:
+            self._nonstream_prereq_error = MISSING_API_KEY_ERROR
+        self._retry_settings: tuple[int, float] | None = None
 
     # ----- Abstract surface -----
     @property
@@ -100,25 +122,25 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         return True
 
     def supports_streaming(self) -> bool:
-        """Return True when the SDK is present and an API key is available."""
-        return streaming_supported(
-            self._sdk_sentinel,
-            require_api_key=True,
-            api_key_getter=lambda: self._api_key,
-        )
+        """Return True when the SDK is present and an API key is available.
+
+        The result is computed once in ``__init__`` because neither the SDK
+        sentinel nor the API key changes over the provider's lifetime.
+        """
+        return self._streaming_supported
 
     # ----- Chat -----
     def chat(self, request: ChatRequest) -> ChatResponse:
         """Perform a non-streaming chat completion using the provider SDK.
 
         This method delegates precondition checks and the actual invocation to
-        smaller helpers to minimize complexity while preserving behavior.
+        smaller helpers to minimize complexity while preserving behavior. When a
+        ``response_cache`` is configured, deterministic requests are served from it.
         """
         model = request.model or self._model
         ctx = LogContext(provider=self.provider_name, model=model)
         # Allow middleware to mutate the request before logging/validation
-        with suppress(Exception):
-            request = get_middleware_chain().run_before_chat(ctx, request)
+        request = safe_run_before_chat(ctx, request)
 
         self._log_chat_start(ctx, request)
 
@@ -126,10 +148,14 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         if pre is not None:
             return pre
 
-        resp = self._invoke_nonstream_chat(model=model, request=request, ctx=ctx)
-        with suppress(Exception):
-            resp = get_middleware_chain().run_after_chat(ctx, resp)
-        return resp
+        cache = self._response_cache
+        key = cache.key_for(model, request) if cache is not None else None
+        resp = cache.get(key) if key is not None else None
+        if resp is None:
+            resp = self._invoke_nonstream_chat(model=model, request=request, ctx=ctx)
+            if key is not None:
+                cache.put(key, resp)
+        return safe_run_after_chat(ctx, resp)
 
     # ----- Streaming -----
 
@@ -142,8 +168,7 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         model = request.model or self._model
         ctx = LogContext(provider=self.provider_name, model=model)
         # Allow middleware to mutate request prior to gating/logging
-        with suppress(Exception):
-            request = get_middleware_chain().run_before_stream(ctx, request)
+        request = safe_run_before_stream(ctx, request)
 
         failed = self._check_stream_prereqs(request)
         if failed is not None:
@@ -162,30 +187,45 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
             model=model,
             starter=starter,
             translator=self._translate_openai_delta,
-            structured_translator=translate_openai_structured_chunk,
+            structured_translator=StreamingStructuredTranslator(),
             retry_config_factory=lambda phase: self._build_retry_config(ctx, phase=phase),
             logger=self._logger,
         )
-        emitted_any = False
-        for ev in adapter.run():
-            if ev is not None and ev.delta and not emitted_any:
-                emitted_any = True
-                try:
-                    record_observation(self.provider_name, model, "streaming", True)
-                except Exception:
-                    ...
+        # Scan only until the first text delta (to record the streaming
+        # observation), then hand the rest of the stream through unchecked.
+        events = adapter.run()
+        for ev in events:
+            if ev.delta:
+                record_observation_once(self.provider_name, model, "streaming", True)
+                yield ev
+                yield from events
+                return
             yield ev
 
     # ----- helpers -----
 
-    def _build_retry_config(self, ctx: LogContext, phase: Optional[str] = None) -> RetryConfig:
-        retry_cfg_raw = {}
-        try:
-            retry_cfg_raw = get_provider_config(self.provider_name).get("retry", {}) or {}
-        except Exception:  # pragma: no cover - defensive
+    def _resolve_retry_settings(self) -> tuple[int, float]:
+        """Return ``(max_attempts, delay_base)`` from provider config, cached per instance.
+
+        ``get_provider_config`` merges defaults, files, env, and the key store,
+        so it is read once on first use rather than on every request.
+        """
+        settings = self._retry_settings
+        if settings is None:
             retry_cfg_raw = {}
-        max_attempts = int(retry_cfg_raw.get("max_attempts", 3))
-        delay_base = float(retry_cfg_raw.get("delay_base", 2.0))
+            try:
+                retry_cfg_raw = get_provider_config(self.provider_name).get("retry", {}) or {}
+            except Exception:  # pragma: no cover - defensive
+                retry_cfg_raw = {}
+            settings = (
+                int(retry_cfg_raw.get("max_attempts", 3)),
+                float(retry_cfg_raw.get("delay_base", 2.0)),
+            )
+            self._retry_settings = settings
+        return settings
+
+    def _build_retry_config(self, ctx: LogContext, phase: Optional[str] = None) -> RetryConfig:
+        max_attempts, delay_base = self._resolve_retry_settings()
 
         def _attempt_logger(*, attempt: int, max_attempts: int, delay, error: ProviderError | None):  # type: ignore[override]
             normalized_log_event(
@@ -225,8 +265,12 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
 
         Parameters:
             ctx: Context carrying provider and model metadata for logging.
-            request: Chat request parameters used for contextual fields.
+            request: Chat request parameters used for contextual fields. The
+                ``json_schema``/``tools`` presence flags are only evaluated
+                once the INFO guard passes.
         """
+        if not info_enabled(self._logger):
+            return
         normalized_log_event(
             self._logger,
             "chat.start",
@@ -245,46 +289,33 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         """Validate SDK presence and API key before non-stream invocation.
 
         Returns a ``ChatResponse`` with error details when a prerequisite fails;
-        otherwise returns ``None`` to proceed.
+        otherwise returns ``None`` to proceed. The failure reason is resolved
+        once at construction, so the success path is a single attribute check.
         """
-        if self._sdk_sentinel is None:
-            meta = ProviderMetadata(
-                provider_name=self.provider_name,
-                model_name=model,
-                extra={"error": "openai SDK not installed"},
-            )
-            return ChatResponse(text=None, parts=None, raw=None, meta=meta)
-        if not self._api_key:
-            meta = ProviderMetadata(
-                provider_name=self.provider_name,
-                model_name=model,
-                extra={"error": MISSING_API_KEY_ERROR},
-            )
-            return ChatResponse(text=None, parts=None, raw=None, meta=meta)
-        return None
+        error = self._nonstream_prereq_error
+        if error is None:
+            return None
+        meta = ProviderMetadata(
+            provider_name=self.provider_name,
+            model_name=model,
+            extra={"error": error},
+        )
+        return ChatResponse(text=None, parts=None, raw=None, meta=meta)
 
     def _invoke_nonstream_chat(self, *, model: str, request: ChatRequest, ctx: LogContext) -> ChatResponse:
         """Execute the chat completion call with retries, timeout, and logging.
 
         Delegates timeout/retry orchestration and response shaping to
         ``nonstream_helpers`` to reduce method length while preserving
-        behavior and logging semantics.
+        behavior and logging semantics. The innermost layer is the bound
+        :meth:`_invoke_chat_once`, so no per-request closures are created.
         """
         messages, response_format, is_structured = extract_messages_and_format(request)
-
-        def _invoke():
-            """Invoke the chat completion using the provider's client.
-
-            This function creates the client, builds the chat parameters, and calls the provider's chat creation method.
-            """
-            client = self._make_client()
-            params = build_chat_params(model, messages, request, response_format)
-            return invoke_create(client, params, model, self.provider_name)
-
         timeout_cfg = get_timeout_config()
         try:
             resp, latency_ms = run_nonstream_with_timeout_and_retry(
-                invoke_fn=_invoke,
+                invoke_fn=self._invoke_chat_once,
+                invoke_args=(model, messages, request, response_format),
                 ctx=ctx,
                 logger=self._logger,
                 retry_config_factory=lambda: self._build_retry_config(ctx, phase="start"),
@@ -307,11 +338,27 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
                 exc=e,
             )
 
+    def _invoke_chat_once(
+        self,
+        model: str,
+        messages: list[dict],
+        request: ChatRequest,
+        response_format: dict | None,
+    ):
+        """Perform a single non-streaming ``create`` call (one retry attempt)."""
+        client = self._make_client()
+        params = build_chat_params(model, messages, request, response_format)
+        return invoke_create(client, params, model, self.provider_name)
+
     # ----- extracted helpers (stream) -----
 
     def _check_stream_prereqs(self, request: ChatRequest) -> ChatStreamEvent | None:
         """Validate streaming prerequisites; return a terminal error event when failing.
 
+        Providers that support structured streaming return after two attribute
+        reads; request fields are only inspected when structured streaming is
+        unsupported and must be gated.
+
         Parameters:
             request: The streaming chat request.
 
@@ -319,29 +366,24 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
             A terminal ``ChatStreamEvent`` describing the failure, or ``None`` if ok.
         """
         if not self.supports_streaming():
-            return ChatStreamEvent(
-                provider=self.provider_name,
-                model=request.model,
-                delta=None,
-                finish=True,
-                error="openai SDK not installed",
-            )
-
-        if not self._structured_streaming_supported and (
-            request.response_format == "json_object" or request.json_schema or request.tools
-        ):
-            try:
-                record_observation(self.provider_name, request.model or self._model, "structured_streaming", False)
-            except Exception:
-                ...
-            return ChatStreamEvent(
-                provider=self.provider_name,
-                model=request.model,
-                delta=None,
-                finish=True,
-                error=STRUCTURED_STREAMING_UNSUPPORTED,
-            )
-        return None
+            return self._stream_prereq_failure(request, _SDK_MISSING_ERROR)
+        if self._structured_streaming_supported:
+            return None
+        needs_structured = bool(request.json_schema or request.tools) or request.response_format == "json_object"
+        if not needs_structured:
+            return None
+        record_observation_once(self.provider_name, request.model or self._model, "structured_streaming", False)
+        return self._stream_prereq_failure(request, STRUCTURED_STREAMING_UNSUPPORTED)
+
+    def _stream_prereq_failure(self, request: ChatRequest, error: str) -> ChatStreamEvent:
+        """Build the terminal event emitted when a streaming prerequisite fails."""
+        return ChatStreamEvent(
+            provider=self.provider_name,
+            model=request.model,
+            delta=None,
+            finish=True,
+            error=error,
+        )
 
     def _log_stream_start(self, ctx: LogContext, request: ChatRequest) -> None:
         """Emit a normalized start log for streaming chat.
@@ -350,6 +392,8 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
             ctx: Context with provider/model metadata.
             request: Chat request providing additional contextual fields.
         """
+        if not info_enabled(self._logger):
+            return
         normalized_log_event(
             self._logger,
             "stream.start",
@@ -364,13 +408,7 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
 
     def _build_stream_messages(self, request: ChatRequest) -> list[dict[str, str]]:
         """Construct a compact OpenAI-style message list from the request."""
-        system_message, user_content = extract_system_and_user(request.messages)
-        messages: list[dict[str, str]] = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        if user_content:
-            messages.append({"role": "user", "content": user_content})
-        return messages
+        return build_openai_messages(request)
 
     def _build_stream_starter(
         self,
@@ -384,44 +422,76 @@ class BaseOpenAIStyleProvider(LLMProvider, SupportsJSONOutput, HasDefaultModel,
         """Construct a starter callable for ``BaseStreamingAdapter``.
 
         The starter encapsulates retry classification and start-phase timeout.
+        It is a ``functools.partial`` over :meth:`_start_stream`, so no
+        closures or retry decorators are rebuilt per request.
         """
+        return functools.partial(self._start_stream, model, messages, request, response_format, ctx)
 
-        @retry(self._build_retry_config(ctx, phase="start"))
-        def _start():
-            try:
-                client = self._make_client()
-                params = build_stream_params(model, messages, request, response_format)
-                return client.chat.completions.create(**params)
-            except Exception as e:  # noqa: BLE001
-                if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
-                    raise
-                code = classify_exception(e)
-                raise ProviderError(
-                    code=code,
-                    message=str(e),
-                    provider=self.provider_name,
-                    model=model,
-                    retryable=code in (ErrorCode.TRANSIENT, ErrorCode.RATE_LIMIT, ErrorCode.TIMEOUT),
-                    raw=e,
-                )
-
+    def _start_stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        request: ChatRequest,
+        response_format: dict | None,
+        ctx: LogContext,
+    ):
+        """Open the SDK stream under the start-phase timeout and retry policy."""
         timeout_cfg = get_timeout_config()
+        with operation_timeout(timeout_cfg.start_timeout_seconds):
+            return retry_call(
+                self._build_retry_config(ctx, phase="start"),
+                self._create_stream,
+                model,
+                messages,
+                request,
+                response_format,
+            )
 
-        def _starter():
-            with operation_timeout(timeout_cfg.start_timeout_seconds):
-                return _start()
+    def _create_stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        request: ChatRequest,
+        response_format: dict | None,
+    ):
+        """Issue a single streaming ``create`` call, classifying failures.
 
-        return _starter
+        Client construction and the first-byte ``create`` call are bounded by
+        separate budgets (``init_timeout_seconds`` / ``first_token_timeout_seconds``)
+        so a cold client init is not charged against the first-token bound.
+        Timeouts propagate unchanged for the outer guard; other exceptions are
+        wrapped in ``ProviderError`` so the retry policy can inspect the code.
+        """
+        timeout_cfg = get_timeout_config()
+        try:
+            with operation_timeout(timeout_cfg.init_timeout_seconds):
+                client = self._make_client()
+                params = build_stream_params(model, messages, request, response_format)
+            with operation_timeout(timeout_cfg.first_token_timeout_seconds):
+                return client.chat.completions.create(**params)
+        except Exception as e:  # noqa: BLE001
+            if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
+                raise
+            code = classify_exception(e)
+            raise ProviderError(
+                code=code,
+                message=str(e),
+                provider=self.provider_name,
+                model=model,
+                retryable=code in (ErrorCode.TRANSIENT, ErrorCode.RATE_LIMIT, ErrorCode.TIMEOUT),
+                raw=e,
+            )
 
     @staticmethod
     def _translate_openai_delta(chunk) -> Optional[str]:  # noqa: ANN001
         """Translate a streaming chunk into a text delta if present.
 
-        Returns ``None`` when the chunk doesn't contain content.
+        Returns ``None`` when the chunk doesn't contain content. Only the
+        shape errors a malformed chunk can raise are caught.
         """
         try:
             return chunk.choices[0].delta.content  # type: ignore[attr-defined]
-        except Exception:
+        except (AttributeError, IndexError, TypeError):
             return None
 
 __all__ = ["BaseOpenAIStyleProvider"]
@@ -0,0 +1,85 @@
+"""Incremental structural scanner for streamed JSON tool-call arguments.
+
+Purpose:
+- Track bracket depth across streamed ``arguments`` fragments so a caller can
+  tell when a top-level JSON value is complete without re-parsing the
+  accumulated buffer on every delta. Each byte is scanned exactly once, so a
+  tool call of ``n`` characters costs O(n) in total instead of O(n^2).
+
+External dependencies:
+- None (standard library only). No I/O.
+
+Fallback semantics:
+- The scanner only tracks structure (objects, arrays, strings, escapes). It
+  does not validate tokens; callers still decode the completed buffer once
+  and handle ``ValueError`` there.
+
+Timeout strategy:
+- Not applicable; scanning is pure CPU work proportional to the fragment size.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+
+class IncrementalJsonScanner:
+    """Accumulate JSON text and detect when the top-level container closes.
+
+    Attributes:
+        complete: True once the outermost ``{...}``/``[...]`` has closed.
+    """
+
+    __slots__ = ("_parts", "_depth", "_in_string", "_escape", "_started", "complete")
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self.complete = False
+
+    def feed(self, fragment: str) -> bool:
+        """Consume ``fragment`` and return True when the top-level value is complete.
+
+        Only the new fragment is scanned; previously consumed text is never
+        revisited. Text fed after completion is buffered but not scanned.
+        """
+        self._parts.append(fragment)
+        if self.complete:
+            return True
+        depth = self._depth
+        in_string = self._in_string
+        escape = self._escape
+        started = self._started
+        for ch in fragment:
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+                started = True
+            elif ch in "}]":
+                depth -= 1
+                if started and depth == 0:
+                    self.complete = True
+                    break
+        self._depth = depth
+        self._in_string = in_string
+        self._escape = escape
+        self._started = started
+        return self.complete
+
+    def text(self) -> str:
+        """Return the accumulated text fed so far."""
+        return "".join(self._parts)
+
+
+__all__ = ["IncrementalJsonScanner"]
@@ -13,7 +13,8 @@ External Dependencies
 
 Fallback & Timeout Strategy
 ---------------------------
-- Start phase is wrapped using ``operation_timeout(get_timeout_config())``.
+- Start phase is wrapped using ``operation_timeout(get_timeout_config())``;
+  the async variant uses ``asyncio.wait_for`` with the same budget.
 - Timeout exceptions are surfaced to error shaper for uniform handling.
 
 Note
@@ -24,15 +25,16 @@ objects (``ctx``) and a logger instance to emit normalized logs.
 
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Callable, Tuple
+from typing import Any, Awaitable, Callable, Sequence, Tuple
 
 from ..errors import ErrorCode, ProviderError, classify_exception
-from ..logging import normalized_log_event
+from ..logging import info_enabled, normalized_log_event
 from ..models import ChatResponse, ContentPart, ProviderMetadata
-from ..resilience.retry import retry
+from ..resilience.retry import retry_call, retry_call_async
 from ..timeouts import operation_timeout
-from ..capabilities import record_observation
+from ..capabilities import record_observation_once
 
 
 def run_nonstream_with_timeout_and_retry(
@@ -42,13 +44,16 @@ def run_nonstream_with_timeout_and_retry(
     logger,
     retry_config_factory: Callable[[], Any],
     start_timeout_seconds: float,
+    invoke_args: Sequence[Any] = (),
 ) -> Tuple[Any, float]:
     """Invoke a non-streaming chat call under timeout + retry with logging.
 
     Parameters
     ----------
-    invoke_fn: Callable[[], Any]
-        Zero-argument callable that performs the underlying SDK call.
+    invoke_fn: Callable[..., Any]
+        Callable that performs the underlying SDK call. It is invoked as
+        ``invoke_fn(*invoke_args)`` so callers can pass a long-lived bound
+        method instead of building a closure per request.
     ctx: Any
         Log context carrying provider/model fields.
     logger: Any
@@ -57,6 +62,8 @@ def run_nonstream_with_timeout_and_retry(
         Callable returning a ``RetryConfig`` instance for the start phase.
     start_timeout_seconds: float
         Timeout in seconds for the start/first-byte phase.
+    invoke_args: Sequence[Any]
+        Positional arguments forwarded to ``invoke_fn`` on every attempt.
 
     Returns
     -------
@@ -75,8 +82,59 @@ def run_nonstream_with_timeout_and_retry(
     t0 = time.perf_counter()
     with operation_timeout(start_timeout_seconds):
         retry_cfg = retry_config_factory()
-        resp = retry(retry_cfg)(invoke_fn)()
+        resp = retry_call(retry_cfg, invoke_fn, *invoke_args)
     latency_ms = (time.perf_counter() - t0) * 1000.0
+    _log_chat_end(logger, ctx, latency_ms)
+    return resp, latency_ms
+
+
+async def run_nonstream_with_timeout_and_retry_async(
+    *,
+    invoke_fn: Callable[..., Awaitable[Any]],
+    ctx,
+    logger,
+    retry_config_factory: Callable[[], Any],
+    start_timeout_seconds: float,
+    invoke_args: Sequence[Any] = (),
+) -> Tuple[Any, float]:
+    """Await a non-streaming chat call under timeout + retry with logging.
+
+    Async counterpart of :func:`run_nonstream_with_timeout_and_retry`. The
+    start phase is bounded by ``asyncio.wait_for`` instead of
+    ``operation_timeout`` and backoff sleeps via ``asyncio.sleep``, so no
+    worker thread is needed.
+
+    Returns
+    -------
+    tuple[Any, float]
+        The raw SDK response and the measured latency in milliseconds.
+
+    Raises
+    ------
+    TimeoutError
+        When the start phase exceeds the configured timeout (normalized from
+        ``asyncio.TimeoutError`` on Python 3.10).
+    ProviderError
+        When the SDK call fails with a classified provider error.
+    """
+    t0 = time.perf_counter()
+    retry_cfg = retry_config_factory()
+    try:
+        resp = await asyncio.wait_for(
+            retry_call_async(retry_cfg, invoke_fn, *invoke_args),
+            timeout=start_timeout_seconds if start_timeout_seconds > 0 else None,
+        )
+    except asyncio.TimeoutError as e:
+        raise TimeoutError(f"operation exceeded {start_timeout_seconds}s") from e
+    latency_ms = (time.perf_counter() - t0) * 1000.0
+    _log_chat_end(logger, ctx, latency_ms)
+    return resp, latency_ms
+
+
+def _log_chat_end(logger, ctx, latency_ms: float) -> None:
+    """Emit the normalized ``chat.end`` event, skipping work when INFO is off."""
+    if not info_enabled(logger):
+        return
     normalized_log_event(
         logger,
         "chat.end",
@@ -88,7 +146,23 @@ def run_nonstream_with_timeout_and_retry(
         attempt=None,
         error_code=None,
     )
-    return resp, latency_ms
+
+
+def _log_chat_error(logger, ctx, message: str, error_code: str) -> None:
+    """Emit the normalized ``chat.error`` event, skipping work when INFO is off."""
+    if not info_enabled(logger):
+        return
+    normalized_log_event(
+        logger,
+        "chat.error",
+        ctx,
+        phase="finalize",
+        error=message,
+        error_code=error_code,
+        tokens=None,
+        emitted=None,
+        attempt=None,
+    )
 
 
 def nonstream_error_response(*, provider_name: str, model: str, ctx, logger, exc: Exception) -> ChatResponse:
@@ -116,62 +190,24 @@ def nonstream_error_response(*, provider_name: str, model: str, ctx, logger, exc
         A response carrying error details in metadata.
     """
     if isinstance(exc, TimeoutError):
-        normalized_log_event(
-            logger,
-            "chat.error",
-            ctx,
-            phase="finalize",
-            error=str(exc),
-            error_code=ErrorCode.TIMEOUT.value,
-            tokens=None,
-            emitted=None,
-            attempt=None,
-        )
-        meta = ProviderMetadata(
-            provider_name=provider_name,
-            model_name=model,
-            latency_ms=None,
-            extra={"error": str(exc), "code": ErrorCode.TIMEOUT.value, "phase": "start_timeout"},
-        )
-        return ChatResponse(text=None, parts=None, raw=None, meta=meta)
-
-    if isinstance(exc, ProviderError):
-        normalized_log_event(
-            logger,
-            "chat.error",
-            ctx,
-            phase="finalize",
-            error=str(exc),
-            error_code=exc.code.value,
-            tokens=None,
-            emitted=None,
-            attempt=None,
-        )
-        meta = ProviderMetadata(
-            provider_name=provider_name,
-            model_name=model,
-            latency_ms=None,
-            extra={"error": exc.message, "code": exc.code.value},
-        )
-        return ChatResponse(text=None, parts=None, raw=None, meta=meta)
-
-    code = classify_exception(exc)
-    normalized_log_event(
-        logger,
-        "chat.error",
-        ctx,
-        phase="finalize",
-        error=str(exc),
-        error_code=code.value,
-        tokens=None,
-        emitted=None,
-        attempt=None,
-    )
+        message = str(exc)
+        code = ErrorCode.TIMEOUT.value
+        extra = {"error": message, "code": code, "phase": "start_timeout"}
+        log_message = message
+    elif isinstance(exc, ProviderError):
+        code = exc.code.value
+        extra = {"error": exc.message, "code": code}
+        log_message = str(exc)
+    else:
+        log_message = str(exc)
+        code = classify_exception(exc).value
+        extra = {"error": log_message, "code": code}
+    _log_chat_error(logger, ctx, log_message, code)
     meta = ProviderMetadata(
         provider_name=provider_name,
         model_name=model,
         latency_ms=None,
-        extra={"error": str(exc), "code": code.value},
+        extra=extra,
     )
     return ChatResponse(text=None, parts=None, raw=None, meta=meta)
 
@@ -215,17 +251,15 @@ def build_nonstream_success_response(
         token_param_used="max_tokens",  # nosec B106 - benign generation parameter
         extra={"is_structured": is_structured},
     )
-    try:
-        if is_structured:
-            record_observation(provider_name, model, "json_output", True)
-    except Exception:  # pragma: no cover - observation is best-effort
-        ...
+    if is_structured:
+        record_observation_once(provider_name, model, "json_output", True)
     parts = [ContentPart(type="text", text=text)] if text else None
     return ChatResponse(text=(text or None), parts=parts, raw=None, meta=meta)
 
 
 __all__ = [
     "run_nonstream_with_timeout_and_retry",
+    "run_nonstream_with_timeout_and_retry_async",
     "nonstream_error_response",
     "build_nonstream_success_response",
 ]
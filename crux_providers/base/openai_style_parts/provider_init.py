@@ -23,6 +23,8 @@ class _ProviderInit:
         logger_name: Structured logger name (e.g., ``providers.deepseek``).
         sdk_sentinel: Module/class used to detect SDK availability for streaming.
         structured_streaming_supported: Whether JSON/tools streaming is supported.
+        response_cache: Optional ``ResponseCache`` consulted by ``chat()`` for
+            deterministic requests; ``None`` disables response caching.
     """
 
     api_key: Optional[str]
@@ -31,6 +33,7 @@ class _ProviderInit:
     logger_name: str
     sdk_sentinel: Any | None
     structured_streaming_supported: bool = False
+    response_cache: Any | None = None
 
 
 __all__ = ["_ProviderInit"]
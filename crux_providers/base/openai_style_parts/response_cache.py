@@ -0,0 +1,102 @@
+"""Opt-in response cache for deterministic OpenAI-style chat requests.
+
+Purpose:
+- Short-circuit ``chat()`` when an identical deterministic request (no
+  sampling temperature, no tools, no JSON schema) was answered recently, so
+  repeated prompts skip the SDK round trip entirely.
+
+External dependencies:
+- Standard library only (``hashlib.blake2b`` for keys, ``OrderedDict`` for
+  LRU ordering). No network or disk I/O.
+
+Fallback semantics:
+- Requests that are not cacheable bypass the cache transparently.
+- Error responses (``meta.extra["error"]``) are never stored.
+- Hits return a copy with ``latency_ms=0.0`` and ``extra["cache_hit"] = True``;
+  the stored entry itself is never handed out, so callers and middleware may
+  mutate the returned response freely.
+
+Timeout strategy:
+- Not applicable; all operations are in-memory and O(1).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Optional
+
+from ..models import ChatRequest, ChatResponse
+from .style_helpers import build_openai_messages
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of ``ChatResponse`` objects keyed by request digest.
+
+    Parameters:
+        maxsize: Maximum number of entries kept; the least recently used entry
+            is evicted first.
+        ttl_seconds: Entry lifetime in seconds; expired entries are dropped on
+            lookup.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 300.0) -> None:
+        self._maxsize = max(1, int(maxsize))
+        self._ttl = float(ttl_seconds)
+        self._entries: OrderedDict[bytes, tuple[float, ChatResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(model: str, request: ChatRequest) -> Optional[bytes]:
+        """Return the cache key for ``request``, or ``None`` when it is not cacheable.
+
+        Only deterministic requests qualify: ``temperature`` unset or zero and
+        neither ``tools`` nor ``json_schema`` present. The key covers every
+        input that shapes the completion (model, messages, response format,
+        ``max_tokens`` and ``extra``).
+        """
+        if request.temperature not in (None, 0, 0.0) or request.tools or request.json_schema:
+            return None
+        payload = json.dumps(
+            [model, build_openai_messages(request), request.response_format, request.max_tokens, request.extra],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[ChatResponse]:
+        """Return a marked copy of the cached response for ``key``, if fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, resp = entry
+            if time.monotonic() - stored_at >= self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        meta = replace(resp.meta, latency_ms=0.0, extra={**resp.meta.extra, "cache_hit": True})
+        return replace(resp, meta=meta)
+
+    def put(self, key: bytes, resp: ChatResponse) -> None:
+        """Store a snapshot of a successful ``resp`` under ``key``."""
+        if "error" in resp.meta.extra:
+            return
+        snapshot = replace(resp, meta=replace(resp.meta, extra=dict(resp.meta.extra)))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["ResponseCache"]
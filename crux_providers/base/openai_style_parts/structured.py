@@ -8,15 +8,85 @@ Pure, side-effect-free translator that extracts OpenAI Chat Completions
 - Returns metadata with name-only when only the function name is available
 - Returns None when the chunk carries no relevant tool/function payload
 
+The function is stateless: each chunk is interpreted on its own. Streams whose
+arguments arrive split across deltas should use
+``StreamingStructuredTranslator`` to assemble the final call.
+
+JSON is decoded with ``loads_json`` (``orjson`` when installed, else stdlib).
 This module has no provider SDK dependencies and performs no I/O.
 """
 
 from __future__ import annotations
 
-import json
-from typing import Any, Mapping
+from typing import Any, Mapping, Optional, Tuple
 from ..dto.structured_output import StructuredOutputDTO  # type: ignore
 from ..dto.function_call import FunctionCallDTO  # type: ignore
+from ..utils.json_fast import loads_json
+
+
+def _as_text(fragment: str | bytes) -> str:
+    """Return ``fragment`` as ``str``, decoding UTF-8 bytes."""
+    return fragment.decode("utf-8") if isinstance(fragment, bytes) else fragment
+
+
+def _may_be_object(fragment: str | bytes) -> bool:
+    """Return False when ``fragment`` cannot be a complete JSON object.
+
+    O(1) endpoint check (after trimming whitespace): only text that starts
+    with ``{`` and ends with ``}`` is worth handing to the decoder. Streamed
+    partials almost never pass, which skips a raise/catch per delta. A
+    Python-level bracket count is deliberately avoided; it would cost more
+    than the C decoder's own failure.
+    """
+    text = fragment.strip()
+    if isinstance(text, bytes):
+        return text[:1] == b"{" and text[-1:] == b"}"
+    return text[:1] == "{" and text[-1:] == "}"
+
+
+def first_tool_call_function(chunk: Any) -> Optional[Tuple[Any, Any]]:
+    """Return ``(tool_call, function)`` for ``choices[0].delta.tool_calls[0]``.
+
+    Returns ``None`` when any hop of the chain is missing or empty. The walk
+    up to ``tool_calls`` is a direct attribute/subscript chain: SDK chunks
+    always carry ``choices[0].delta.tool_calls`` (``None`` on text deltas), so
+    the common case raises nothing and pays no per-hop ``getattr`` defaults.
+    """
+    if type(chunk) is dict:
+        return _first_tool_call_function_dict(chunk)
+    try:
+        tool_calls = chunk.choices[0].delta.tool_calls
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return None
+    if not tool_calls:
+        return None
+    first = tool_calls[0]
+    fn = getattr(first, "function", None)
+    if fn is None:
+        return None
+    return first, fn
+
+
+def _first_tool_call_function_dict(chunk: dict) -> Optional[Tuple[Any, Any]]:
+    """Dict-chunk variant of :func:`first_tool_call_function` (decoded JSON lines).
+
+    Uses subscripts throughout; a missing key or wrong type is the miss signal.
+    """
+    try:
+        first = chunk["choices"][0]["delta"]["tool_calls"][0]
+        fn = first["function"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    if fn is None:
+        return None
+    return first, fn
+
+
+def function_fields(fn: Any) -> Tuple[Any, Any]:
+    """Return ``(name, arguments)`` from an SDK object or a decoded dict."""
+    if type(fn) is dict:
+        return fn.get("name"), fn.get("arguments")
+    return getattr(fn, "name", None), getattr(fn, "arguments", None)
 
 
 def translate_openai_structured_chunk(chunk: Any):  # -> Optional[StructuredOutputDTO]
@@ -27,7 +97,8 @@ def translate_openai_structured_chunk(chunk: Any):  # -> Optional[StructuredOutp
     chunk: Any
         Object exposing an OpenAI-style shape with
         ``choices[0].delta.tool_calls[0].function`` (``name`` and ``arguments``).
-        Attribute access is attempted first; dict-like access is tolerated.
+        SDK objects are read via attributes; plain ``dict`` chunks (decoded
+        JSON) take a subscript fast path.
 
     Returns
     -------
@@ -36,71 +107,68 @@ def translate_openai_structured_chunk(chunk: Any):  # -> Optional[StructuredOutp
     """
     try:
         # Translator body; be resilient to shape mismatches
-
-        choices = getattr(chunk, "choices", None)
-        if not choices:
-            return None
-        choice0 = choices[0]
-        delta = getattr(choice0, "delta", None)
-        if delta is None:
-            return None
-        tool_calls = getattr(delta, "tool_calls", None)
-        if not tool_calls:
-            return None
-        first = tool_calls[0]
-        fn = getattr(first, "function", None)
-        if fn is None:
+        found = first_tool_call_function(chunk)
+        if found is None:
             return None
+        return translate_function_payload(found[1])
+    except Exception:  # pragma: no cover - translator must be resilient
+        return None
 
-        name = getattr(fn, "name", None)
-        args_fragment = getattr(fn, "arguments", None)
 
-        # Mapping arguments → finalized function call
-        if isinstance(args_fragment, Mapping):
-            return StructuredOutputDTO(
-                function_call=FunctionCallDTO(
-                    name=str(name) if name else "",
-                    arguments=dict(args_fragment),
-                ),
-                metadata={"function_name": str(name)} if name else {},
-            )
+def translate_function_payload(fn: Any) -> Optional[StructuredOutputDTO]:
+    """Translate an already-located ``tool_calls[i].function`` object.
 
-        # String/bytes arguments → parse JSON or emit partial
-        if isinstance(args_fragment, (str, bytes)):
-            arg_text = (
-                args_fragment.decode("utf-8")
-                if isinstance(args_fragment, bytes)
-                else args_fragment
-            )
-            if name:
+    Shared by the stateless and per-stream translators so the chunk walk in
+    :func:`first_tool_call_function` runs once per chunk. Validation errors
+    propagate; callers own the resilience guard.
+    """
+    raw_name, args_fragment = function_fields(fn)
+    # Normalize the name once; reused by every DTO built below.
+    name = str(raw_name) if raw_name else ""
+
+    # Mapping arguments → finalized function call. Pydantic validation of
+    # ``FunctionCallDTO.arguments`` already builds a fresh dict, so the
+    # mapping is passed through without a second pre-copy.
+    if isinstance(args_fragment, Mapping):
+        return StructuredOutputDTO(
+            function_call=FunctionCallDTO(
+                name=name,
+                arguments=args_fragment,
+            ),
+            metadata={"function_name": name} if name else {},
+        )
+
+    # String/bytes arguments → parse JSON or emit partial. Bytes are
+    # handed to the decoder as-is and only decoded for the partial text.
+    if isinstance(args_fragment, (str, bytes)):
+        if name:
+            parsed = None
+            if _may_be_object(args_fragment):
                 try:
-                    parsed = json.loads(arg_text)
+                    parsed = loads_json(args_fragment)
                 except Exception:
-                    return StructuredOutputDTO(
-                        partial=str(arg_text),
-                        metadata={"function_name": str(name)},
-                    )
-                else:
-                    if isinstance(parsed, dict):
-                        return StructuredOutputDTO(
-                            function_call=FunctionCallDTO(
-                                name=str(name), arguments=parsed
-                            ),
-                            metadata={"function_name": str(name)},
-                        )
-                    return StructuredOutputDTO(
-                        partial=str(arg_text),
-                        metadata={"function_name": str(name)},
-                    )
-            return StructuredOutputDTO(partial=str(arg_text))
-
-        # Name-only without arguments
-        if name:
-            return StructuredOutputDTO(metadata={"function_name": str(name)})
+                    parsed = None
+            if isinstance(parsed, dict):
+                return StructuredOutputDTO(
+                    function_call=FunctionCallDTO(name=name, arguments=parsed),
+                    metadata={"function_name": name},
+                )
+            return StructuredOutputDTO(
+                partial=_as_text(args_fragment),
+                metadata={"function_name": name},
+            )
+        return StructuredOutputDTO(partial=_as_text(args_fragment))
 
-        return None
-    except Exception:  # pragma: no cover - translator must be resilient
-        return None
+    # Name-only without arguments
+    if name:
+        return StructuredOutputDTO(metadata={"function_name": name})
+
+    return None
 
 
-__all__ = ["translate_openai_structured_chunk"]
+__all__ = [
+    "first_tool_call_function",
+    "function_fields",
+    "translate_function_payload",
+    "translate_openai_structured_chunk",
+]
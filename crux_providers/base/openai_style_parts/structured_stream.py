@@ -0,0 +1,180 @@
+"""Per-stream structured translator that assembles split tool-call arguments.
+
+Purpose:
+- OpenAI-style streams deliver ``tool_calls[i].function.arguments`` as small
+  text fragments spread across many deltas. This translator keeps one
+  ``IncrementalJsonScanner`` per tool-call index, scans each fragment once,
+  and decodes the arguments with ``loads_json`` a single time when the
+  arguments object closes.
+- ``translate_openai_structured_chunks`` handles buffered or replayed batches
+  and emits one DTO per tool call rather than one per delta.
+
+External dependencies:
+- None beyond the structured DTOs; no I/O and no SDK imports.
+
+Fallback semantics:
+- Mapping (and other non-string) arguments are delegated to the stateless
+  ``translate_function_payload`` with the already-located function object.
+- Intermediate fragments are surfaced as ``partial`` DTOs (as before); the
+  completing fragment yields a ``function_call`` DTO when the assembled text
+  parses to an object and the function name is known, otherwise a partial.
+
+Timeout strategy:
+- Not applicable; translation is pure CPU work bounded by chunk size.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from ..dto.function_call import FunctionCallDTO
+from ..dto.structured_output import StructuredOutputDTO
+from ..utils.json_fast import loads_json
+from .incremental_json import IncrementalJsonScanner
+from .structured import first_tool_call_function, function_fields, translate_function_payload
+
+
+class _ToolCallState:
+    """Accumulated name and argument scanner for one streamed tool call."""
+
+    __slots__ = ("name", "meta", "scanner")
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        # Metadata payload built once per name rather than per fragment.
+        # DTO validation copies it, so emitted events never share it.
+        self.meta: Dict[str, str] = {}
+        self.scanner = IncrementalJsonScanner()
+
+    def set_name(self, name: str) -> None:
+        """Record the function name and rebuild the metadata payload if it changed."""
+        if name != self.name:
+            self.name = name
+            self.meta = {"function_name": name}
+
+
+class StreamingStructuredTranslator:
+    """Stateful ``structured_translator`` for a single streaming response.
+
+    Create one instance per stream and pass it as the adapter's
+    ``structured_translator``; state is discarded together with the stream.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Any, _ToolCallState] = {}
+
+    def __call__(self, chunk: Any) -> Optional[StructuredOutputDTO]:
+        """Translate ``chunk``, assembling split arguments across calls."""
+        try:
+            found = first_tool_call_function(chunk)
+            if found is None:
+                return None
+            tool_call, fn = found
+            name, args_fragment = function_fields(fn)
+            if not isinstance(args_fragment, (str, bytes)) and args_fragment is not None:
+                return translate_function_payload(fn)
+
+            key = _call_key(tool_call)
+            state = self._calls.get(key)
+            if state is None:
+                state = self._calls[key] = _ToolCallState()
+            if name:
+                state.set_name(str(name))
+            if args_fragment is None:
+                return StructuredOutputDTO(metadata=state.meta) if name else None
+
+            text = args_fragment.decode("utf-8") if isinstance(args_fragment, bytes) else args_fragment
+            if not state.scanner.feed(text):
+                return StructuredOutputDTO(partial=text, metadata=state.meta)
+            del self._calls[key]
+            return _finalize(state, text)
+        except Exception:  # pragma: no cover - translator must be resilient
+            return None
+
+
+def _finalize(state: _ToolCallState, text: str) -> StructuredOutputDTO:
+    """Parse the completed argument buffer once and build the terminal DTO."""
+    if state.name:
+        try:
+            parsed = loads_json(state.scanner.text())
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return StructuredOutputDTO(
+                function_call=FunctionCallDTO(name=state.name, arguments=parsed),
+                metadata=state.meta,
+            )
+    return StructuredOutputDTO(partial=text, metadata=state.meta)
+
+
+def translate_openai_structured_chunks(chunks: Iterable[Any]) -> Iterator[StructuredOutputDTO]:
+    """Translate a batch of chunks, emitting one DTO per tool call instead of per delta.
+
+    Fragments of the same tool call (by index) are scanned as they arrive and
+    decoded once when the arguments object closes, yielding the final
+    ``function_call`` DTO. Calls still open when ``chunks`` is exhausted are
+    flushed as a single ``partial`` DTO carrying the concatenated text. Use
+    this for buffered or replayed streams; live streaming keeps the
+    per-event :class:`StreamingStructuredTranslator`.
+
+    Like the per-event translator, a chunk that fails to translate (e.g. DTO
+    validation errors) is dropped rather than raised, and ``None`` is never
+    yielded.
+    """
+    calls: Dict[Any, _ToolCallState] = {}
+    for chunk in chunks:
+        dto = _translate_batch_chunk(calls, chunk)
+        if dto is not None:
+            yield dto
+    for state in calls.values():
+        dto = _flush_open_call(state)
+        if dto is not None:
+            yield dto
+
+
+def _translate_batch_chunk(calls: Dict[Any, _ToolCallState], chunk: Any) -> Optional[StructuredOutputDTO]:
+    """Feed one chunk into ``calls``; return a DTO when a call completes."""
+    try:
+        found = first_tool_call_function(chunk)
+        if found is None:
+            return None
+        tool_call, fn = found
+        name, args_fragment = function_fields(fn)
+        if not isinstance(args_fragment, (str, bytes)):
+            if args_fragment is not None:
+                return translate_function_payload(fn)
+            if name:
+                calls.setdefault(_call_key(tool_call), _ToolCallState()).set_name(str(name))
+            return None
+        key = _call_key(tool_call)
+        state = calls.get(key)
+        if state is None:
+            state = calls[key] = _ToolCallState()
+        if name:
+            state.set_name(str(name))
+        text = args_fragment.decode("utf-8") if isinstance(args_fragment, bytes) else args_fragment
+        if not state.scanner.feed(text):
+            return None
+        del calls[key]
+        return _finalize(state, state.scanner.text())
+    except Exception:  # pragma: no cover - translator must be resilient
+        return None
+
+
+def _flush_open_call(state: _ToolCallState) -> Optional[StructuredOutputDTO]:
+    """Return the DTO for a call still open at the end of the batch, if any."""
+    try:
+        buffered = state.scanner.text()
+        if buffered:
+            return StructuredOutputDTO(partial=buffered, metadata=state.meta)
+        return StructuredOutputDTO(metadata=state.meta) if state.name else None
+    except Exception:  # pragma: no cover - translator must be resilient
+        return None
+
+
+def _call_key(tool_call: Any) -> Any:
+    """Return the tool-call index used to group fragments (``None`` if absent)."""
+    return tool_call.get("index") if type(tool_call) is dict else getattr(tool_call, "index", None)
+
+
+__all__ = ["StreamingStructuredTranslator", "translate_openai_structured_chunks"]
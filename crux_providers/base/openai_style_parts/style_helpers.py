@@ -36,8 +36,10 @@ def extract_openai_text(resp: _t.Any) -> str:
     """Extract assistant text from an OpenAI-style non-streaming response.
 
     The function uses a narrow attribute access pattern to avoid brittle
-    introspection. If the expected attributes are missing, an empty string is
-    returned.
+    introspection. Missing hops are detected with explicit ``None``/emptiness
+    checks rather than exception handling, so empty or non-standard responses
+    return an empty string without raising internally. A present-but-``None``
+    ``content`` (tool-call-only replies) is returned unchanged.
 
     Parameters:
         resp: The raw SDK response object returned by the chat completions API.
@@ -45,10 +47,43 @@ def extract_openai_text(resp: _t.Any) -> str:
     Returns:
         The assistant message content as a string, or an empty string if not found.
     """
+    choices = getattr(resp, "choices", None)
+    if not choices:
+        return ""
     try:
-        return resp.choices[0].message.content  # type: ignore[attr-defined,index]
-    except Exception:
+        first = choices[0]
+    except (IndexError, KeyError, TypeError):
+        return ""
+    message = getattr(first, "message", None)
+    if message is None:
         return ""
+    return getattr(message, "content", "")
+
+
+def build_openai_messages(request: ChatRequest) -> list[dict]:
+    """Build the compact OpenAI-style ``messages`` payload for a request.
+
+    Collapses the normalized message list into at most one ``system`` and one
+    ``user`` message. The list is built as a single literal for the common
+    shapes instead of growing it with ``append``.
+
+    Parameters:
+        request: The chat request containing our normalized message list.
+
+    Returns:
+        A list of ``{"role": ..., "content": ...}`` dicts (possibly empty).
+    """
+    system_message, user_content = extract_system_and_user(request.messages)
+    if system_message:
+        if user_content:
+            return [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": user_content},
+            ]
+        return [{"role": "system", "content": system_message}]
+    if user_content:
+        return [{"role": "user", "content": user_content}]
+    return []
 
 
 def prepare_response_format(request: ChatRequest) -> tuple[dict | None, bool]:
@@ -86,23 +121,10 @@ def extract_messages_and_format(request: ChatRequest) -> tuple[list[dict], dict
         ``response_format`` is the translated parameter (or ``None``), and
         ``is_structured`` indicates a structured response was requested.
     """
-    system_message, user_content = extract_system_and_user(request.messages)
-    messages: list[dict] = []
-    if system_message:
-        messages.append({"role": "system", "content": system_message})
-    if user_content:
-        messages.append({"role": "user", "content": user_content})
-    is_structured = request.response_format == "json_object"
-    if request.json_schema:
-        response_format: dict | None = {
-            "type": "json_schema",
-            "json_schema": request.json_schema,
-        }
-    elif is_structured:
-        response_format = {"type": "json_object"}
-    else:
-        response_format = None
-    return messages, response_format, is_structured
+    response_format, _ = prepare_response_format(request)
+    # Non-stream contract: only ``json_object`` marks the output as structured
+    # (a ``json_schema`` request still yields ``is_structured=False`` here).
+    return build_openai_messages(request), response_format, request.response_format == "json_object"
 
 
 def build_chat_params(
@@ -122,15 +144,19 @@ def build_chat_params(
     Returns:
         A dict suitable for ``client.chat.completions.create(**params)``.
     """
+    # Read each request attribute once into a local.
+    max_tokens = request.max_tokens
+    temperature = request.temperature
+    tools = request.tools
     params: dict = {"model": model, "messages": messages}
-    if request.max_tokens is not None:
-        params["max_tokens"] = int(request.max_tokens)
-    if request.temperature is not None:
-        params["temperature"] = float(request.temperature)
+    if max_tokens is not None:
+        params["max_tokens"] = int(max_tokens)
+    if temperature is not None:
+        params["temperature"] = float(temperature)
     if response_format:
         params["response_format"] = response_format
-    if request.tools:
-        params["tools"] = request.tools
+    if tools:
+        params["tools"] = tools
     return params
 
 
@@ -189,13 +215,46 @@ def invoke_create(client: _t.Any, params: dict, model: str, provider_name: str)
         # Allow timeout exceptions to bubble up to the outer timeout guard
         if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
             raise
-        code = classify_exception(e)
-        raise ProviderError(
-            code=code,
-            message=str(e),
-            provider=provider_name,
-            model=model,
-            retryable=code
-            in (ErrorCode.TRANSIENT, ErrorCode.RATE_LIMIT, ErrorCode.TIMEOUT),
-            raw=e,
-        ) from e
+        raise _wrap_sdk_error(e, model, provider_name) from e
+
+
+async def ainvoke_create(client: _t.Any, params: dict, model: str, provider_name: str) -> _t.Any:
+    """Await ``chat.completions.create`` on an async SDK client.
+
+    Async counterpart of :func:`invoke_create` for clients such as
+    ``openai.AsyncOpenAI``; error classification is identical.
+
+    Parameters:
+        client: Async SDK client whose ``chat.completions.create`` is awaitable.
+        params: The parameters dict for the API call.
+        model: The target model name (used for error context).
+        provider_name: The canonical provider identifier for error context.
+
+    Returns:
+        The raw SDK response (or async stream when ``stream=True``).
+
+    Raises:
+        TimeoutError: Re-raised to be handled by upstream timeout guards.
+        ProviderError: For non-timeout failures, with ``retryable`` set based on
+            the classified ``ErrorCode``.
+    """
+    try:
+        return await client.chat.completions.create(**params)
+    except Exception as e:  # noqa: BLE001
+        if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
+            raise
+        raise _wrap_sdk_error(e, model, provider_name) from e
+
+
+def _wrap_sdk_error(exc: Exception, model: str, provider_name: str) -> ProviderError:
+    """Classify an SDK exception into a ``ProviderError`` with retry hints."""
+    code = classify_exception(exc)
+    return ProviderError(
+        code=code,
+        message=str(exc),
+        provider=provider_name,
+        model=model,
+        retryable=code
+        in (ErrorCode.TRANSIENT, ErrorCode.RATE_LIMIT, ErrorCode.TIMEOUT),
+        raw=exc,
+    )
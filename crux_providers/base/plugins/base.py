@@ -6,10 +6,10 @@ Defines the core plugin interface and metadata structure for extensibility.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginMetadata:
     """Metadata describing a plugin.
 
@@ -18,7 +18,8 @@ class PluginMetadata:
         version: Plugin version string.
         author: Plugin author/maintainer.
         description: Human-readable plugin description.
-        capabilities: List of capability identifiers this plugin provides.
+        capabilities: Capability identifiers this plugin provides (immutable tuple;
+            only iterated and membership-tested).
         dependencies: List of plugin names this plugin depends on.
         config: Plugin-specific configuration dictionary.
     """
@@ -27,7 +28,7 @@ class PluginMetadata:
     version: str
     author: str = ""
     description: str = ""
-    capabilities: List[str] = field(default_factory=list)
+    capabilities: Tuple[str, ...] = ()
     dependencies: List[str] = field(default_factory=list)
     config: Dict[str, Any] = field(default_factory=dict)
 
@@ -9,6 +9,9 @@ from typing import Any, Dict, Optional
 
 from .base import Plugin, PluginMetadata
 
+# Description prefix shared by every MCP plugin; hoisted out of ``__init__``.
+_MCP_DESCRIPTION_PREFIX = "MCP plugin: "
+
 
 class MCPPlugin:
     """Base implementation for MCP-compatible plugins.
@@ -38,9 +41,9 @@ class MCPPlugin:
         self._metadata = PluginMetadata(
             name=name,
             version=version,
-            capabilities=capabilities or ["mcp"],
+            capabilities=tuple(capabilities) if capabilities else ("mcp",),
             author="",
-            description=f"MCP plugin: {name}",
+            description=_MCP_DESCRIPTION_PREFIX + name,
         )
         self._initialized = False
         self._config: Dict[str, Any] = {}
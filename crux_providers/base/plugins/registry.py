@@ -1,15 +1,17 @@
 """Plugin registry for managing and discovering plugins.
 
 Provides centralized plugin lifecycle management, dependency resolution,
-and capability queries.
+and capability queries. Success-path INFO logs are skipped (including
+building their ``extra`` payloads) when INFO is disabled; error messages are
+formatted only on the paths that raise.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, FrozenSet, List, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
 
 from .base import Plugin, PluginMetadata
-from ..logging import get_logger
+from ..logging import get_logger, info_enabled
 
 
 class PluginRegistry:
@@ -30,6 +32,13 @@ class PluginRegistry:
         """Initialize an empty plugin registry."""
         self.plugins: Dict[str, Plugin] = {}
         self._initialized: Set[str] = set()
+        # Capability -> registered plugins providing it (registration order),
+        # and each plugin's capability snapshot taken at registration.
+        # Maintained on register/unregister so reads never scan all plugins.
+        self._by_capability: Dict[str, List[Plugin]] = {}
+        self._plugin_caps: Dict[str, FrozenSet[str]] = {}
+        # Lazily rebuilt snapshot returned by get_capabilities; reset on change.
+        self._capabilities_frozen: Optional[FrozenSet[str]] = None
         self.logger = get_logger("plugin_registry")
 
     def register(
@@ -53,8 +62,7 @@ class PluginRegistry:
             raise ValueError(f"Plugin '{meta.name}' already registered")
 
         # Check dependencies
-        missing = self._check_dependencies(meta.dependencies)
-        if missing:
+        if missing := self._check_dependencies(meta.dependencies):
             raise ValueError(
                 f"Plugin '{meta.name}' missing dependencies: {missing}"
             )
@@ -66,14 +74,16 @@ class PluginRegistry:
         try:
             plugin.initialize(config)
             self._initialized.add(meta.name)
-            self.logger.info(
-                "Plugin registered",
-                extra={
-                    "plugin": meta.name,
-                    "version": meta.version,
-                    "capabilities": meta.capabilities,
-                },
-            )
+            if info_enabled(self.logger):
+                self.logger.info(
+                    "Plugin registered",
+                    extra={
+                        "plugin": meta.name,
+                        "version": meta.version,
+                        "capabilities": meta.capabilities,
+                    },
+                )
+            self._index_capabilities(plugin, meta.name, meta.capabilities)
         except Exception as e:
             # Rollback registration on initialization failure
             del self.plugins[meta.name]
@@ -111,8 +121,10 @@ class PluginRegistry:
         # Remove from registry
         del self.plugins[name]
         self._initialized.discard(name)
+        self._unindex_capabilities(plugin, name)
         
-        self.logger.info("Plugin unregistered", extra={"plugin": name})
+        if info_enabled(self.logger):
+            self.logger.info("Plugin unregistered", extra={"plugin": name})
 
     def get(self, name: str) -> Optional[Plugin]:
         """Get a plugin by name.
@@ -136,28 +148,30 @@ class PluginRegistry:
     def find_by_capability(self, capability: str) -> List[Plugin]:
         """Find all plugins providing a specific capability.
 
+        Served from the capability index built from each plugin's
+        ``metadata.capabilities`` at registration time.
+
         Args:
             capability: Capability identifier.
 
         Returns:
             List of plugins providing the capability.
         """
-        return [
-            plugin
-            for plugin in self.plugins.values()
-            if plugin.provides_capability(capability)
-        ]
+        return list(self._by_capability.get(capability, ()))
 
     def get_capabilities(self) -> FrozenSet[str]:
         """Get all capabilities provided by registered plugins.
 
+        The frozenset is built once per registry change and the same
+        immutable instance is returned until the next register/unregister.
+
         Returns:
             Set of capability identifiers.
         """
-        caps: Set[str] = set()
-        for plugin in self.plugins.values():
-            caps.update(plugin.metadata.capabilities)
-        return frozenset(caps)
+        caps = self._capabilities_frozen
+        if caps is None:
+            caps = self._capabilities_frozen = frozenset(self._by_capability)
+        return caps
 
     def shutdown_all(self) -> None:
         """Shutdown all plugins and clear registry."""
@@ -170,6 +184,27 @@ class PluginRegistry:
                     extra={"plugin": name, "error": str(e)},
                 )
 
+    def _index_capabilities(self, plugin: Plugin, name: str, capabilities: Iterable[str]) -> None:
+        """Add ``plugin`` to the index under each of its capabilities."""
+        caps = frozenset(capabilities)
+        self._plugin_caps[name] = caps
+        self._capabilities_frozen = None
+        by_cap = self._by_capability
+        for cap in caps:
+            by_cap.setdefault(cap, []).append(plugin)
+
+    def _unindex_capabilities(self, plugin: Plugin, name: str) -> None:
+        """Remove ``name`` from the index, dropping capabilities left empty."""
+        by_cap = self._by_capability
+        self._capabilities_frozen = None
+        for cap in self._plugin_caps.pop(name, ()):
+            providers = by_cap.get(cap)
+            if providers is None:
+                continue
+            providers[:] = [p for p in providers if p is not plugin]
+            if not providers:
+                del by_cap[cap]
+
     def _check_dependencies(self, dependencies: List[str]) -> List[str]:
         """Check if dependencies are satisfied.
 
@@ -177,9 +212,15 @@ class PluginRegistry:
             dependencies: List of required plugin names.
 
         Returns:
-            List of missing dependencies.
+            List of missing dependencies (empty when all are registered).
         """
-        return [dep for dep in dependencies if dep not in self.plugins]
+        plugins = self.plugins
+        # Plain loop: no comprehension/generator frame on the common
+        # all-satisfied path; the full list is only built on failure.
+        for dep in dependencies:
+            if dep not in plugins:
+                return [d for d in dependencies if d not in plugins]
+        return []
 
 
 __all__ = ["PluginRegistry"]
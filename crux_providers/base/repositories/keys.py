@@ -10,6 +10,15 @@ Design
 - Non-throwing accessors that return None if a key is not resolved.
 - Simple, explicit env var map per provider.
 - Optional config fallbacks via src.config_loader if present.
+- Optional settings-repository fallback via src.settings, imported once at
+  module load (absent module disables the fallback).
+- Environment lookups are never cached (env is authoritative and cheap to
+  read). Successful config/settings fallback resolutions are memoized per
+  provider for ``FALLBACK_CACHE_TTL_S`` seconds; misses are not cached, so a
+  key saved through settings or config is picked up on the next lookup. The
+  memo is shared by all ``KeysRepository`` instances because callers build a
+  fresh repository per lookup. Call ``KeysRepository.clear_cache()`` after
+  replacing an existing config or stored key to observe it immediately.
 
 Usage
 - repo = KeysRepository()
@@ -18,9 +27,10 @@ Usage
 
 from __future__ import annotations
 
-import contextlib
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 # Optional unified config loader (do not fail if absent)
 try:
@@ -28,8 +38,26 @@ try:
 except Exception:
     config_loader = None  # type: ignore
 
+# Optional settings repository (SQLite) factory (do not fail if absent)
+try:
+    from src.settings import get_settings_repo as _get_settings_repo  # type: ignore
+except Exception:
+    _get_settings_repo = None  # type: ignore
+
+# Provider config fields that may hold an API key, in priority order.
+_CONFIG_KEY_FIELDS = ("api_key", "resolved_key", "key", "token")
+
+# Lifetime of memoized config/settings fallback resolutions.
+FALLBACK_CACHE_TTL_S = 5.0
+
 
-@dataclass
+@lru_cache(maxsize=64)
+def _normalize_provider(provider: Optional[str]) -> str:
+    """Return the lower-cased, stripped provider key (memoized)."""
+    return (provider or "").lower().strip()
+
+
+@dataclass(slots=True)
 class KeyResolution:
     provider: str
     api_key: Optional[str]
@@ -60,8 +88,17 @@ class KeysRepository:
     def get_api_key(self, provider: str) -> Optional[str]:
         return self.get_resolution(provider).api_key
 
+    # Successful fallback (config/settings) resolutions keyed by normalized
+    # provider; intentionally shared across instances (see module docstring).
+    _fallback_cache: ClassVar[Dict[str, Tuple[float, KeyResolution]]] = {}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized config/settings fallback resolutions."""
+        cls._fallback_cache.clear()
+
     def get_resolution(self, provider: str) -> KeyResolution:
-        p = (provider or "").lower().strip()
+        p = _normalize_provider(provider)
         # Prefer environment variables (alias-aware via resolver)
         val, used = self.resolve_provider_key(p)
         if val:
@@ -69,6 +106,18 @@ class KeysRepository:
                 provider=p, api_key=val, source="env", extra={"env_var": used}
             )
 
+        hit = self._fallback_cache.get(p)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < FALLBACK_CACHE_TTL_S:
+            res = hit[1]
+            return replace(res, extra=dict(res.extra))
+        res = self._resolve_fallback(p)
+        if res.api_key:
+            self._fallback_cache[p] = (now, res)
+        return replace(res, extra=dict(res.extra))
+
+    def _resolve_fallback(self, p: str) -> KeyResolution:
+        """Resolve ``p`` from unified config, then the settings repository."""
         # 2) Unified config (best-effort)
         cfg_key, extra = self._from_config(p)
 
@@ -77,12 +126,15 @@ class KeysRepository:
                 provider=p, api_key=cfg_key, source="config", extra=extra
             )
 
-        # 3) Settings repository (SQLite) fallback
-        # Only suppress import/runtime issues expected when optional settings module absent.
-        with contextlib.suppress(ImportError, AttributeError, RuntimeError):
-            from src.settings import get_settings_repo  # type: ignore
-            repo = get_settings_repo()  # may raise if settings subsystem uninitialized
-            if db_key := repo.get_api_key(p):  # type: ignore[attr-defined]
+        # 3) Settings repository (SQLite) fallback; the optional module is
+        # imported once at module load, so only the runtime call is guarded.
+        if _get_settings_repo is not None:
+            try:
+                repo = _get_settings_repo()  # may raise if settings subsystem uninitialized
+                db_key = repo.get_api_key(p)  # type: ignore[attr-defined]
+            except (AttributeError, RuntimeError):
+                db_key = None
+            if db_key:
                 return KeyResolution(
                     provider=p,
                     api_key=db_key,
@@ -145,11 +197,12 @@ class KeysRepository:
             or ``None`` if none are present.
 
         Notes
-        - Field candidates are checked in the following order: ``api_key``,
-            ``resolved_key``, ``key``, ``token``.
+        - Field candidates are checked in ``_CONFIG_KEY_FIELDS`` order:
+            ``api_key``, ``resolved_key``, ``key``, ``token``.
         """
-        for field in ("api_key", "resolved_key", "key", "token"):
-            val = prov_cfg.get(field)
+        get = prov_cfg.get
+        for field in _CONFIG_KEY_FIELDS:
+            val = get(field)
             if isinstance(val, str) and val:
                 meta["field"] = field
                 return val
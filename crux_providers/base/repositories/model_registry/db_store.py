@@ -17,6 +17,11 @@ except Exception:  # pragma: no cover
     svcdb = None  # type: ignore
 
 
+def is_available() -> bool:
+    """Return True when the service SQLite layer could be imported."""
+    return svcdb is not None
+
+
 def load_snapshot_from_db(provider: str) -> Optional[Dict[str, Any]]:
     """Load a snapshot from SQLite if available.
 
@@ -36,6 +41,27 @@ def load_snapshot_from_db(provider: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+def load_snapshot_rows_from_db(provider: str) -> Optional[Dict[str, Any]]:
+    """Load a snapshot as raw registry rows if available.
+
+    Args:
+        provider: Provider name.
+
+    Returns:
+        Mapping with a ``rows`` list of ``(model_id, name, family,
+        context_length, capabilities_json, updated_at)`` tuples plus meta
+        fields, or None on failure/miss.
+    """
+    if svcdb is None:
+        return None
+    with contextlib.suppress(Exception):
+        svcdb.ensure_initialized()
+        snap = svcdb.load_models_rows(provider)
+        if snap and isinstance(snap.get("rows"), list):
+            return snap
+    return None
+
+
 def save_snapshot_to_db(
     provider: str,
     models: List[Dict[str, Any]],
@@ -51,6 +77,9 @@ def save_snapshot_to_db(
         fetched_at: ISO 8601 timestamp for when the snapshot was fetched.
         fetched_via: Descriptor for the mechanism used (e.g., "api", "local").
         metadata: Additional metadata to store alongside the snapshot.
+
+    The store replaces the provider's rows in a single transaction with one
+    batched insert, so ``models`` is passed through unchanged.
     """
     if svcdb is None:
         return
@@ -84,4 +113,10 @@ def list_providers_from_db() -> List[Dict[str, Any]]:
     return []
 
 
-__all__ = ["load_snapshot_from_db", "save_snapshot_to_db", "list_providers_from_db"]
+__all__ = [
+    "is_available",
+    "load_snapshot_from_db",
+    "load_snapshot_rows_from_db",
+    "save_snapshot_to_db",
+    "list_providers_from_db",
+]
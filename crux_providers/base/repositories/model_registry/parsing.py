@@ -7,10 +7,20 @@ metadata that the repository can persist and serve.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...models import ModelInfo
+from ...utils.json_fast import loads_json
+
+# Top-level payload keys carried over as snapshot metadata.
+_META_KEYS = ("provider", "source", "fetched_via", "fetched_at", "metadata")
+# Provenance keys promoted from refresh results when they are strings.
+_EXTRA_KEYS = ("fetched_via", "source", "fetched_at")
+# Ordered candidate keys for model identifiers and display names.
+_ID_KEYS = ("id", "model_id", "modelId", "model", "slug", "name")
+_NAME_KEYS = ("name", "model_name", "modelName", "id", "model", "slug")
 
 
 def now_iso() -> str:
@@ -29,19 +39,15 @@ def extract_meta_and_raw(data: Any) -> Tuple[Dict[str, Any], List[Any]]:
     Returns:
         A pair of (metadata, raw_entries).
     """
-    meta: Dict[str, Any] = {}
-    raw: List[Any] = []
     if isinstance(data, dict):
-        for k in ("provider", "source", "fetched_via", "fetched_at", "metadata"):
-            if k in data:
-                meta[k] = data[k]
-        if isinstance(data.get("models"), list):
-            raw = data["models"]
-        elif isinstance(data.get("data"), list):
-            raw = data["data"]
-    elif isinstance(data, list):
-        raw = data
-    return meta, raw
+        meta = {k: data[k] for k in _META_KEYS if k in data}
+        raw = data.get("models")
+        if not isinstance(raw, list):
+            raw = data.get("data")
+            if not isinstance(raw, list):
+                raw = []
+        return meta, raw
+    return {}, data if isinstance(data, list) else []
 
 
 def coerce_to_model(provider: str, item: Any) -> ModelInfo:
@@ -59,7 +65,7 @@ def coerce_to_model(provider: str, item: Any) -> ModelInfo:
     if isinstance(item, dict):
         return model_from_dict(provider, item)
     sid = str(item)
-    return ModelInfo(id=sid, name=sid, provider=provider)
+    return ModelInfo(id=sid, name=sid, provider=_intern(provider))
 
 
 def model_from_dict(provider: str, d: Dict[str, Any]) -> ModelInfo:
@@ -74,7 +80,12 @@ def model_from_dict(provider: str, d: Dict[str, Any]) -> ModelInfo:
 
     Returns:
         A normalized `ModelInfo` instance.
+
+    Notes:
+        Strings repeated across a snapshot (provider, family, capability keys,
+        timestamps) are interned so large snapshots share one object each.
     """
+    provider = _intern(provider)
     mid, name = _norm_id_name(d)
     fam = _extract_family(d)
     ctx = _extract_context(d)
@@ -91,6 +102,36 @@ def model_from_dict(provider: str, d: Dict[str, Any]) -> ModelInfo:
     )
 
 
+def model_from_row(provider: str, row: Tuple[Any, ...]) -> ModelInfo:
+    """Create a `ModelInfo` from a raw ``model_registry`` row.
+
+    Rows are ``(model_id, name, family, context_length, capabilities_json,
+    updated_at)`` as written by the SQLite store, whose columns are already
+    normalized; only the capabilities JSON needs decoding.
+
+    Args:
+        provider: Provider name to assign.
+        row: Registry row tuple.
+
+    Returns:
+        A `ModelInfo` instance.
+    """
+    mid, name, family, ctx, caps_json, updated_at = row
+    try:
+        caps = loads_json(caps_json) if caps_json else {}
+    except ValueError:
+        caps = {"raw": caps_json}
+    return ModelInfo(
+        id=mid,
+        name=name or mid,
+        provider=_intern(provider),
+        family=_intern(family),
+        context_length=ctx,
+        capabilities=_normalize_caps(caps),
+        updated_at=_intern(updated_at),
+    )
+
+
 def normalize_result(
     provider: str, result: Any
 ) -> Tuple[List[ModelInfo], Dict[str, Any]]:
@@ -152,27 +193,16 @@ def _models_from_dict(
     Returns:
         Tuple[List[ModelInfo], Dict[str, Any]]: The list of ModelInfo objects and a dictionary of extra metadata.
     """
-    items = d.get("models") if isinstance(d.get("models"), list) else []
-    models = _models_from_list(provider, items)
-    extra: Dict[str, Any] = {}
-    for k in ("fetched_via", "source", "fetched_at"):
-        v = d.get(k)
-        if isinstance(v, str):
-            extra[k] = v
+    items = d.get("models")
+    models = _models_from_list(provider, items) if isinstance(items, list) else []
+    extra: Dict[str, Any] = {k: v for k in _EXTRA_KEYS if isinstance(v := d.get(k), str)}
     return models, extra
 
 
 def _norm_id_name(d: Dict[str, Any]) -> Tuple[str, str]:
-    """Return (model_id, name) using ordered candidate lists (low CCN)."""
-    def first_match(keys: List[str]) -> Optional[str]:
-        for k in keys:
-            v = d.get(k)
-            if isinstance(v, (str, int)):
-                return str(v)
-        return None
-
-    mid = first_match(["id", "model_id", "modelId", "model", "slug", "name"]) or "unknown"
-    name_val = first_match(["name", "model_name", "modelName", "id", "model", "slug"]) or mid
+    """Return (model_id, name) using ordered candidate key tuples (low CCN)."""
+    mid = next((str(v) for k in _ID_KEYS if isinstance(v := d.get(k), (str, int))), None) or "unknown"
+    name_val = next((str(v) for k in _NAME_KEYS if isinstance(v := d.get(k), (str, int))), None) or mid
     return mid, name_val
 
 
@@ -189,7 +219,7 @@ def _extract_family(d: Dict[str, Any]) -> Optional[str]:
         Optional[str]: The model family, or None if not found.
     """
     fam = d.get("family") or d.get("series")
-    return fam if isinstance(fam, str) else None
+    return _intern(fam) if isinstance(fam, str) else None
 
 
 def _extract_context(d: Dict[str, Any]) -> Optional[int]:
@@ -216,6 +246,7 @@ def _normalize_caps(caps: Any) -> Dict[str, Any]:
     Normalizes the capabilities field to a dictionary.
 
     If the input is not a dictionary, wraps it in a dictionary under the 'raw_capabilities' key.
+    Top-level string keys of dictionaries are interned.
 
     Args:
         caps (Any): The capabilities value.
@@ -225,7 +256,9 @@ def _normalize_caps(caps: Any) -> Dict[str, Any]:
     """
     if caps is None:
         return {}
-    return caps if isinstance(caps, dict) else {"raw_capabilities": caps}
+    if not isinstance(caps, dict):
+        return {"raw_capabilities": caps}
+    return {_intern(k): v for k, v in caps.items()}
 
 
 def _extract_updated(d: Dict[str, Any]) -> Optional[str]:
@@ -241,7 +274,12 @@ def _extract_updated(d: Dict[str, Any]) -> Optional[str]:
         Optional[str]: The updated_at timestamp, or None if not found.
     """
     updated_at = d.get("updated_at") or d.get("fetched_at")
-    return updated_at if isinstance(updated_at, str) else None
+    return _intern(updated_at) if isinstance(updated_at, str) else None
+
+
+def _intern(value: Any) -> Any:
+    """Return ``sys.intern(value)`` for exact ``str`` values, else ``value`` unchanged."""
+    return sys.intern(value) if type(value) is str else value
 
 
 __all__ = [
@@ -249,5 +287,6 @@ __all__ = [
     "extract_meta_and_raw",
     "coerce_to_model",
     "model_from_dict",
+    "model_from_row",
     "normalize_result",
 ]
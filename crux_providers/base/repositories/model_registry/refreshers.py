@@ -6,8 +6,10 @@ and offers an Ollama CLI-based fallback.
 
 from __future__ import annotations
 
-import json
+import functools
+import gzip
 import os
+import weakref
 from importlib import import_module
 from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional
@@ -17,16 +19,40 @@ from urllib.parse import urlparse
 
 from ...models import ModelInfo
 from ...timeouts import get_timeout_config
+from ...utils.json_fast import loads_json
 from ....config.defaults import OLLAMA_DEFAULT_HOST
 
 
+# Refresh entry point resolved per module object (None when absent).
+_refresh_fn_cache: "weakref.WeakKeyDictionary[ModuleType, Optional[Callable]]" = weakref.WeakKeyDictionary()
+
+
+# Successfully imported refresher modules by provider. Misses are not cached so
+# a refresher that becomes importable later (e.g. an optional dependency
+# installed at runtime) is picked up on the next refresh.
+_provider_module_cache: Dict[str, ModuleType] = {}
+
+
 def import_provider_module(provider: str) -> Optional[ModuleType]:
     """
     Locate a provider refresher module. Preference order:
     1) src.infrastructure.providers.<provider>.get_<provider>_models
     2) crux_providers.<provider>.get_<provider>_models
     3) package-relative to crux_providers (for embedded installs)
+
+    Successful lookups are memoized per provider, skipping the failing
+    candidates on later calls; misses are retried every time.
     """
+    mod = _provider_module_cache.get(provider)
+    if mod is None:
+        mod = _import_provider_module(provider)
+        if mod is not None:
+            _provider_module_cache[provider] = mod
+    return mod
+
+
+def _import_provider_module(provider: str) -> Optional[ModuleType]:
+    """Try each refresher module candidate for ``provider`` (uncached)."""
     candidates = [
         f"src.infrastructure.providers.{provider}.get_{provider}_models",
         f"crux_providers.{provider}.get_{provider}_models",
@@ -45,6 +71,29 @@ def import_provider_module(provider: str) -> Optional[ModuleType]:
 
 
 def find_refresh_function(mod: ModuleType) -> Optional[Callable]:
+    """Return the first callable refresh entry point exported by ``mod``.
+
+    The lookup is memoized per module object.
+    """
+    try:
+        return _refresh_fn_cache[mod]
+    except KeyError:
+        pass
+    except TypeError:  # pragma: no cover - non-weakrefable stand-ins
+        return _find_refresh_function(mod)
+    fn = _refresh_fn_cache[mod] = _find_refresh_function(mod)
+    return fn
+
+
+def clear_refresh_caches() -> None:
+    """Forget memoized refresher modules, entry points, and Ollama base URLs."""
+    _provider_module_cache.clear()
+    _refresh_fn_cache.clear()
+    _validated_ollama_base.cache_clear()
+
+
+def _find_refresh_function(mod: ModuleType) -> Optional[Callable]:
+    """Scan ``mod`` for a callable refresh entry point (uncached)."""
     candidates = [
         "refresh_models",
         "update_models",
@@ -79,8 +128,15 @@ def _ollama_base() -> str:
 
     Only http/https schemes are permitted to avoid unsafe schemes (Bandit B310).
     If no scheme is provided, http:// is assumed. Raises RuntimeError on invalid scheme.
+    The environment is read on every call; parsing is memoized per raw value.
     """
     raw = (os.getenv("OLLAMA_HOST", OLLAMA_DEFAULT_HOST) or OLLAMA_DEFAULT_HOST).strip()
+    return _validated_ollama_base(raw)
+
+
+@functools.lru_cache(maxsize=8)
+def _validated_ollama_base(raw: str) -> str:
+    """Validate and normalize a raw ``OLLAMA_HOST`` value (memoized)."""
     parsed = urlparse(raw)
     # If user supplied host without scheme, assume http
     if not parsed.scheme:
@@ -97,19 +153,17 @@ def _fetch_ollama_tags(timeout: int) -> Dict[str, Any]:
     """Fetch and decode the Ollama /api/tags JSON payload."""
     base = _ollama_base()  # validated (http/https only)
     url = f"{base}/api/tags"
-    # Extra defensive check (Bandit B310) – base already validated but keep explicit guard
-    parsed = urlparse(url)
-    if parsed.scheme not in ("http", "https"):
-        raise RuntimeError("Refusing to open non-http(s) URL for Ollama tags")
-    req = _urlreq.Request(url, method="GET")
+    req = _urlreq.Request(url, method="GET", headers={"Accept-Encoding": "gzip"})
     try:
-        # Safe: scheme explicitly limited to http/https above
+        # Safe: _ollama_base() limits the scheme to http/https
         with _urlreq.urlopen(req, timeout=timeout) as resp:  # nosec B310
             if getattr(resp, "status", 200) != 200:
                 raise RuntimeError(
                     f"ollama tags HTTP {getattr(resp, 'status', 'unknown')}"
                 )
             raw = resp.read()
+            headers = getattr(resp, "headers", None)
+            encoding = (headers.get("Content-Encoding") or "") if headers is not None else ""
     except (
         _urlerr.URLError,
         _urlerr.HTTPError,
@@ -118,14 +172,27 @@ def _fetch_ollama_tags(timeout: int) -> Dict[str, Any]:
         raise RuntimeError(f"ollama tags request failed: {e}") from e
 
     try:
-        payload = json.loads(raw.decode("utf-8"))
+        if encoding.lower() == "gzip":
+            raw = gzip.decompress(raw)
+        # Decode straight from bytes (orjson when installed; no separate UTF-8 pass).
+        payload = loads_json(raw)
     except Exception as e:
         raise RuntimeError(f"ollama tags response parse error: {e}") from e
     return payload if isinstance(payload, dict) else {}
 
 
 def _models_from_ollama_payload(payload: Dict[str, Any]) -> List[ModelInfo]:
+    """Build ``ModelInfo`` entries from an Ollama ``/api/tags`` payload.
+
+    Real payloads are a list of ``{"name": ...}`` objects, which take a single
+    comprehension; mixed lists fall back to the per-item dispatch loop.
+    """
     items = payload.get("models") if isinstance(payload, dict) else []
+    if isinstance(items, list):
+        try:
+            return [ModelInfo(id=n, name=n, provider="ollama") for it in items if (n := it.get("name"))]
+        except AttributeError:
+            pass  # non-dict entries present; use the general loop below
     models: List[ModelInfo] = []
     for it in items if isinstance(items, list) else []:
         name = it.get("name") if isinstance(it, dict) else (str(it) if it else None)
@@ -134,4 +201,9 @@ def _models_from_ollama_payload(payload: Dict[str, Any]) -> List[ModelInfo]:
     return models
 
 
-__all__ = ["import_provider_module", "find_refresh_function", "refresh_via_ollama_cli"]
+__all__ = [
+    "import_provider_module",
+    "find_refresh_function",
+    "clear_refresh_caches",
+    "refresh_via_ollama_cli",
+]
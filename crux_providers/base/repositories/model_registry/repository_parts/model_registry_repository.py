@@ -7,15 +7,68 @@ public API remains unchanged via re-exports in ``repository.py``.
 
 from __future__ import annotations
 
+import math
 import sys
+import threading
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from ....models import ModelInfo, ModelRegistrySnapshot
 from .. import db_store, parsing, refreshers
-from ....capabilities import merge_capabilities, load_observed, apply_void_enrichment
+from ....capabilities import (
+    apply_void_enrichment,
+    has_void_defaults,
+    load_observed,
+    merge_capabilities,
+    observed_generation,
+)
 from .model_registry_error import ModelRegistryError
 
+# Lifetime of an enriched snapshot held in the shared read cache.
+SNAPSHOT_CACHE_TTL_S = 30.0
+# Empty (miss) snapshots are held only briefly to absorb bursts without
+# pinning absent state once another writer populates the DB.
+EMPTY_SNAPSHOT_TTL_S = 1.0
+
+# This file lives under .../crux_providers/base/repositories/model_registry/repository_parts/
+# The providers root is one level above 'base', i.e., parents[4]. Resolved once
+# at import so constructing a repository performs no filesystem calls.
+_DEFAULT_PROVIDERS_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _as_count(value: Any) -> int:
+    """Coerce a ``model_count`` column value to ``int`` (0 when unusable).
+
+    SQLite returns integers for the count column, so that case is checked
+    first; numeric strings and floats from other backends are still accepted.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, float):
+        return int(value) if math.isfinite(value) else 0
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    return 0
+
+
+def _provider_descriptor(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the normalized provider descriptor for one registry row."""
+    provider = row["provider"]
+    metadata = row.get("metadata") or {}
+    if not isinstance(metadata, dict):
+        metadata = {"raw": metadata}
+    aliases = metadata.get("aliases")
+    return {
+        "id": provider,
+        "display_name": metadata.get("display_name") or provider,
+        "aliases": aliases if isinstance(aliases, list) else [],
+        "model_count": _as_count(row.get("model_count")),
+        "enabled": bool(metadata.get("enabled", True)),
+        "metadata": metadata,
+    }
+
 
 class ModelRegistryRepository:
     """Manage model registry snapshots for providers.
@@ -24,6 +77,15 @@ class ModelRegistryRepository:
     modules or the `ollama` CLI. Does not import cloud SDKs directly.
     """
 
+    # Read caches are shared by all instances: most callers construct a
+    # repository per call, and ``save_snapshot`` through any instance must
+    # invalidate what every other instance (e.g. the DI singleton) serves.
+    # provider -> (expires_at monotonic, observed generation, enriched snapshot)
+    _snap_cache: ClassVar[Dict[str, Tuple[float, int, ModelRegistrySnapshot]]] = {}
+    # provider -> (expires_at monotonic, observed generation, observed mapping)
+    _observed_cache: ClassVar[Dict[str, Tuple[float, int, Dict[str, Dict[str, Any]]]]] = {}
+    _snap_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, providers_root: Optional[Path] = None) -> None:
         """Initialize the repository.
 
@@ -31,9 +93,7 @@ class ModelRegistryRepository:
             providers_root: Root directory for provider data. Defaults to the
                 repository root's providers directory if not provided.
         """
-        # This file lives under .../crux_providers/base/repositories/model_registry/repository_parts/
-        # The providers root is one level above 'base', i.e., parents[4].
-        self.providers_root = providers_root or Path(__file__).resolve().parents[4]
+        self.providers_root = providers_root or _DEFAULT_PROVIDERS_ROOT
 
     # Public API
     def list_models(self, provider: str, refresh: bool = False) -> ModelRegistrySnapshot:
@@ -42,24 +102,49 @@ class ModelRegistryRepository:
         Args:
             provider: Provider name.
             refresh: When True, attempt to refresh models before load.
+
+        Enriched snapshots are cached across instances for ``SNAPSHOT_CACHE_TTL_S``
+        seconds (empty results for ``EMPTY_SNAPSHOT_TTL_S``); ``save_snapshot``,
+        ``refresh=True`` and newly recorded observations invalidate the entry.
         """
         provider = provider.lower().strip()
         if refresh:
             self._try_refresh(provider)
-        db_snap = self._snapshot_from_db(provider)
-        if db_snap is not None:
-            self._apply_observed(provider, db_snap.models)
-            self._apply_void_profile(provider, db_snap.models)
-            return db_snap
-        # DB-first policy: if no snapshot is found in SQLite, return an empty snapshot.
-        # Callers that desire population should pass refresh=True.
-        return ModelRegistrySnapshot(
-            provider=provider,
-            models=[],
-            fetched_via=None,
-            fetched_at=None,
-            metadata={},
-        )
+            self.invalidate(provider)
+        else:
+            cached = self._cached_snapshot(provider)
+            if cached is not None:
+                return cached
+        generation = observed_generation()
+        snap = self._snapshot_from_db(provider)
+        if snap is not None:
+            self._apply_enrichments(provider, snap.models)
+            ttl = SNAPSHOT_CACHE_TTL_S
+        else:
+            # DB-first policy: if no snapshot is found in SQLite, return an empty snapshot.
+            # Callers that desire population should pass refresh=True.
+            snap = ModelRegistrySnapshot(
+                provider=provider,
+                models=[],
+                fetched_via=None,
+                fetched_at=None,
+                metadata={},
+            )
+            ttl = EMPTY_SNAPSHOT_TTL_S
+        with self._snap_lock:
+            self._snap_cache[provider] = (time.monotonic() + ttl, generation, snap)
+        return replace(snap, models=list(snap.models))
+
+    def invalidate(self, provider: Optional[str] = None) -> None:
+        """Drop cached snapshots and observations for ``provider`` (or all when None)."""
+        with self._snap_lock:
+            if provider is None:
+                self._snap_cache.clear()
+                self._observed_cache.clear()
+            else:
+                key = provider.lower().strip()
+                self._snap_cache.pop(key, None)
+                self._observed_cache.pop(key, None)
 
     def list_providers(self) -> List[Dict[str, Any]]:
         """Return normalized provider descriptors from the registry.
@@ -73,55 +158,29 @@ class ModelRegistryRepository:
         - ``enabled``: Optional enabled flag from metadata (defaults to True).
         - ``metadata``: Raw metadata mapping from the registry.
         """
-        rows = db_store.list_providers_from_db() or []
-        providers: List[Dict[str, Any]] = []
-        for row in rows:
-            provider = row.get("provider")
-            if not provider:
-                continue
-            metadata = row.get("metadata") or {}
-            if not isinstance(metadata, dict):
-                metadata = {"raw": metadata}
-            display_name = metadata.get("display_name") or provider
-            aliases_raw = metadata.get("aliases")
-            aliases = aliases_raw if isinstance(aliases_raw, list) else []
-            try:
-                model_count = int(row.get("model_count") or 0)
-            except Exception:  # pragma: no cover - defensive
-                model_count = 0
-            enabled = bool(metadata.get("enabled", True))
-            providers.append(
-                {
-                    "id": provider,
-                    "display_name": display_name,
-                    "aliases": aliases,
-                    "model_count": model_count,
-                    "enabled": enabled,
-                    "metadata": metadata,
-                }
-            )
-        return providers
-
-    def _apply_observed(self, provider: str, models: List[ModelInfo]) -> None:
-        """Merge observed capability flags into each model's capabilities."""
-        observed = load_observed(provider, self.providers_root)
-        if not observed:
-            return
-        for m in models or []:
-            caps_old = getattr(m, "capabilities", {}) or {}
-            if caps_obs := observed.get(m.id) or {}:
-                m.capabilities = merge_capabilities(caps_old, caps_obs)
+        rows = db_store.list_providers_from_db()
+        if not rows:
+            return []
+        return [_provider_descriptor(row) for row in rows if row.get("provider")]
 
-    def _apply_void_profile(self, provider: str, models: List[ModelInfo]) -> None:
-        """Apply Void-oriented capability enrichment to model capabilities.
+    def _apply_enrichments(self, provider: str, models: List[ModelInfo]) -> None:
+        """Merge observed flags and Void defaults into each model in one pass.
 
-        This uses :func:`apply_void_enrichment` to fill in missing high-level
-        fields such as ``tool_format`` and ``system_message`` in a
-        non-destructive way (existing capability keys always win).
+        Observed capability flags are merged first; :func:`apply_void_enrichment`
+        then fills in missing high-level fields such as ``tool_format`` and
+        ``system_message`` in a non-destructive way (existing keys always win).
         """
+        observed = self._load_observed(provider)
+        void = has_void_defaults(provider)
+        if not observed and not void:
+            return
         for m in models or []:
-            caps_old = getattr(m, "capabilities", {}) or {}
-            m.capabilities = apply_void_enrichment(provider, m.id, caps_old)
+            caps = getattr(m, "capabilities", {}) or {}
+            if observed and (caps_obs := observed.get(m.id)):
+                caps = merge_capabilities(caps, caps_obs)
+            if void:
+                caps = apply_void_enrichment(provider, m.id, caps)
+            m.capabilities = caps
 
     def save_snapshot(self, snapshot: ModelRegistrySnapshot) -> None:
         """Persist the given snapshot to SQLite only (DB-first policy).
@@ -136,21 +195,19 @@ class ModelRegistryRepository:
 
         Returns:
             None. Callers should obtain snapshots via :meth:`list_models`.
+            Without a SQLite backend this is a no-op and models are not
+            serialized.
         """
-        payload: Dict[str, Any] = {
-            "provider": snapshot.provider,
-            "models": [m.to_dict() for m in snapshot.models],
-            "fetched_at": snapshot.fetched_at or parsing.now_iso(),
-            "fetched_via": snapshot.fetched_via or "local",
-            "metadata": snapshot.metadata,
-        }
+        if not db_store.is_available():
+            return
         db_store.save_snapshot_to_db(
             snapshot.provider,
-            payload["models"],
-            fetched_at=payload["fetched_at"],
-            fetched_via=payload["fetched_via"],
-            metadata=payload["metadata"],
+            [m.to_dict() for m in snapshot.models],
+            fetched_at=snapshot.fetched_at or parsing.now_iso(),
+            fetched_via=snapshot.fetched_via or "local",
+            metadata=snapshot.metadata,
         )
+        self.invalidate(snapshot.provider)
         # DB-first: no JSON cache write; single source of truth is SQLite.
 
     # Refresh strategies
@@ -230,19 +287,55 @@ class ModelRegistryRepository:
                 file=sys.stderr,
             )
 
+    def _cached_snapshot(self, provider: str) -> Optional[ModelRegistrySnapshot]:
+        """Return a copy of the cached snapshot for ``provider`` if still fresh.
+
+        The copy carries its own ``models`` list so callers may reorder or
+        filter it without affecting later hits.
+        """
+        with self._snap_lock:
+            entry = self._snap_cache.get(provider)
+            if entry is None:
+                return None
+            expires_at, generation, snap = entry
+            if time.monotonic() >= expires_at or generation != observed_generation():
+                del self._snap_cache[provider]
+                return None
+        return replace(snap, models=list(snap.models))
+
+    def _load_observed(self, provider: str) -> Dict[str, Dict[str, Any]]:
+        """Return observed capabilities for ``provider``, reusing a fresh cached copy.
+
+        Entries are reused while no observation has been recorded in this
+        process since the load and the TTL has not elapsed; the TTL bounds
+        staleness from writers in other processes.
+        """
+        generation = observed_generation()
+        with self._snap_lock:
+            entry = self._observed_cache.get(provider)
+        if entry is not None and entry[1] == generation and time.monotonic() < entry[0]:
+            return entry[2]
+        observed = load_observed(provider, self.providers_root)
+        with self._snap_lock:
+            self._observed_cache[provider] = (time.monotonic() + SNAPSHOT_CACHE_TTL_S, generation, observed)
+        return observed
+
     def _snapshot_from_db(self, provider: str) -> Optional[ModelRegistrySnapshot]:
-        """Load a snapshot from SQLite when available; return None on miss."""
-        snap = db_store.load_snapshot_from_db(provider)
-        if snap and isinstance(snap.get("models"), list):
-            models = [self._model_from_dict(provider, m) for m in snap["models"]]
-            return ModelRegistrySnapshot(
-                provider=provider,
-                models=models,
-                fetched_via=snap.get("fetched_via"),
-                fetched_at=snap.get("fetched_at"),
-                metadata=snap.get("metadata") or {},
-            )
-        return None
+        """Load a snapshot from SQLite when available; return None on miss.
+
+        Models are built straight from registry rows (normalized on write), so
+        no intermediate dict is created per model.
+        """
+        snap = db_store.load_snapshot_rows_from_db(provider)
+        if snap is None:
+            return None
+        return ModelRegistrySnapshot(
+            provider=provider,
+            models=[parsing.model_from_row(provider, r) for r in snap["rows"]],
+            fetched_via=snap.get("fetched_via"),
+            fetched_at=snap.get("fetched_at"),
+            metadata=snap.get("metadata") or {},
+        )
 
 
 __all__ = ["ModelRegistryRepository"]
@@ -2,29 +2,60 @@ from __future__ import annotations
 
 import functools
 import time
-from typing import Callable, TypeVar
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# Separates positional from keyword arguments in keys (as in ``functools``).
+_KWD_MARK = object()
 
-def cache_result(maxsize: int = 128, ttl: int = 3600):
-    cache = {}
-    timestamps = {}
+
+def _make_key(args: Tuple[Any, ...], kwargs: dict) -> Hashable:
+    """Build a hashable cache key without stringifying the arguments.
+
+    Argument types are part of the key (as with ``functools.lru_cache(typed=True)``)
+    so ``1``, ``1.0`` and ``True`` stay distinct, matching the former ``str()``
+    keys. Unhashable arguments (lists, dicts) fall back to the ``repr``-based
+    key so such calls keep caching as before.
+    """
+    key: Hashable = args + tuple([type(a) for a in args])
+    if kwargs:
+        items = tuple(sorted(kwargs.items()))
+        key += (_KWD_MARK,) + items + tuple([type(v) for _, v in items])
+    try:
+        hash(key)
+    except TypeError:
+        key = repr(key)
+    return key
+
+
+def cache_result(maxsize: int = 128, ttl: Optional[int] = 3600):
+    """Memoize results in an LRU bounded by ``maxsize`` with a ``ttl`` in seconds.
+
+    ``ttl=None`` disables expiry (entries are evicted by LRU only); a ``ttl`` of
+    zero or less disables caching, so every call reaches ``func``.
+    """
+    cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if ttl is not None and ttl <= 0:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            key = str((args, frozenset(sorted(kwargs.items()))))
-            now = time.time()
-            if key in cache and now - timestamps[key] < ttl:
-                return cache[key]
+            key = _make_key(args, kwargs)
+            entry = cache.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if ttl is None or time.monotonic() < expires_at:
+                    cache.move_to_end(key)
+                    return value
             result = func(*args, **kwargs)
-            if len(cache) >= maxsize:
-                oldest = min(timestamps.items(), key=lambda x: x[1])[0]
-                cache.pop(oldest, None)
-                timestamps.pop(oldest, None)
-            cache[key] = result
-            timestamps[key] = now
+            cache[key] = (0.0 if ttl is None else time.monotonic() + ttl, result)
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
             return result
 
         return wrapper
@@ -0,0 +1,151 @@
+"""Per-provider circuit breaker for skipping providers that keep failing.
+
+Purpose:
+- Track consecutive failures per provider id and stop routing traffic to a
+  provider once ``threshold`` failures have been recorded in a row. The
+  breaker stays open for ``cooldown`` seconds, then turns half-open: the next
+  call is let through as a single probe (other callers are rejected while it
+  is outstanding) and either closes the breaker (success) or re-opens it for
+  another cooldown (failure). A probe whose result is never recorded expires
+  after ``cooldown`` seconds so another caller can probe.
+- Callers composing fallbacks across providers use :meth:`available` to drop
+  open providers from a candidate list, saving a full HTTP round-trip plus
+  retry backoff per request during an upstream outage.
+
+External dependencies:
+- Standard library only (``threading``, ``time``). No I/O.
+
+Fallback semantics:
+- The breaker only reports state; it never raises or substitutes results.
+  When every candidate is open, :meth:`available` returns an empty list and
+  the caller decides how to fail.
+
+Timeout strategy:
+- Not applicable; no blocking operations. Cooldowns use ``time.monotonic``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Literal, Optional
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class _ProviderCircuit:
+    """Failure bookkeeping for a single provider."""
+
+    __slots__ = ("failure_count", "last_failure_ts", "open_until", "probe_started", "state")
+
+    def __init__(self) -> None:
+        self.failure_count = 0
+        self.last_failure_ts = 0.0
+        self.open_until = 0.0
+        # Start time of the outstanding half-open probe, or None when no probe is out.
+        self.probe_started: Optional[float] = None
+        self.state: BreakerState = "closed"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker keyed by provider id.
+
+    Parameters:
+        threshold: Consecutive failures that open the breaker (>= 1).
+        cooldown: Seconds an open breaker rejects calls before turning half-open.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if threshold < 1:
+            raise ValueError("threshold must be >= 1")
+        if cooldown < 0:
+            raise ValueError("cooldown must be >= 0")
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _ProviderCircuit] = {}
+
+    def allow(self, provider: str) -> bool:
+        """Return True when ``provider`` may be called now.
+
+        An open breaker whose cooldown elapsed turns half-open and admits one
+        probe call; other callers are rejected until the probe's result is
+        recorded or the probe expires after ``cooldown`` seconds.
+        """
+        circuit = self._circuits.get(provider)
+        if circuit is None or circuit.state == "closed":
+            return True
+        with self._lock:
+            now = self._clock()
+            if circuit.state == "open":
+                if now < circuit.open_until:
+                    return False
+                circuit.state = "half_open"
+            elif circuit.state == "closed":
+                return True
+            elif circuit.probe_started is not None and now - circuit.probe_started < self.cooldown:
+                return False
+            circuit.probe_started = now
+            return True
+
+    def available(self, providers: Iterable[str]) -> List[str]:
+        """Return ``providers`` in order, without those whose breaker is open.
+
+        Goes through :meth:`allow`, so a half-open provider in the result has
+        its probe claimed by this caller.
+        """
+        if not self._circuits:
+            return list(providers)
+        return [p for p in providers if self.allow(p)]
+
+    def record_success(self, provider: str) -> None:
+        """Reset ``provider`` to closed after a successful call."""
+        circuit = self._circuits.get(provider)
+        if circuit is None or (circuit.state == "closed" and not circuit.failure_count):
+            return
+        with self._lock:
+            circuit.failure_count = 0
+            circuit.state = "closed"
+            circuit.open_until = 0.0
+            circuit.probe_started = None
+
+    def record_failure(self, provider: str) -> None:
+        """Count a failed call; open the breaker at ``threshold`` or on a failed probe."""
+        with self._lock:
+            circuit = self._circuits.get(provider)
+            if circuit is None:
+                circuit = self._circuits[provider] = _ProviderCircuit()
+            now = self._clock()
+            circuit.failure_count += 1
+            circuit.last_failure_ts = now
+            circuit.probe_started = None
+            if circuit.state == "half_open" or circuit.failure_count >= self.threshold:
+                circuit.state = "open"
+                circuit.open_until = now + self.cooldown
+
+    def state(self, provider: str) -> BreakerState:
+        """Return the current state for ``provider`` (``"closed"`` if unseen)."""
+        circuit = self._circuits.get(provider)
+        if circuit is None:
+            return "closed"
+        if circuit.state == "open" and self._clock() >= circuit.open_until:
+            return "half_open"
+        return circuit.state
+
+    def reset(self, provider: str | None = None) -> None:
+        """Forget failures for ``provider`` or, when omitted, for all providers."""
+        with self._lock:
+            if provider is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(provider, None)
+
+
+__all__ = ["BreakerState", "CircuitBreaker"]
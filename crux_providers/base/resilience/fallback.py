@@ -14,7 +14,7 @@ External dependencies
 
 Fallback semantics
 ------------------
-- Today: the decorator transparently calls the wrapped function and lets all
+- Today: the decorator returns the wrapped function unchanged, so all
     exceptions propagate. No fallback or retry is performed here.
 - Future: when a centralized provider selection and cache layer is available at
     the composition root, this decorator can be extended to log one structured
@@ -31,7 +31,6 @@ as required by provider policy.
 
 from __future__ import annotations
 
-import functools
 from typing import Callable, TypeVar
 
 T = TypeVar("T")
@@ -42,9 +41,10 @@ def with_fallback(_fallback_provider: str = "openai") -> Callable[[Callable[...,
 
         Summary
         -------
-        The returned decorator preserves the wrapped function's metadata and simply
-        invokes it. This establishes a stable hook point for future fallback logic
-        without introducing any behavioral changes today.
+        The returned decorator hands back the decorated function itself, so
+        decorated calls pay no extra frame or argument re-packing. This
+        establishes a stable hook point for future fallback logic without
+        introducing any behavioral changes today.
 
         Parameters
         ----------
@@ -56,8 +56,7 @@ def with_fallback(_fallback_provider: str = "openai") -> Callable[[Callable[...,
         Returns
         -------
         Callable[[Callable[..., T]], Callable[..., T]]
-                A decorator that wraps a function of arbitrary signature and returns a
-                function with the same signature and behavior.
+                A decorator that returns the decorated function unchanged.
 
         Failure modes
         -------------
@@ -71,12 +70,9 @@ def with_fallback(_fallback_provider: str = "openai") -> Callable[[Callable[...,
         """
 
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
-                @functools.wraps(func)
-                def wrapper(*args, **kwargs) -> T:
-                        # Intentionally perform no fallback behavior yet. This preserves
-                        # current semantics while providing a future hook point.
-                        return func(*args, **kwargs)
-
-                return wrapper
+                # Future hook point: when fallback semantics land, introduce a
+                # wrapper here behind an opt-in flag so the default path stays a
+                # pass-through and the decorator signature remains stable.
+                return func
 
         return decorator
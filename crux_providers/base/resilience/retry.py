@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
+import random
 import time
 from dataclasses import dataclass
-from typing import Callable, Iterable, Protocol, TypeVar
+from typing import Awaitable, Callable, Iterable, Iterator, Literal, Optional, Protocol, Tuple, TypeVar
 
+from ..cancellation import CancellationToken
 from ..errors import ErrorCode, ProviderError
 
 T = TypeVar("T")
 
+JitterMode = Literal["none", "full", "decorrelated"]
+_JITTER_MODES = ("none", "full", "decorrelated")
+
 
 class AttemptLogger(Protocol):  # pragma: no cover - structural protocol
     def __call__(
@@ -31,10 +38,52 @@ class RetryConfig:
         ErrorCode.TIMEOUT,
     )
     attempt_logger: AttemptLogger | None = None
+    # "full": uniform(0, capped exponential); "decorrelated": AWS-style
+    # uniform(delay_base, 3 * previous); "none": deterministic schedule.
+    jitter: JitterMode = "full"
+    delay_cap: float = 30.0  # upper bound for any single backoff (seconds)
+    # Wall-clock budget (seconds) across all attempts and backoffs; None = unbounded.
+    max_total_duration: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.jitter not in _JITTER_MODES:
+            raise ValueError(f"jitter must be one of {_JITTER_MODES}, got {self.jitter!r}")
+
+    @functools.cached_property
+    def _delay_schedule(self) -> Tuple[Optional[float], ...]:
+        """Capped exponential delays per attempt; the final attempt's entry is ``None``.
+
+        Computed once per (frozen) config instead of on every retried call.
+        """
+        return tuple(
+            min(self.delay_cap, self.delay_base**attempt) for attempt in range(self.max_attempts - 1)
+        ) + (None,)
 
     def delays(self) -> Iterable[float]:
-        for attempt in range(self.max_attempts - 1):
-            yield self.delay_base**attempt
+        """Return the deterministic (un-jittered) backoff delays between attempts."""
+        return self._delay_schedule[:-1]
+
+    def attempt_delays(self) -> Iterable[Optional[float]]:
+        """Return per-attempt delays with jitter applied, ending with ``None``.
+
+        With ``jitter="none"`` this is the precomputed schedule itself; jittered
+        modes draw fresh delays for each retried call.
+        """
+        if self.jitter == "none":
+            return self._delay_schedule
+        return self._jittered_delays()
+
+    def _jittered_delays(self) -> Iterator[Optional[float]]:
+        """Yield randomized delays so concurrent callers do not retry in lockstep."""
+        if self.jitter == "full":
+            for ceiling in self._delay_schedule[:-1]:
+                yield random.uniform(0.0, ceiling)  # nosec B311 - backoff jitter, not crypto
+        else:
+            prev = self.delay_base
+            for _ in range(self.max_attempts - 1):
+                prev = min(self.delay_cap, random.uniform(self.delay_base, prev * 3))  # nosec B311
+                yield prev
+        yield None
 
 
 DEFAULT_RETRY_CONFIG = RetryConfig()
@@ -48,54 +97,210 @@ def with_retry(max_attempts: int = 3, delay_base: float = 2.0):
     return retry(RetryConfig(max_attempts=max_attempts, delay_base=delay_base))
 
 
-def retry(config: RetryConfig = DEFAULT_RETRY_CONFIG):
+def retry_call(config: RetryConfig, func: Callable[..., T], *args, **kwargs) -> T:
+    """Invoke ``func(*args, **kwargs)`` under the standardized retry policy.
+
+    Functional form of :func:`retry` for hot paths that would otherwise build
+    a fresh decorator and wrapper per call; behavior is identical.
+    """
+    return _retry_call(config, None, func, args, kwargs)
+
+
+def _backoff(delay: float, token: CancellationToken | None, error: ProviderError) -> None:
+    """Sleep ``delay`` seconds, aborting with ``CANCELLED`` if ``token`` fires first."""
+    if token is None:
+        time.sleep(delay)
+    elif token.wait(delay):
+        raise _cancelled(token, error)
+
+
+async def _backoff_async(delay: float, token: CancellationToken | None, error: ProviderError) -> None:
+    """Await ``delay`` seconds; a cancelled ``token`` aborts before or after the sleep.
+
+    Tokens are thread-event based and cannot be awaited, so cancellation is
+    observed at the sleep boundaries; task cancellation interrupts the sleep itself.
+    """
+    if token is not None and token.cancelled:
+        raise _cancelled(token, error)
+    await asyncio.sleep(delay)
+    if token is not None and token.cancelled:
+        raise _cancelled(token, error)
+
+
+def _cancelled(token: CancellationToken, error: ProviderError) -> ProviderError:
+    """Build the ``CANCELLED`` error raised when ``token`` interrupts backoff."""
+    return ProviderError(
+        code=ErrorCode.CANCELLED,
+        message=token.reason or "cancelled during retry backoff",
+        provider=error.provider,
+        model=error.model,
+        raw=error,
+    )
+
+
+def _check_budget(deadline: float | None, delay: float, error: ProviderError) -> None:
+    """Raise ``TIMEOUT`` when the next attempt could not start before ``deadline``."""
+    if deadline is not None and deadline - time.monotonic() <= delay:
+        raise ProviderError(
+            code=ErrorCode.TIMEOUT,
+            message=f"retry budget exhausted: {error.message}",
+            provider=error.provider,
+            model=error.model,
+            raw=error,
+        )
+
+
+def _deadline(config: RetryConfig) -> float | None:
+    """Return the monotonic deadline for ``config``'s total budget, if any."""
+    budget = config.max_total_duration
+    return None if budget is None else time.monotonic() + budget
+
+
+def _log_attempt(
+    config: RetryConfig, attempt: int, delay: float | None, error: ProviderError | None
+) -> None:
+    """Report one attempt outcome to ``config.attempt_logger`` when configured."""
+    log = config.attempt_logger
+    if log is not None:
+        log(
+            attempt=attempt,
+            max_attempts=config.max_attempts,
+            delay=delay,
+            error=error,
+        )
+
+
+def _retry_delay(
+    config: RetryConfig,
+    delays: Iterator[Optional[float]],
+    attempt: int,
+    deadline: float | None,
+    error: ProviderError,
+) -> float:
+    """Log the failed ``attempt`` and return the backoff before the next one.
+
+    Re-raises ``error`` when it is not retryable or attempts are exhausted
+    (the final attempt's delay is ``None``), and raises ``TIMEOUT`` when the
+    next attempt would not fit the total budget.
+    """
+    delay = next(delays)
+    _log_attempt(config, attempt, delay, error)
+    if delay is None or error.code not in config.retryable_codes:
+        raise error
+    _check_budget(deadline, delay, error)
+    return delay
+
+
+def _retry_call(
+    config: RetryConfig,
+    token: CancellationToken | None,
+    func: Callable[..., T],
+    args: tuple,
+    kwargs: dict,
+) -> T:
+    """Shared synchronous retry loop; ``token`` makes backoff cancellable.
+
+    The first attempt runs before any schedule is built, so calls that
+    succeed outright pay only for the call itself and the optional log.
+    """
+    deadline = _deadline(config)
+    try:
+        result = func(*args, **kwargs)
+    except ProviderError as e:
+        error = e
+    else:
+        # Inline check: without a logger the success path makes no extra call.
+        if config.attempt_logger is not None:
+            _log_attempt(config, 0, None, None)
+        return result
+    delays = iter(config.attempt_delays())
+    attempt = 0
+    while True:
+        _backoff(_retry_delay(config, delays, attempt, deadline, error), token, error)
+        attempt += 1
+        try:
+            result = func(*args, **kwargs)
+        except ProviderError as e:
+            error = e
+            continue
+        _log_attempt(config, attempt, None, None)
+        return result
+
+
+async def retry_call_async(
+    config: RetryConfig, func: Callable[..., Awaitable[T]], *args, **kwargs
+) -> T:
+    """Await ``func(*args, **kwargs)`` under the standardized retry policy.
+
+    Async counterpart of :func:`retry_call`: identical attempt accounting and
+    logging, but backoff uses ``asyncio.sleep`` so the event loop is never
+    blocked between attempts.
+    """
+    return await _retry_call_async(config, None, func, args, kwargs)
+
+
+async def _retry_call_async(
+    config: RetryConfig,
+    token: CancellationToken | None,
+    func: Callable[..., Awaitable[T]],
+    args: tuple,
+    kwargs: dict,
+) -> T:
+    """Shared asynchronous retry loop mirroring :func:`_retry_call`."""
+    deadline = _deadline(config)
+    try:
+        result = await func(*args, **kwargs)
+    except ProviderError as e:
+        error = e
+    else:
+        # Inline check: without a logger the success path makes no extra call.
+        if config.attempt_logger is not None:
+            _log_attempt(config, 0, None, None)
+        return result
+    delays = iter(config.attempt_delays())
+    attempt = 0
+    while True:
+        await _backoff_async(_retry_delay(config, delays, attempt, deadline, error), token, error)
+        attempt += 1
+        try:
+            result = await func(*args, **kwargs)
+        except ProviderError as e:
+            error = e
+            continue
+        _log_attempt(config, attempt, None, None)
+        return result
+
+
+def retry(
+    config: RetryConfig = DEFAULT_RETRY_CONFIG,
+    *,
+    cancellation_token: CancellationToken | None = None,
+):
     """Return a decorator applying standardized retry policy.
 
     - Retries only on configured retryable error codes
-    - Exponential backoff using delay_base ** attempt
+    - Exponential backoff using delay_base ** attempt (capped, jittered per config)
     - Preserves original function signature
+    - With ``cancellation_token``, backoff waits end as soon as the token is
+      cancelled and a ``ProviderError`` with ``ErrorCode.CANCELLED`` is raised
+    - With ``config.max_total_duration``, a retry that could not start within
+      the budget raises ``ErrorCode.TIMEOUT`` instead of sleeping
+    - Coroutine functions get an ``async`` wrapper whose backoff awaits
+      ``asyncio.sleep``, so retries never block the event loop
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await _retry_call_async(config, cancellation_token, func, args, kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exc: ProviderError | None = None
-            for attempt, delay in enumerate(
-                list(config.delays()) + [None]
-            ):  # final attempt has delay None
-                try:
-                    result = func(*args, **kwargs)
-                    if config.attempt_logger:
-                        config.attempt_logger(
-                            attempt=attempt,
-                            max_attempts=config.max_attempts,
-                            delay=None,
-                            error=None,
-                        )
-                    return result
-                except ProviderError as e:
-                    last_exc = e
-                    # Log attempt outcome
-                    if config.attempt_logger:
-                        config.attempt_logger(
-                            attempt=attempt,
-                            max_attempts=config.max_attempts,
-                            delay=delay,
-                            error=e,
-                        )
-                    if (e.code in config.retryable_codes) and (delay is not None):
-                        time.sleep(delay)
-                        continue
-                    raise
-            # If we reach here without returning, last_exc must be set because either
-            # the wrapped function raised a ProviderError on every attempt, or we
-            # would have already returned. Use an explicit check instead of assert
-            # to avoid reliance on optimizable bytecode (Bandit B101).
-            if last_exc is None:  # pragma: no cover - defensive
-                raise RuntimeError(
-                    "retry: reached terminal state without captured exception"
-                )
-            raise last_exc
+            return _retry_call(config, cancellation_token, func, args, kwargs)
 
         return wrapper
 
@@ -106,5 +311,7 @@ __all__ = [
     "RetryConfig",
     "DEFAULT_RETRY_CONFIG",
     "retry",
+    "retry_call",
+    "retry_call_async",
     "with_retry",  # legacy alias
 ]
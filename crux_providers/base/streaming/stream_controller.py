@@ -8,6 +8,7 @@ importing the entire adapter implementation.
 """
 from __future__ import annotations
 
+from collections import deque
 from contextlib import suppress
 from typing import Iterator, Protocol, runtime_checkable
 
@@ -49,10 +50,16 @@ class StreamController:
         self._terminal_event: ChatStreamEvent | None = None
 
     def __iter__(self) -> Iterator[ChatStreamEvent]:  # pragma: no cover - delegation
-        for evt in self._adapter.run():
+        events = self._adapter.run()
+        for evt in events:
             if evt.finish:
                 self._finished = True
                 self._terminal_event = evt
+                yield evt
+                # Let the adapter finish its post-terminal bookkeeping (span
+                # metrics, cleanup) but never surface events after the terminal.
+                deque(events, maxlen=0)
+                return
             yield evt
 
     # API -----------------------------------------------------------------
@@ -13,7 +13,7 @@ from ..models import ChatResponse, ContentPart, ProviderMetadata
 from ..dto.structured_output import StructuredOutputDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatStreamEvent:
     """Represents an incremental delta from a streaming provider.
 
@@ -25,6 +25,10 @@ class ChatStreamEvent:
       finish: True on final event
       error: optional error string (finish implicitly True when error)
       raw: provider SDK chunk (optional for debugging)
+
+    Slotted because one instance is allocated per streamed token; instances
+    carry no ``__dict__`` and reject undeclared attributes. Not frozen, which
+    would slow construction in the hot path.
     """
 
     provider: str
@@ -46,28 +50,37 @@ def accumulate_events(events: Iterable[ChatStreamEvent]) -> ChatResponse:
     - If an error event is encountered, returns a ChatResponse with error metadata.
     - Metadata is minimal; providers can enrich later via a terminal event convention.
     """
-    events_list: List[ChatStreamEvent] = list(events)
-    if not events_list:
+    provider = model = None
+    text_parts: List[str] = []
+    append = text_parts.append
+    count = 0
+    # Single pass: the first event names the provider/model and the first
+    # error ends accumulation, since later events cannot change the outcome.
+    for evt in events:
+        count += 1
+        if provider is None:
+            provider, model = evt.provider, evt.model
+        if evt.error:
+            meta = ProviderMetadata(
+                provider_name=provider,
+                model_name=model,
+                extra={"stream_error": evt.error},
+            )
+            return ChatResponse(text=None, parts=None, raw=None, meta=meta)
+        delta = evt.delta  # one slot read; control frames stop at the truth test
+        if delta:
+            append(delta)
+
+    if not count:
         meta = ProviderMetadata(provider_name="unknown", model_name="unknown")
         return ChatResponse(text="", parts=None, raw=None, meta=meta)
 
-    provider = events_list[0].provider
-    model = events_list[0].model
-    if error_event := next((e for e in events_list if e.error), None):
-        meta = ProviderMetadata(
-            provider_name=provider,
-            model_name=model,
-            extra={"stream_error": error_event.error},
-        )
-        return ChatResponse(text=None, parts=None, raw=None, meta=meta)
-
-    text_parts: List[str] = [e.delta for e in events_list if e.delta]
     full_text = "".join(text_parts)
     parts = [ContentPart(type="text", text=full_text)] if full_text else None
     meta = ProviderMetadata(
         provider_name=provider,
         model_name=model,
-        extra={"stream_events": len(events_list)},
+        extra={"stream_events": count},
     )
     return ChatResponse(text=full_text, parts=parts, raw=None, meta=meta)
 
@@ -1,9 +1,10 @@
 """Base streaming adapter abstraction (moved into streaming package)."""
 from __future__ import annotations
 
-from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, TYPE_CHECKING
 from contextlib import suppress, ExitStack
-import time
+import sys
+from time import perf_counter
 
 from .streaming import ChatStreamEvent
 from ..logging import LogContext
@@ -14,8 +15,11 @@ from .streaming_metrics import StreamMetrics
 from ..tracing import start_span
 from .streaming_finalize import finalize_stream
 from .stream_controller import StreamController
+from .streaming_adapter_async import run_async
+from .streaming_coalesce import coalesce_text_events
 from .streaming_adapter_helpers import (
     attempt_start_with_timeout,
+    chunk_event,
     process_chunk,
     handle_midstream_error,
     handle_cancellation,
@@ -25,11 +29,15 @@ from .streaming_adapter_helpers import (
     coerce_stream_start_result,
     register_stream_cleanup,
     set_span_metrics,
+    is_logger_debug,
 )
 
 if TYPE_CHECKING:
     from ..dto.structured_output import StructuredOutputDTO
 
+# Stand-in polled by ``run()`` when no token is configured; never cancelled.
+_NEVER_CANCELLED = CancellationToken()
+
 
 class BaseStreamingAdapter:
     """Encapsulates provider streaming loop boilerplate."""
@@ -47,23 +55,47 @@ class BaseStreamingAdapter:
         logger,
         on_complete: Optional[Callable[[bool], None]] = None,
         cancellation_token: Optional[CancellationToken] = None,
+        async_starter: Optional[Callable[[], Awaitable[Any]]] = None,
+        batch_size: int = 1,
+        coalesce_window_ms: float = 0.0,
     ) -> None:
-        """Initialize the BaseStreamingAdapter with provider and streaming configuration."""
+        """Initialize the BaseStreamingAdapter with provider and streaming configuration.
+
+        ``batch_size`` > 1 opts into merging up to that many contiguous text
+        deltas into one event; ``coalesce_window_ms`` > 0 merges the deltas
+        arriving within that window (see ``streaming_coalesce``). Both trade
+        delivery latency for fewer events, so the defaults keep one event per delta.
+        """
         self.ctx = ctx
-        self.provider_name = provider_name
-        self.model = model
+        # Interned once per stream: every event carries these exact objects,
+        # so downstream equality checks short-circuit on identity.
+        self.provider_name = sys.intern(provider_name) if type(provider_name) is str else provider_name
+        self.model = sys.intern(model) if type(model) is str else model
         self._starter = starter
         self._translator = translator
         self._structured_translator = structured_translator
         self._retry_config_factory = retry_config_factory
         self._logger = logger
+        # Resolved once: per-delta debug logging is gated on this flag.
+        self._debug_enabled = is_logger_debug(self)
         self._on_complete = on_complete
         self._cancellation_token = cancellation_token
+        self._async_starter = async_starter
+        self._batch_size = batch_size
+        self._coalesce_window_s = coalesce_window_ms / 1000.0 if coalesce_window_ms > 0 else None
         self.metrics = StreamMetrics()
 
     def run(self) -> Iterator[ChatStreamEvent]:  # pragma: no cover - exercised indirectly
         """Execute the streaming lifecycle."""
-        t0 = time.perf_counter()
+        events = self._run_events()
+        if self._batch_size > 1 or self._coalesce_window_s is not None:
+            max_batch = self._batch_size if self._batch_size > 1 else sys.maxsize
+            return coalesce_text_events(events, max_batch, self._coalesce_window_s)
+        return events
+
+    def _run_events(self) -> Iterator[ChatStreamEvent]:  # pragma: no cover - exercised indirectly
+        """Drive the native stream and yield one event per translated chunk."""
+        t0 = perf_counter()
         with ExitStack() as stack, start_span("providers.stream.run") as span:
             with suppress(Exception):
                 span.set_attribute("provider", self.provider_name)
@@ -83,26 +115,22 @@ class BaseStreamingAdapter:
             register_stream_cleanup(stream, stack)
 
             first_emitted = False
+            # Without a token, poll a private never-cancelled one so the
+            # per-chunk check is a single attribute read with no None test.
+            token = self._cancellation_token or _NEVER_CANCELLED
+            to_event = chunk_event  # local binding for the per-chunk call
             try:
                 for chunk in stream:
-                    if self._cancellation_token is not None:
-                        try:
-                            self._cancellation_token.raise_if_cancelled()
-                        except CancelledError as ce:
-                            yield from self._handle_cancellation(ce, t0)
-                            return
-                    chunk_had_delta = False
-                    for evt in process_chunk(self, chunk, t0, first_emitted):
-                        chunk_had_delta = True
-                        yield evt
-                    if chunk_had_delta and not first_emitted:
+                    # Checked on every chunk: the read is cheaper than any
+                    # throttling counter and keeps cancellation latency at one chunk.
+                    if token.is_cancelled:
+                        token.raise_if_cancelled()
+                    evt = to_event(self, chunk, t0, first_emitted)
+                    if evt is not None:
                         first_emitted = True
-                if self._cancellation_token is not None:
-                    try:
-                        self._cancellation_token.raise_if_cancelled()
-                    except CancelledError as ce:
-                        yield from handle_cancellation(self, ce, t0)
-                        return
+                        yield evt
+                if token.is_cancelled:
+                    token.raise_if_cancelled()
             except CancelledError as ce:
                 with suppress(Exception):
                     span.set_attribute("cancelled", True)
@@ -118,6 +146,21 @@ class BaseStreamingAdapter:
             yield from finalize_success(self, t0)
             set_span_metrics(self, span)
 
+    def run_async(self) -> AsyncIterator[ChatStreamEvent]:
+        """Execute the streaming lifecycle over the ``async_starter`` stream.
+
+        Requires the adapter to be constructed with ``async_starter``; see
+        :func:`streaming_adapter_async.run_async` for semantics.
+        """
+        if self._async_starter is None:
+            raise ProviderError(
+                code=ErrorCode.INTERNAL,
+                message="run_async() requires an async_starter",
+                provider=self.provider_name,
+                model=self.model,
+            )
+        return run_async(self)
+
     # Backward-compat delegations retained within package
     def _attempt_start_with_timeout(self):
         return attempt_start_with_timeout(self)
@@ -0,0 +1,136 @@
+"""Async streaming lifecycle for ``BaseStreamingAdapter`` (within streaming package).
+
+Purpose:
+- Drive an SDK async stream (``async for``) through the same translation,
+  metrics, and terminal-event helpers used by the synchronous ``run()`` loop,
+  so async gateways do not need a worker thread per request.
+
+External dependencies:
+- None beyond the adapter's ``async_starter``; no direct network I/O.
+
+Fallback semantics:
+- Start failures and mid-stream errors are mapped to a single terminal error
+  event exactly like the synchronous path; cancellation maps to CANCELLED.
+
+Timeout strategy:
+- The start phase (including retries) is bounded by ``asyncio.wait_for`` using
+  ``get_timeout_config().start_timeout_seconds``. Mid-stream timing is not
+  enforced, matching the synchronous adapter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from time import perf_counter
+from contextlib import suppress
+from typing import Any, AsyncIterator
+
+from ..cancellation import CancelledError
+from ..errors import ErrorCode, ProviderError, classify_exception
+from ..resilience.retry import retry_call_async
+from ..timeouts import get_timeout_config
+from .streaming import ChatStreamEvent
+from .streaming_adapter_helpers import (
+    chunk_event,
+    coerce_stream_start_result,
+    finalize_success,
+    handle_cancellation,
+    handle_midstream_error,
+    terminal_error,
+)
+
+
+async def run_async(adapter) -> AsyncIterator[ChatStreamEvent]:
+    """Execute the streaming lifecycle over an async native stream.
+
+    Parameters:
+        adapter: A ``BaseStreamingAdapter`` constructed with ``async_starter``.
+
+    Yields:
+        Delta events followed by exactly one terminal event.
+    """
+    t0 = perf_counter()
+    try:
+        stream = await _start_async(adapter)
+    except ProviderError as e:
+        yield terminal_error(adapter, f"{e.code.value}:{e.message[:260]}")
+        return
+    except Exception as e:  # noqa: BLE001 - includes start-phase timeouts
+        code = classify_exception(e)
+        yield terminal_error(adapter, f"{code.value}:{str(e)[:260]}")
+        return
+
+    token = adapter._cancellation_token
+    first_emitted = False
+    try:
+        async for chunk in stream:
+            if token is not None and token.is_cancelled:
+                token.raise_if_cancelled()
+            evt = chunk_event(adapter, chunk, t0, first_emitted)
+            if evt is not None:
+                first_emitted = True
+                yield evt
+        if token is not None and token.is_cancelled:
+            token.raise_if_cancelled()
+    except CancelledError as ce:
+        for evt in handle_cancellation(adapter, ce, t0):
+            yield evt
+        return
+    except Exception as e:  # noqa: BLE001 - mapped to a terminal event
+        for evt in handle_midstream_error(adapter, e, t0):
+            yield evt
+        return
+    finally:
+        await _close_stream(stream)
+    for evt in finalize_success(adapter, t0):
+        yield evt
+
+
+async def _start_async(adapter) -> Any:
+    """Open the async stream under the start-phase timeout and retry policy."""
+    timeout_s = get_timeout_config().start_timeout_seconds
+    retry_cfg = adapter._retry_config_factory("stream.start")
+    try:
+        result = await asyncio.wait_for(
+            retry_call_async(retry_cfg, _invoke_async_starter, adapter),
+            timeout=timeout_s if timeout_s > 0 else None,
+        )
+    except asyncio.TimeoutError as e:
+        raise TimeoutError(f"operation exceeded {timeout_s}s") from e
+    stream, extra_meta = coerce_stream_start_result(result)
+    if extra_meta and (req_id := extra_meta.get("request_id")) and not adapter.ctx.request_id:
+        adapter.ctx.request_id = req_id
+    return stream
+
+
+async def _invoke_async_starter(adapter) -> Any:
+    """Await the adapter's async starter, classifying raw exceptions."""
+    try:
+        return await adapter._async_starter()
+    except ProviderError:
+        raise
+    except Exception as e:  # noqa: BLE001 - classified for uniform retry handling
+        code = classify_exception(e)
+        raise ProviderError(
+            code=code,
+            message=str(e),
+            provider=adapter.provider_name,
+            model=adapter.model,
+            retryable=code in (ErrorCode.TRANSIENT, ErrorCode.RATE_LIMIT, ErrorCode.TIMEOUT),
+            raw=e,
+        ) from e
+
+
+async def _close_stream(stream: Any) -> None:
+    """Best-effort close of an async SDK stream (sync or async ``close``)."""
+    close_fn = getattr(stream, "close", None)
+    if not callable(close_fn):
+        return
+    with suppress(Exception):
+        result = close_fn()
+        if inspect.isawaitable(result):
+            await result
+
+
+__all__ = ["run_async"]
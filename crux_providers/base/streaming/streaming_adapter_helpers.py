@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import logging
 from contextlib import suppress, ExitStack
-from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Protocol, runtime_checkable, TYPE_CHECKING
-import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, TYPE_CHECKING
+from time import perf_counter
 
 from ..errors import ProviderError, classify_exception, ErrorCode
 from .streaming import ChatStreamEvent
@@ -15,6 +16,7 @@ from ..tracing import start_span
 if TYPE_CHECKING:
     from ..dto.structured_output import StructuredOutputDTO
 
+_LOG = logging.getLogger(__name__)
 
 def attempt_start_with_timeout(adapter) -> Tuple[bool, Optional[Iterable], Optional[ChatStreamEvent]]:
     """Start the provider stream under a start-phase timeout and retry policy."""
@@ -47,35 +49,46 @@ def attempt_start_with_timeout(adapter) -> Tuple[bool, Optional[Iterable], Optio
             return False, None, terminal_error(adapter, f"{code.value}:{str(e)[:260]}")
 
 
-def process_chunk(adapter, chunk, t0: float, first_emitted: bool) -> Iterator[ChatStreamEvent]:
-    """Translate a native chunk and yield an event if there is content.
+def chunk_event(adapter, chunk, t0: float, first_emitted: bool) -> Optional[ChatStreamEvent]:
+    """Translate a native chunk into an event, or ``None`` if it has no content.
 
     Behavior
     - Prefer a textual ``delta`` via ``adapter._translator``.
     - Optionally attach a ``StructuredOutputDTO`` via ``_structured_translator``.
     - Record time to first token on the first emission and increment metrics.
-    - No event is yielded when neither textual nor structured output exists.
+    - Returns ``None`` when neither textual nor structured output exists.
+
+    A plain function rather than a generator: each chunk yields at most one
+    event, so the streaming loops avoid a generator frame per chunk.
     """
-    _maybe_set_response_id_from_chunk(adapter, chunk, first_emitted)
+    # Pre-first-token work is guarded here so steady-state chunks skip the calls.
+    if not first_emitted:
+        _maybe_set_response_id_from_chunk(adapter, chunk, first_emitted)
     delta, structured = _extract_translations(adapter, chunk)
     if not delta and not structured:
-        return
-    _record_first_token_if_needed(adapter, t0, first_emitted)
-    adapter.metrics.emitted += 1
-    _log_delta_debug(adapter, delta)
-    yield ChatStreamEvent(
-        provider=adapter.provider_name,
-        model=adapter.model,
-        delta=delta,
-        structured=structured,
-        finish=False,
-    )
+        return None
+    metrics = adapter.metrics
+    if not first_emitted:
+        metrics.time_to_first_token_ms = (perf_counter() - t0) * 1000.0
+    metrics.emitted += 1
+    if adapter._debug_enabled:
+        _log_delta_debug(adapter, delta)
+    # Positional in field order (provider, model, delta, structured); ``finish``
+    # keeps its False default. Skips keyword matching on the per-delta path.
+    return ChatStreamEvent(adapter.provider_name, adapter.model, delta, structured)
+
+
+def process_chunk(adapter, chunk, t0: float, first_emitted: bool) -> Iterator[ChatStreamEvent]:
+    """Generator form of :func:`chunk_event` kept for existing callers."""
+    evt = chunk_event(adapter, chunk, t0, first_emitted)
+    if evt is not None:
+        yield evt
 
 
 def handle_midstream_error(adapter, exc: Exception, t0: float) -> Iterator[ChatStreamEvent]:
     """Handle an exception raised during iteration."""
     code = classify_exception(exc)
-    adapter.metrics.total_duration_ms = (time.perf_counter() - t0) * 1000.0
+    adapter.metrics.total_duration_ms = (perf_counter() - t0) * 1000.0
     yield terminal_error(adapter, f"{code.value}:{str(exc)[:260]}")
     if adapter._on_complete:
         with suppress(Exception):
@@ -84,7 +97,7 @@ def handle_midstream_error(adapter, exc: Exception, t0: float) -> Iterator[ChatS
 
 def handle_cancellation(adapter, exc, t0: float) -> Iterator[ChatStreamEvent]:
     """Map cooperative cancellation to a terminal CANCELLED event."""
-    adapter.metrics.total_duration_ms = (time.perf_counter() - t0) * 1000.0
+    adapter.metrics.total_duration_ms = (perf_counter() - t0) * 1000.0
     error_message = exc.args[0] if exc.args else "operation cancelled"
     yield terminal_error(adapter, f"{ErrorCode.CANCELLED.value}:{error_message[:260]}")
     if adapter._on_complete:
@@ -94,7 +107,7 @@ def handle_cancellation(adapter, exc, t0: float) -> Iterator[ChatStreamEvent]:
 
 def finalize_success(adapter, t0: float) -> Iterator[ChatStreamEvent]:
     """Emit a successful terminal event and finalize metrics."""
-    adapter.metrics.total_duration_ms = (time.perf_counter() - t0) * 1000.0
+    adapter.metrics.total_duration_ms = (perf_counter() - t0) * 1000.0
     yield finalize_stream(
         logger=adapter._logger,
         ctx=adapter.ctx,
@@ -129,7 +142,7 @@ def start_with_retry(adapter):
     retry_cfg = adapter._retry_config_factory("stream.start")
     from ..resilience.retry import retry  # local import to avoid cycles
 
-    return retry(retry_cfg)(_invoke)()
+    return retry(retry_cfg, cancellation_token=getattr(adapter, "_cancellation_token", None))(_invoke)()
 
 
 def terminal_error(adapter, error: str) -> ChatStreamEvent:
@@ -158,7 +171,14 @@ def coerce_stream_start_result(result) -> Tuple[Iterable, Dict[str, Any]]:
       raising. This avoids misclassifying a plain list of chunks as a
       `(stream, meta)` pair in tests and simple adapters.
     """
-    from ..errors import ProviderError  # local import to avoid import cycles
+    # Cheapest checks first: list/tuple is a C-level type test, while Mapping is
+    # an ABC check; plain stream iterators fall through both to the final return.
+    if isinstance(result, (tuple, list)):
+        if len(result) == 2:
+            stream_obj, meta = result
+            if isinstance(meta, Mapping):
+                return stream_obj, dict(meta)
+        return result, {}
     if isinstance(result, Mapping):
         stream_obj = result.get("stream")
         if stream_obj is None:
@@ -170,20 +190,26 @@ def coerce_stream_start_result(result) -> Tuple[Iterable, Dict[str, Any]]:
             )
         meta = {k: v for k, v in result.items() if k != "stream"}
         return stream_obj, meta
-    if isinstance(result, (tuple, list)) and len(result) == 2:
-        stream_obj, meta = result
-        return (stream_obj, dict(meta)) if isinstance(meta, Mapping) else (result, {})
     return result, {}
 
 
+def _safe_close(close_fn) -> None:
+    """Call ``close_fn`` and swallow any error (best-effort stream cleanup)."""
+    try:
+        close_fn()
+    except Exception as e:  # noqa: BLE001 - cleanup must never mask the stream outcome
+        _LOG.debug("stream close failed: %s", e)
+
+
 def register_stream_cleanup(stream, stack: ExitStack) -> None:
-    """Register best-effort cleanup callbacks for the native stream."""
+    """Register best-effort cleanup callbacks for the native stream.
+
+    ``close_fn`` is passed to the module-level ``_safe_close`` as a callback
+    argument, so no closure is created per stream start.
+    """
     close_fn = getattr(stream, "close", None)
     if callable(close_fn):
-        def _safe_close():  # noqa: D401 - simple internal callback
-            with suppress(Exception):
-                close_fn()
-        stack.callback(_safe_close)
+        stack.callback(_safe_close, close_fn)
 
 
 def set_span_metrics(adapter, span) -> None:
@@ -196,22 +222,15 @@ def set_span_metrics(adapter, span) -> None:
 
 # Internal helpers -----------------------------------------------------------
 
-@runtime_checkable
-class _HasResponseId(Protocol):
-    response_id: Optional[str]
-
-
 def _has_response_id(adapter) -> bool:
     """Return True if the adapter's ctx has a non-empty response_id.
 
     Defensive: tolerates ctx objects without the `response_id` attribute.
+    Uses a plain ``getattr``; a runtime-checkable Protocol ``isinstance``
+    would reflect over the protocol members on every call.
     """
     try:
-        ctx = adapter.ctx
-        if isinstance(ctx, _HasResponseId):  # type: ignore[misc]
-            return bool(ctx.response_id)
-        # Fallback best-effort
-        return bool(getattr(ctx, "response_id", None))
+        return bool(getattr(adapter.ctx, "response_id", None))
     except Exception:
         return False
 
@@ -231,7 +250,7 @@ def _get_chunk_id(chunk: Any) -> Optional[str]:
         return None
 
 
-def _is_logger_debug(adapter) -> bool:
+def is_logger_debug(adapter) -> bool:
     """Check whether adapter logger is in debug with minimal getattr usage."""
     try:
         logger = adapter._logger
@@ -251,9 +270,13 @@ def _maybe_set_response_id_from_chunk(adapter, chunk: Any, first_emitted: bool)
     """
     if first_emitted or _has_response_id(adapter):
         return
-    with suppress(Exception):
+    # Plain try/except rather than ``suppress``: this runs per chunk until the
+    # first emission and avoids a context-manager allocation each time.
+    try:
         if possible_id := _get_chunk_id(chunk):
             _set_response_id(adapter, possible_id)
+    except Exception as e:  # noqa: BLE001 - best-effort
+        _LOG.debug("response id extraction failed: %s", e)
 
 
 def _extract_translations(adapter, chunk: Any) -> Tuple[Optional[str], Optional["StructuredOutputDTO"]]:
@@ -262,47 +285,46 @@ def _extract_translations(adapter, chunk: Any) -> Tuple[Optional[str], Optional[
     Returns a tuple ``(delta, structured)`` where either may be ``None`` on
     translation failure or absence of configured translators.
     """
-    delta: Optional[str] = None
-    structured: Optional["StructuredOutputDTO"] = None
     try:
-        delta = adapter._translator(chunk)
+        delta: Optional[str] = adapter._translator(chunk)
     except Exception:
         delta = None
+    translator = adapter._structured_translator  # set once in the adapter's __init__
+    if translator is None:
+        return delta, None
     try:
-        translator = getattr(adapter, "_structured_translator", None)
-        if translator:
-            structured = translator(chunk)
+        structured: Optional["StructuredOutputDTO"] = translator(chunk)
     except Exception:
         structured = None
     return delta, structured
 
 
-def _record_first_token_if_needed(adapter, t0: float, first_emitted: bool) -> None:
-    """Set ``time_to_first_token_ms`` when the first content is emitted."""
-    if not first_emitted:
-        adapter.metrics.time_to_first_token_ms = (time.perf_counter() - t0) * 1000.0
-
-
 def _log_delta_debug(adapter, delta: Optional[str]) -> None:
-    """Emit a normalized debug event for the delta if debug logging is enabled."""
-    with suppress(Exception):
-        if _is_logger_debug(adapter):
-            from ..logging import normalized_log_event  # local import to avoid cycles
-            normalized_log_event(
-                adapter._logger,
-                "stream.delta",
-                adapter.ctx,
-                phase="mid_stream",
-                attempt=None,
-                emitted=True,
-                tokens=None,
-                error_code=None,
-                delta_len=len(delta) if isinstance(delta, str) else None,
-            )
+    """Emit a normalized debug event for the delta.
+
+    Callers gate on ``adapter._debug_enabled`` (resolved once per adapter), so
+    the non-debug path never reaches this function.
+    """
+    try:
+        from ..logging import normalized_log_event  # local import to avoid cycles
+        normalized_log_event(
+            adapter._logger,
+            "stream.delta",
+            adapter.ctx,
+            phase="mid_stream",
+            attempt=None,
+            emitted=True,
+            tokens=None,
+            error_code=None,
+            delta_len=len(delta) if isinstance(delta, str) else None,
+        )
+    except Exception as e:  # noqa: BLE001 - logging must never break streaming
+        _LOG.debug("stream.delta log failed: %s", e)
 
 
 __all__ = [
     "attempt_start_with_timeout",
+    "chunk_event",
     "process_chunk",
     "handle_midstream_error",
     "handle_cancellation",
@@ -312,4 +334,5 @@ __all__ = [
     "coerce_stream_start_result",
     "register_stream_cleanup",
     "set_span_metrics",
+    "is_logger_debug",
 ]
@@ -0,0 +1,81 @@
+"""Coalescing of contiguous text deltas in a stream of ``ChatStreamEvent``.
+
+Purpose:
+- Merge runs of small text-only deltas into a single event so consumers pay
+  per-event overhead (dispatch, allocation, accumulation) once per batch
+  instead of once per provider token.
+
+External dependencies:
+- None beyond the streaming DTOs; no I/O.
+
+Fallback semantics:
+- Only plain text deltas merge: events carrying ``structured`` output, an
+  ``error`` or ``finish=True`` flush the pending text first and then pass
+  through unchanged, so event ordering and the single terminal event are
+  preserved. The concatenated text equals the unmerged deltas joined.
+- Merged events keep the provider/model of the run and drop ``raw``.
+
+Timeout strategy:
+- No blocking of its own. Pending text is held until the batch fills, the
+  optional window elapses (checked as deltas arrive) or a non-text event
+  arrives; with a blocking native stream this delays delivery by up to
+  ``max_batch - 1`` chunks, which is why coalescing is opt-in.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable, Iterator, List, Optional
+
+from .streaming import ChatStreamEvent
+
+
+def coalesce_text_events(
+    events: Iterable[ChatStreamEvent],
+    max_batch: int,
+    window_s: Optional[float] = None,
+) -> Iterator[ChatStreamEvent]:
+    """Yield ``events`` with contiguous text deltas merged.
+
+    A run is flushed once it holds ``max_batch`` deltas or, with ``window_s``,
+    once a delta arrives ``window_s`` seconds or more after the run started.
+    The window is only evaluated when events arrive, so it bounds how much
+    text a run collects, not how long a quiet stream holds it.
+    """
+    pending: List[ChatStreamEvent] = []
+    deadline = 0.0
+    for evt in events:
+        if evt.delta and evt.structured is None and evt.error is None and not evt.finish:
+            pending.append(evt)
+            if len(pending) >= max_batch:
+                yield _merge(pending)
+                pending = []
+            elif window_s is not None:
+                now = time.perf_counter()
+                if len(pending) == 1:
+                    deadline = now + window_s
+                elif now >= deadline:
+                    yield _merge(pending)
+                    pending = []
+            continue
+        if pending:
+            yield _merge(pending)
+            pending = []
+        yield evt
+    if pending:
+        yield _merge(pending)
+
+
+def _merge(pending: List[ChatStreamEvent]) -> ChatStreamEvent:
+    """Return one event carrying the joined text of ``pending``."""
+    if len(pending) == 1:
+        return pending[0]
+    first = pending[0]
+    return ChatStreamEvent(
+        provider=first.provider,
+        model=first.model,
+        delta="".join([e.delta for e in pending]),  # type: ignore[misc]
+    )
+
+
+__all__ = ["coalesce_text_events"]
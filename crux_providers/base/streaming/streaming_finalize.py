@@ -10,10 +10,23 @@ from typing import Optional, Dict, Any
 
 from .streaming import ChatStreamEvent
 from ..logging import LogContext, normalized_log_event
-from .streaming_metrics import StreamMetrics
+from .streaming_metrics import StreamMetrics, build_token_usage
 # Import the exporter module (not the symbol) so tests can monkeypatch
 # `get_default_exporter` on the module path and have it take effect here.
+# The payload class is never substituted, so it is bound directly.
 from ..metrics import exporter as metrics_exporter
+from ..metrics.exporter import StreamMetricsPayload
+
+
+def _metrics_export_flag() -> bool:
+    """Return whether ``PROVIDERS_METRICS_EXPORT`` enables metrics emission."""
+    val = os.getenv("PROVIDERS_METRICS_EXPORT", "")
+    return bool(val) and val.strip().lower() in ("1", "true")
+
+
+# Read once at import: the flag is process configuration, and finalize runs
+# once per stream. Tests toggle it by patching this attribute.
+_METRICS_EXPORT_ENABLED = _metrics_export_flag()
 
 
 def finalize_stream(
@@ -30,20 +43,11 @@ def finalize_stream(
     if error and ":" in error:
         error_code = error.split(":", 1)[0].strip() or None
 
-    if metrics.tokens is not None:
-        tokens_payload: Dict[str, Any] = metrics.tokens
-    else:
-        tokens_payload = {
-            "prompt": metrics.prompt_tokens,
-            "completion": metrics.completion_tokens,
-            "total": metrics.total_tokens
-            if metrics.total_tokens is not None
-            else (
-                (metrics.prompt_tokens + metrics.completion_tokens)
-                if (metrics.prompt_tokens is not None and metrics.completion_tokens is not None)
-                else None
-            ),
-        }
+    tokens_payload: Dict[str, Any] = metrics.tokens
+    if tokens_payload is None:
+        tokens_payload = build_token_usage(
+            metrics.prompt_tokens, metrics.completion_tokens, metrics.total_tokens
+        )
 
     normalized_log_event(
         logger,
@@ -60,10 +64,10 @@ def finalize_stream(
         error=error,
     )
     # Feature-flagged external metrics emission (best-effort, never raises)
-    if os.getenv("PROVIDERS_METRICS_EXPORT", "0").strip() in {"1", "true", "True"}:
+    if _METRICS_EXPORT_ENABLED:
         try:
             exporter = metrics_exporter.get_default_exporter()
-            payload = metrics_exporter.StreamMetricsPayload(
+            payload = StreamMetricsPayload(
                 provider=provider,
                 model=model,
                 emitted_count=metrics.emitted,
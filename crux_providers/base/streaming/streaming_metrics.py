@@ -8,11 +8,12 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamMetrics:
     """Collected streaming metrics for a single provider invocation.
 
-    See original module docstring for detailed field semantics.
+    See original module docstring for detailed field semantics. Slotted: one
+    instance exists per stream and its counters are updated per chunk.
     """
 
     emitted: int = 0
@@ -34,12 +35,14 @@ def build_token_usage(prompt: Optional[int], completion: Optional[int], total: O
 
 def apply_token_usage(metrics: StreamMetrics, *, prompt: Optional[int], completion: Optional[int], total: Optional[int] = None) -> None:
     """Populate token usage fields on a :class:`StreamMetrics` instance."""
+    derived_total = total
+    if derived_total is None and prompt is not None and completion is not None:
+        derived_total = prompt + completion
     metrics.prompt_tokens = prompt
     metrics.completion_tokens = completion
-    metrics.total_tokens = total if total is not None else (
-        (prompt + completion) if (prompt is not None and completion is not None) else None
-    )
-    metrics.tokens = build_token_usage(metrics.prompt_tokens, metrics.completion_tokens, metrics.total_tokens)
+    metrics.total_tokens = derived_total
+    # Same shape as ``build_token_usage``; built inline to derive the total once.
+    metrics.tokens = {"prompt": prompt, "completion": completion, "total": derived_total}
 
 
 def validate_token_usage(
@@ -69,10 +72,11 @@ def validate_token_usage(
     ) and metrics.prompt_tokens + metrics.completion_tokens != metrics.total_tokens:
         return _fail("total_tokens mismatch: expected prompt+completion == total")
 
-    if metrics.tokens is not None:
-        required = {"prompt", "completion", "total"}
-        if set(metrics.tokens.keys()) != required:
-            return _fail(f"tokens mapping keys mismatch: {sorted(metrics.tokens.keys())}")
+    tokens = metrics.tokens
+    if tokens is not None and (
+        len(tokens) != 3 or "prompt" not in tokens or "completion" not in tokens or "total" not in tokens
+    ):
+        return _fail(f"tokens mapping keys mismatch: {sorted(tokens.keys())}")
 
     return True, None
 
@@ -22,6 +22,8 @@ get_timeout_config()
         PT_TIMEOUT_STREAM_SECONDS
         PT_TIMEOUT_HTTP_SECONDS
         PT_TIMEOUT_OVERALL_SECONDS
+        PT_TIMEOUT_INIT_SECONDS (defaults to the start timeout)
+        PT_TIMEOUT_FIRST_TOKEN_SECONDS (defaults to the start timeout)
         PROVIDER_STREAM_START_TIMEOUT (legacy compatibility alias for START)
 
 operation_timeout(seconds)
@@ -67,12 +69,31 @@ class TimeoutConfig:
             REST calls that are not streaming).
         overall_timeout_seconds: Optional absolute cap for an end-to-end
             request (currently informative / future use).
+        init_timeout_seconds: Budget for the local init sub-phase of a start
+            (SDK client construction, parameter assembly). Defaults to
+            ``start_timeout_seconds``.
+        first_token_timeout_seconds: Budget for the remote sub-phase of a
+            start (the ``create`` call until the first byte). Defaults to
+            ``start_timeout_seconds``.
+
+    ``start_timeout_seconds`` remains the cap for the whole start phase; the
+    two sub-phase budgets let a slow cold-start init use that headroom without
+    loosening the bound on a hung first-byte read.
     """
 
     start_timeout_seconds: float = 30.0
     stream_timeout_seconds: float = 60.0
     http_timeout_seconds: float = 30.0
     overall_timeout_seconds: float | None = None
+    init_timeout_seconds: float | None = None
+    first_token_timeout_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        """Default the start sub-phase budgets to the start timeout."""
+        if self.init_timeout_seconds is None:
+            object.__setattr__(self, "init_timeout_seconds", self.start_timeout_seconds)
+        if self.first_token_timeout_seconds is None:
+            object.__setattr__(self, "first_token_timeout_seconds", self.start_timeout_seconds)
 
 
 _CACHED: TimeoutConfig | None = None
@@ -117,6 +138,8 @@ def get_timeout_config() -> TimeoutConfig:
             os.getenv("PT_TIMEOUT_START_SECONDS", ""),
             os.getenv("PROVIDERS_START_TIMEOUT_SECONDS", ""),
             os.getenv("PROVIDER_STREAM_START_TIMEOUT", ""),
+            os.getenv("PT_TIMEOUT_INIT_SECONDS", ""),
+            os.getenv("PT_TIMEOUT_FIRST_TOKEN_SECONDS", ""),
         ]
     )
     if _CACHED is not None and _ENV_GUARD_START == cur_guard:
@@ -133,12 +156,16 @@ def get_timeout_config() -> TimeoutConfig:
     stream = _parse_env_float("PT_TIMEOUT_STREAM_SECONDS", 60.0)
     http = _parse_env_float("PT_TIMEOUT_HTTP_SECONDS", 30.0)
     overall = _parse_env_float("PT_TIMEOUT_OVERALL_SECONDS", None)
+    init = _parse_env_float("PT_TIMEOUT_INIT_SECONDS", start)
+    first_token = _parse_env_float("PT_TIMEOUT_FIRST_TOKEN_SECONDS", start)
 
     _CACHED = TimeoutConfig(
         start_timeout_seconds=float(start),
         stream_timeout_seconds=float(stream),
         http_timeout_seconds=float(http),
         overall_timeout_seconds=float(overall) if overall is not None else None,
+        init_timeout_seconds=float(init),
+        first_token_timeout_seconds=float(first_token),
     )
     _ENV_GUARD_START = cur_guard
     return _CACHED
@@ -0,0 +1,48 @@
+"""JSON decoding helper that prefers ``orjson`` when it is installed.
+
+Purpose:
+- Provide a single ``loads_json`` used on hot parsing paths (e.g. streamed
+  tool-call arguments) so they benefit from ``orjson``'s faster decoder and
+  its direct ``bytes`` input without each call site handling the import.
+
+External dependencies:
+- Optional ``orjson`` (``pip install crux-providers[json]``). Without it the
+  standard library ``json`` module is used.
+
+Fallback semantics:
+- Inputs ``orjson`` rejects but the stdlib accepts (``NaN``/``Infinity``)
+  are retried with ``json.loads``. Invalid JSON raises ``ValueError`` in both
+  cases (``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``).
+- Known difference: ``orjson`` decodes integers wider than 64 bits as
+  ``float`` instead of ``int``.
+
+Timeout strategy:
+- Not applicable; decoding is pure CPU work.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Decode ``data`` (``str`` or UTF-8 ``bytes``) into Python objects.
+
+    Raises:
+        ValueError: When ``data`` is not valid JSON.
+    """
+    if orjson is None:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+__all__ = ["loads_json"]
@@ -52,6 +52,45 @@ def extract_system_and_user(messages: List[Message]) -> Tuple[Optional[str], str
     character limit. See ``crux_providers.utils.input_size_guard`` for configuration.
     - Function is otherwise pure (no I/O, no side effects).
     """
+    fast = _single_turn(messages)
+    if fast is not None:
+        system_message, users_joined = fast
+    else:
+        system_message, users_joined = _collect_system_and_users(messages)
+    # Optional condensation when enabled by ENV flags and a positive max.
+    if users_joined and _GUARD_ENABLED:
+        eff_max = _MAX_INPUT_CHARS
+        if eff_max > 0 and len(users_joined) > eff_max:
+            users_joined = condense_text_to_limit(users_joined, eff_max)
+    return system_message, users_joined
+
+
+def _single_turn(messages: List[Message]) -> Optional[Tuple[Optional[str], str]]:
+    """Return ``(system, user)`` for the common ``[user]``/``[system, user]`` shapes.
+
+    Applies only when the user content is a single-line string, where the
+    line-wise sanitization reduces to ``strip()``. Returns ``None`` for any
+    other shape so the caller falls back to the general loop.
+    """
+    n = len(messages)
+    if n == 0 or n > 2:
+        return None
+    user = messages[-1]
+    if not isinstance(user, Message) or user.role != "user":
+        return None
+    content = user.content
+    if not isinstance(content, str) or "\n" in content:
+        return None
+    if n == 1:
+        return None, content.strip()
+    system = messages[0]
+    if not isinstance(system, Message) or system.role != "system":
+        return None
+    return system.text_or_joined(), content.strip()
+
+
+def _collect_system_and_users(messages: List[Message]) -> Tuple[Optional[str], str]:
+    """General path: first system message plus sanitized, joined user lines."""
     system_message: Optional[str] = None
     user_segments: List[str] = []
     for m in messages:
@@ -65,12 +104,6 @@ def extract_system_and_user(messages: List[Message]) -> Tuple[Optional[str], str
             for seg in text.split("\n"):
                 if trimmed := seg.strip():
                     user_segments.append(trimmed)
-    users_joined = "\n".join(user_segments)
-    # Optional condensation when enabled by ENV flags and a positive max.
-    if users_joined and _GUARD_ENABLED:
-        eff_max = _MAX_INPUT_CHARS
-        if eff_max > 0 and len(users_joined) > eff_max:
-            users_joined = condense_text_to_limit(users_joined, eff_max)
-    return system_message, users_joined
+    return system_message, "\n".join(user_segments)
 
 __all__ = ["extract_system_and_user"]
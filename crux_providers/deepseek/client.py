@@ -11,9 +11,10 @@ from __future__ import annotations
 from typing import Any, Optional
 
 try:
-    from openai import OpenAI  # type: ignore
+    from openai import AsyncOpenAI, OpenAI  # type: ignore
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
 
 from ..base.interfaces import HasDefaultModel
 from ..base.logging import get_logger
@@ -76,4 +77,14 @@ class DeepseekProvider(BaseOpenAIStyleProvider, HasDefaultModel):
         """
         return OpenAI(api_key=self._api_key, base_url=self._base_url)  # type: ignore[arg-type]
 
+    def _make_async_client(self):
+        """Create an ``AsyncOpenAI`` client for Deepseek, or ``None`` if unavailable.
+
+        Enables the native ``chat_async``/``stream_chat_async`` path inherited
+        from the base class.
+        """
+        if AsyncOpenAI is None:
+            return None
+        return AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)  # type: ignore[arg-type]
+
     # All behavior for chat/stream is inherited from BaseOpenAIStyleProvider.
@@ -38,11 +38,12 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 # NOTE: Local import to avoid circular dependency during module graph import.
-from ...service.db import _get_conn  # type: ignore  # internal usage acceptable
+from ...service.db import _get_conn, _open_dedicated_conn  # type: ignore  # internal usage acceptable
 
 __all__ = [
     "save_models_snapshot",
     "load_models_snapshot",
+    "load_models_rows",
     "list_providers",
 ]
 
@@ -194,6 +195,7 @@ def _json_dump(obj: Any) -> str:
 
 # --------------------------- DB write helpers ---------------------------
 
+
 def _clear_provider_models(cur: sqlite3.Cursor, provider: str) -> None:
     """Remove existing rows for a provider prior to snapshot insert.
 
@@ -225,17 +227,20 @@ def _insert_model_rows(cur: sqlite3.Cursor, provider: str, models: Any) -> None:
 
     Side Effects
     ------------
-    Executes INSERT statements per row; no commit is performed here.
+    Executes a single ``executemany`` INSERT over all rows; no commit is
+    performed here.
     """
-    for m in models or []:
-        mid, name, family, ctx_int, caps, updated = _normalize_model_entry(m)
-        cur.execute(
-            """
-            INSERT INTO model_registry(provider, model_id, name, family, context_length, capabilities, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (provider, mid, name, family, ctx_int, _json_dump(caps), updated),
-        )
+    rows = (
+        (provider, mid, name, family, ctx_int, _json_dump(caps), updated)
+        for mid, name, family, ctx_int, caps, updated in map(_normalize_model_entry, models or [])
+    )
+    cur.executemany(
+        """
+        INSERT INTO model_registry(provider, model_id, name, family, context_length, capabilities, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
 
 
 def _upsert_registry_meta(
@@ -305,26 +310,38 @@ def save_models_snapshot(
 
     Side Effects
     ------------
-    Executes DELETE, INSERT, and UPSERT operations on SQLite tables and commits
-    the transaction via the shared connection accessor.
+    Executes DELETE, a batched INSERT, and UPSERT operations inside a single
+    ``BEGIN IMMEDIATE`` transaction and commits it. On failure the transaction
+    is rolled back so the previous snapshot stays intact. The transaction runs
+    on a dedicated connection: the shared connection is used by other threads'
+    autocommit writers, whose commits or rollbacks would otherwise publish or
+    discard a half-written snapshot. Concurrent snapshot writers serialize on
+    SQLite's write lock (``busy_timeout``).
 
     Failure Modes
     -------------
     Propagates SQLite errors to the caller. Higher layers may treat this as
     best-effort and suppress failures when appropriate.
     """
-    conn = _get_conn()
-    cur = conn.cursor()
-    _clear_provider_models(cur, provider)
-    _insert_model_rows(cur, provider, models)
-    _upsert_registry_meta(
-        cur, provider, fetched_at=fetched_at, fetched_via=fetched_via, metadata=metadata
-    )
-    conn.commit()
+    with contextlib.closing(_open_dedicated_conn()) as conn:
+        cur = conn.cursor()
+        # Connections run in autocommit mode; without an explicit transaction
+        # every row would be its own commit (and WAL sync).
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            _clear_provider_models(cur, provider)
+            _insert_model_rows(cur, provider, models)
+            _upsert_registry_meta(
+                cur, provider, fetched_at=fetched_at, fetched_via=fetched_via, metadata=metadata
+            )
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
 
 
-def load_models_snapshot(provider: str) -> Dict[str, Any]:
-    """Load provider model registry snapshot from SQLite.
+def load_models_rows(provider: str) -> Dict[str, Any]:
+    """Load a provider snapshot as raw ``model_registry`` rows plus meta fields.
 
     Parameters
     ----------
@@ -334,14 +351,15 @@ def load_models_snapshot(provider: str) -> Dict[str, Any]:
     Returns
     -------
     Dict[str, Any]
-        Snapshot payload with keys: ``provider``, ``models`` (list of dicts),
-        and meta fields (``fetched_at``, ``fetched_via``, ``metadata``). Returns
-        an empty dict if no snapshot exists for the provider.
+        Payload with keys ``provider``, ``rows`` (tuples of ``model_id, name,
+        family, context_length, capabilities_json, updated_at`` ordered by
+        name) and meta fields (``fetched_at``, ``fetched_via``, ``metadata``).
+        Returns an empty dict if no snapshot exists for the provider.
 
-    Failure Modes
-    -------------
-    Propagates SQLite errors. Malformed JSON in capabilities or metadata is
-    guarded and returned as raw payloads to avoid cascading failures.
+    Notes
+    -----
+    Capabilities are left JSON-encoded so callers building typed objects can
+    decode them once without an intermediate dict per model.
     """
     conn = _get_conn()
     cur = conn.cursor()
@@ -357,8 +375,41 @@ def load_models_snapshot(provider: str) -> Dict[str, Any]:
     models_rows = cur.fetchall()
     if not meta_row and not models_rows:
         return {}
+    meta = {"fetched_at": None, "fetched_via": None, "metadata": {}}
+    if meta_row:
+        meta = {
+            "fetched_at": meta_row[1],
+            "fetched_via": meta_row[2],
+            "metadata": json.loads(meta_row[3]) if meta_row[3] else {},
+        }
+    return {"provider": provider, "rows": models_rows, **meta}
+
+
+def load_models_snapshot(provider: str) -> Dict[str, Any]:
+    """Load provider model registry snapshot from SQLite.
+
+    Parameters
+    ----------
+    provider:
+        Provider identifier to load.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Snapshot payload with keys: ``provider``, ``models`` (list of dicts),
+        and meta fields (``fetched_at``, ``fetched_via``, ``metadata``). Returns
+        an empty dict if no snapshot exists for the provider.
+
+    Failure Modes
+    -------------
+    Propagates SQLite errors. Malformed JSON in capabilities or metadata is
+    guarded and returned as raw payloads to avoid cascading failures.
+    """
+    snap = load_models_rows(provider)
+    if not snap:
+        return {}
     models: List[Dict[str, Any]] = []
-    for r in models_rows:
+    for r in snap.pop("rows"):
         caps: Any
         try:
             caps = json.loads(r[4]) if r[4] else {}
@@ -374,14 +425,8 @@ def load_models_snapshot(provider: str) -> Dict[str, Any]:
                 "updated_at": r[5],
             }
         )
-    meta = {"fetched_at": None, "fetched_via": None, "metadata": {}}
-    if meta_row:
-        meta = {
-            "fetched_at": meta_row[1],
-            "fetched_via": meta_row[2],
-            "metadata": json.loads(meta_row[3]) if meta_row[3] else {},
-        }
-    return {"provider": provider, "models": models, **meta}
+    snap["models"] = models
+    return snap
 
 
 def list_providers() -> List[str]:
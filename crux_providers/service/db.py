@@ -42,6 +42,25 @@ def _get_conn() -> sqlite3.Connection:
     return _conn
 
 
+def _open_dedicated_conn() -> sqlite3.Connection:
+    """Open a new configured connection to the current database file.
+
+    For multi-statement write transactions (e.g., model snapshots): running
+    them on the shared connection would let other threads' autocommit writes
+    commit or roll back a half-written transaction. The caller owns and must
+    close the returned connection.
+
+    Returns:
+        sqlite3.Connection: A fresh connection with the shared configuration.
+    """
+    if not _db_path:
+        raise RuntimeError("DB not initialized. Call init_db first.")
+    enable_explicit_datetime()
+    conn = _configured_sqlite_connection(_db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
 def _close_conn_safely() -> None:
     """Close the cached SQLite connection if it exists.
 
@@ -395,22 +414,25 @@ with contextlib.suppress(Exception):  # pragma: no cover - optional dependency
     from crux_providers.persistence.sqlite.model_registry_store import (  # type: ignore
         save_models_snapshot,
         load_models_snapshot,
+        load_models_rows,
         list_providers as _list_model_providers,
     )
     # Re-export to preserve backward compatibility for existing imports.
     globals()["save_models_snapshot"] = save_models_snapshot
     globals()["load_models_snapshot"] = load_models_snapshot
+    globals()["load_models_rows"] = load_models_rows
     globals()["list_model_providers"] = _list_model_providers
     # Help type checkers understand these are part of the module API.
     _existing_all = globals().get("__all__")
     if isinstance(_existing_all, list):
         _existing_all.extend(
-            ["save_models_snapshot", "load_models_snapshot", "list_model_providers"]
+            ["save_models_snapshot", "load_models_snapshot", "load_models_rows", "list_model_providers"]
         )  # type: ignore[misc]
     else:
         globals()["__all__"] = [
             "save_models_snapshot",
             "load_models_snapshot",
+            "load_models_rows",
             "list_model_providers",
         ]
 
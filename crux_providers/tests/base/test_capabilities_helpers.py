@@ -102,3 +102,41 @@ def test_apply_void_enrichment_preserves_existing_caps() -> None:
         enriched.get("system_message") == "custom-system",
         f"existing system_message should win over defaults: {enriched}",
     )
+
+
+def test_record_observation_once_skips_repeats(monkeypatch) -> None:
+    """Repeated identical observations hit the persistence layer only once."""
+    from crux_providers.base.capabilities import observed as _observed
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(_observed, "record_observation", lambda *a, **k: not calls.append(a))
+    monkeypatch.setattr(_observed, "_RECORDED", {})
+
+    for _ in range(3):
+        _observed.record_observation_once("p", "m", "streaming", True)
+    assert_true(len(calls) == 1, "identical observation persisted once")
+
+    _observed.record_observation_once("p", "m", "streaming", False)
+    assert_true(len(calls) == 2, "changed value is written through")
+
+
+def test_record_observation_once_retries_failed_write(monkeypatch) -> None:
+    """A failed write is not cached, so the next identical call writes through."""
+    from crux_providers.base.capabilities import observed as _observed
+
+    results = iter([False, True, True])
+    calls: list[tuple] = []
+
+    def _record(*args, **_kw):
+        calls.append(args)
+        return next(results)
+
+    monkeypatch.setattr(_observed, "record_observation", _record)
+    monkeypatch.setattr(_observed, "_RECORDED", {})
+
+    _observed.record_observation_once("p", "m", "streaming", True)
+    assert_true(("p", "m", "streaming") not in _observed._RECORDED, "failed write not cached")
+    _observed.record_observation_once("p", "m", "streaming", True)
+    _observed.record_observation_once("p", "m", "streaming", True)
+    assert_true(len(calls) == 2, "retried once after failure, then cached")
+
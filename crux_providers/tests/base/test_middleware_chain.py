@@ -86,3 +86,19 @@ def test_before_stream_runs_first() -> None:
     with suppress(StopIteration):
         next(evs)  # trigger path up to adapter creation
     assert_true(log[:2] == ["a:before_stream", "b:before_stream"], "before_stream ordering")
+
+
+class _Exploding(Middleware):
+    def before_chat(self, ctx, request):
+        raise ValueError("boom")
+
+    def after_chat(self, ctx, response):
+        raise ValueError("boom")
+
+
+def test_failing_middleware_is_isolated() -> None:
+    set_global_middleware(ChatMiddlewareChain(items=[_Exploding()]))
+    p = _make_provider()
+    r = p.chat(ChatRequest(model="m", messages=[]))
+    assert_true(r.text == "ok", "middleware exceptions fall back to the unmodified request/response")
+    set_global_middleware(ChatMiddlewareChain(items=[]))
@@ -82,3 +82,22 @@ def test_repository_applies_observed_capabilities(tmp_path: Path) -> None:
         m.capabilities.get("structured_streaming") is False,
         "structured_streaming merged false",
     )
+
+
+def test_repository_applies_observed_and_void_defaults_together(tmp_path: Path) -> None:
+    """Observed flags and Void defaults both land on profiled providers."""
+
+    provider = "openai"
+    _db.init_db(str(tmp_path / "providers.db"), str(tmp_path))
+    _write_models_db(
+        tmp_path,
+        provider,
+        {"models": [{"id": "m1", "name": "M1", "capabilities": {"tool_format": "custom"}}]},
+    )
+    _seed_observed_db(provider, {"m1": {"vision": True}})
+
+    snap = ModelRegistryRepository(providers_root=tmp_path).list_models(provider)
+    caps = snap.models[0].capabilities
+    assert_true(caps.get("vision") is True, "observed flag merged")
+    assert_true(caps.get("tool_format") == "custom", "existing key wins over defaults")
+    assert_true("system_message" in caps, "void default filled")
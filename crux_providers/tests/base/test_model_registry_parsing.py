@@ -0,0 +1,64 @@
+"""Unit tests for model registry payload parsing helpers."""
+
+from __future__ import annotations
+
+from crux_providers.base.repositories.model_registry import parsing
+from crux_providers.tests.utils import assert_true
+
+
+def test_extract_meta_and_raw_prefers_models_then_data() -> None:
+    """``models`` wins over ``data``; non-list values are ignored."""
+    meta, raw = parsing.extract_meta_and_raw({"source": "s", "models": [1], "data": [2], "other": 3})
+    assert_true(meta == {"source": "s"} and raw == [1], "models list selected")
+    _, raw = parsing.extract_meta_and_raw({"models": "bad", "data": [2]})
+    assert_true(raw == [2], "data used when models is not a list")
+    assert_true(parsing.extract_meta_and_raw({"models": None}) == ({}, []), "no list at all")
+    assert_true(parsing.extract_meta_and_raw(["a"]) == ({}, ["a"]), "plain list payload")
+    assert_true(parsing.extract_meta_and_raw("x") == ({}, []), "unsupported payload")
+
+
+def test_normalize_result_dict_keeps_string_provenance() -> None:
+    """Only string provenance fields override the defaults."""
+    models, meta = parsing.normalize_result("p", {"models": [{"id": "m"}], "source": "api", "fetched_at": 5})
+    assert_true([m.id for m in models] == ["m"], "models parsed")
+    assert_true(meta["source"] == "api" and isinstance(meta["fetched_at"], str), "non-string ignored")
+
+
+def test_model_from_dict_id_and_name_candidates() -> None:
+    """Identifier and name fall back through their candidate keys in order."""
+    m = parsing.model_from_dict("p", {"modelId": 7, "model_name": "Seven"})
+    assert_true((m.id, m.name) == ("7", "Seven"), "ints stringified; name candidate used")
+    m = parsing.model_from_dict("p", {"slug": "s", "name": ""})
+    assert_true((m.id, m.name) == ("s", "s"), "empty name falls back to id")
+    m = parsing.model_from_dict("p", {})
+    assert_true((m.id, m.name) == ("unknown", "unknown"), "no candidates")
+
+
+def test_model_from_dict_interns_repeated_strings() -> None:
+    """Provider, family and capability keys are shared across parsed models."""
+    rows = [
+        {"id": f"m{i}", "family": "".join(["fa", "m"]), "capabilities": {"".join(["vis", "ion"]): True}}
+        for i in range(2)
+    ]
+    a, b = (parsing.model_from_dict("".join(["pro", "v"]), r) for r in rows)
+    assert_true(a.provider is b.provider and a.family is b.family, "provider/family interned")
+    assert_true(next(iter(a.capabilities)) is next(iter(b.capabilities)), "capability keys interned")
+
+
+def test_registry_dtos_are_slotted() -> None:
+    """ModelInfo and ModelRegistrySnapshot carry no per-instance ``__dict__``."""
+    from crux_providers.base.models import ModelRegistrySnapshot
+
+    m = parsing.model_from_dict("p", {"id": "m"})
+    snap = ModelRegistrySnapshot(provider="p", models=[m])
+    assert_true(not hasattr(m, "__dict__") and not hasattr(snap, "__dict__"), "slotted dataclasses")
+    assert_true(snap.to_dict()["models"][0]["id"] == "m", "serialization unaffected")
+
+
+def test_model_from_row_decodes_capabilities_once() -> None:
+    """Registry rows map positionally; bad capability JSON is preserved raw."""
+    m = parsing.model_from_row("p", ("m1", None, "fam", 4096, '{"vision": true}', None))
+    assert_true((m.id, m.name, m.family, m.context_length) == ("m1", "m1", "fam", 4096), "columns mapped")
+    assert_true(m.capabilities == {"vision": True}, "capabilities decoded")
+    bad = parsing.model_from_row("p", ("m2", "M2", None, None, "{not json", None))
+    assert_true(bad.capabilities == {"raw": "{not json"}, "malformed JSON kept raw")
@@ -0,0 +1,106 @@
+"""Unit tests for model registry refresher discovery caching."""
+
+from __future__ import annotations
+
+import types
+
+from crux_providers.base.repositories.model_registry import refreshers
+from crux_providers.tests.utils import assert_true
+
+
+def test_import_provider_module_caches_hits_but_retries_misses(monkeypatch) -> None:
+    """A failed lookup is retried; once found, the module is served from cache."""
+    calls = []
+    found = types.ModuleType("late_refresher")
+    available = []
+
+    def _fake_import(name, package=None):
+        calls.append(name)
+        if available and name == "crux_providers.late.get_late_models":
+            return found
+        raise ImportError(name)
+
+    refreshers.clear_refresh_caches()
+    monkeypatch.setattr(refreshers, "import_module", _fake_import)
+    try:
+        assert_true(refreshers.import_provider_module("late") is None, "miss")
+        assert_true(len(calls) == 3, "all candidates tried")
+        available.append(True)  # e.g. optional dependency installed at runtime
+        assert_true(refreshers.import_provider_module("late") is found, "miss not cached")
+        attempts = len(calls)
+        assert_true(refreshers.import_provider_module("late") is found, "cached hit")
+        assert_true(len(calls) == attempts, "hit not re-imported")
+    finally:
+        refreshers.clear_refresh_caches()
+
+
+def test_find_refresh_function_cached_per_module() -> None:
+    """The entry point is resolved once per module object."""
+    mod = types.ModuleType("fake_refresher")
+    mod.fetch_models = lambda: []
+    fn = refreshers.find_refresh_function(mod)
+    mod.refresh_models = lambda: []
+    assert_true(refreshers.find_refresh_function(mod) is fn, "memoized entry point")
+    refreshers.clear_refresh_caches()
+    assert_true(refreshers.find_refresh_function(mod) is mod.refresh_models, "recomputed after clear")
+
+
+class _FakeResp:
+    status = 200
+
+    def __init__(self, body: bytes, headers: dict) -> None:
+        self._body = body
+        self.headers = headers
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+def test_fetch_ollama_tags_decodes_gzip_bytes(monkeypatch) -> None:
+    """Gzip-encoded tag listings are decompressed and decoded from bytes."""
+    import gzip
+
+    body = gzip.compress(b'{"models": [{"name": "llama3"}]}')
+    seen = {}
+
+    def _fake_urlopen(req, timeout=None):
+        seen["accept"] = req.get_header("Accept-encoding")
+        return _FakeResp(body, {"Content-Encoding": "gzip"})
+
+    monkeypatch.setattr(refreshers._urlreq, "urlopen", _fake_urlopen)
+    models = refreshers.refresh_via_ollama_cli(timeout=1)
+    assert_true([m.id for m in models] == ["llama3"], "models parsed from gzip payload")
+    assert_true(seen["accept"] == "gzip", "gzip requested")
+
+
+def test_ollama_base_parsed_once_per_env_value(monkeypatch) -> None:
+    """Base URL validation is memoized but follows ``OLLAMA_HOST`` changes."""
+    refreshers.clear_refresh_caches()
+    monkeypatch.setenv("OLLAMA_HOST", "127.0.0.1:11434/")
+    assert_true(refreshers._ollama_base() == "http://127.0.0.1:11434", "scheme added, slash trimmed")
+    refreshers._ollama_base()
+    assert_true(refreshers._validated_ollama_base.cache_info().hits == 1, "second call memoized")
+    monkeypatch.setenv("OLLAMA_HOST", "https://remote:1")
+    assert_true(refreshers._ollama_base() == "https://remote:1", "new env value honoured")
+    monkeypatch.setenv("OLLAMA_HOST", "file:///etc")
+    try:
+        refreshers._ollama_base()
+    except RuntimeError:
+        pass
+    else:  # pragma: no cover - defensive
+        raise AssertionError("unsafe scheme accepted")
+
+
+def test_models_from_ollama_payload_handles_mixed_entries() -> None:
+    """Homogeneous dict payloads and mixed lists yield the same names."""
+    fast = refreshers._models_from_ollama_payload({"models": [{"name": "a"}, {"size": 1}, {"name": "b"}]})
+    mixed = refreshers._models_from_ollama_payload({"models": [{"name": "a"}, "b", None, ""]})
+    assert_true([m.id for m in fast] == ["a", "b"], "nameless dicts skipped")
+    assert_true([m.id for m in mixed] == ["a", "b"], "string entries kept, falsy skipped")
+    assert_true(refreshers._models_from_ollama_payload({"models": "x"}) == [], "non-list ignored")
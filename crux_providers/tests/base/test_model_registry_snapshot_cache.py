@@ -0,0 +1,128 @@
+"""Tests for the in-memory snapshot cache in ``ModelRegistryRepository``."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from crux_providers.base.models import ModelInfo, ModelRegistrySnapshot
+from crux_providers.base.repositories.model_registry.repository import (
+    ModelRegistryRepository,
+)
+from crux_providers.base.repositories.model_registry import db_store
+from crux_providers.base.repositories.model_registry.repository_parts.model_registry_repository import (
+    EMPTY_SNAPSHOT_TTL_S,
+)
+from crux_providers.service import db as _db
+from crux_providers.tests.utils import assert_true
+
+
+def _snapshot(provider: str, *ids: str) -> ModelRegistrySnapshot:
+    models = [ModelInfo(id=i, name=i, provider=provider) for i in ids]
+    return ModelRegistrySnapshot(provider=provider, models=models, fetched_via="test")
+
+
+def test_list_models_served_from_cache_until_save(tmp_path: Path, monkeypatch) -> None:
+    """Repeated reads skip SQLite; ``save_snapshot`` invalidates the entry."""
+    _db.init_db(str(tmp_path / "providers.db"), str(tmp_path))
+    repo = ModelRegistryRepository(providers_root=tmp_path)
+    repo.save_snapshot(_snapshot("cachey", "m1"))
+
+    loads = []
+    original = db_store.load_snapshot_rows_from_db
+    monkeypatch.setattr(db_store, "load_snapshot_rows_from_db", lambda p: loads.append(p) or original(p))
+
+    first = repo.list_models("cachey")
+    first.models.clear()
+    second = repo.list_models("Cachey")
+    assert_true(len(loads) == 1, "second read served from cache")
+    assert_true([m.id for m in second.models] == ["m1"], "cached models list isolated from callers")
+
+    repo.save_snapshot(_snapshot("cachey", "m1", "m2"))
+    third = repo.list_models("cachey")
+    assert_true(len(loads) == 2, "save invalidated cache")
+    assert_true([m.id for m in third.models] == ["m1", "m2"], "fresh snapshot after save")
+
+
+def test_empty_miss_is_not_pinned(tmp_path: Path) -> None:
+    """An empty result is held for at most ``EMPTY_SNAPSHOT_TTL_S`` seconds."""
+    _db.init_db(str(tmp_path / "providers.db"), str(tmp_path))
+    repo = ModelRegistryRepository(providers_root=tmp_path)
+    before = time.monotonic()
+    assert_true(repo.list_models("absent").models == [], "empty snapshot on miss")
+    expires_at, _, _ = repo._snap_cache["absent"]
+    assert_true(expires_at - before <= EMPTY_SNAPSHOT_TTL_S + 0.5, "short TTL for empty misses")
+
+    repo._snap_cache["absent"] = (before, *repo._snap_cache["absent"][1:])
+    ModelRegistryRepository(providers_root=tmp_path).save_snapshot(_snapshot("absent", "m1"))
+    assert_true([m.id for m in repo.list_models("absent").models] == ["m1"], "expired miss reloaded")
+
+
+def test_recorded_observation_invalidates_cached_enrichment(tmp_path: Path, monkeypatch) -> None:
+    """Observations are loaded once and reloaded after a new recording."""
+    from crux_providers.base.capabilities import record_observation
+    from crux_providers.base.repositories.model_registry.repository_parts import (
+        model_registry_repository as mod,
+    )
+
+    _db.init_db(str(tmp_path / "providers.db"), str(tmp_path))
+    repo = ModelRegistryRepository(providers_root=tmp_path)
+    repo.save_snapshot(_snapshot("obsy", "m1"))
+
+    loads = []
+    original = mod.load_observed
+    monkeypatch.setattr(mod, "load_observed", lambda *a: loads.append(a) or original(*a))
+    repo.list_models("obsy")
+    repo._snap_cache.clear()
+    repo.list_models("obsy")
+    assert_true(len(loads) == 1, "observed mapping reused across snapshot reloads")
+
+    record_observation("obsy", "m1", "vision", True)
+    caps = repo.list_models("obsy").models[0].capabilities
+    assert_true(len(loads) == 2 and caps.get("vision") is True, "new observation visible")
+
+
+def test_list_providers_coerces_model_counts(monkeypatch) -> None:
+    """Counts of any backend type are coerced without raising."""
+    rows = [
+        {"provider": "a", "model_count": 3, "metadata": {"aliases": ["x"]}},
+        {"provider": "b", "model_count": "4", "metadata": "raw"},
+        {"provider": "c", "model_count": float("nan")},
+        {"provider": "", "model_count": 1},
+    ]
+    monkeypatch.setattr(db_store, "list_providers_from_db", lambda: rows)
+    out = ModelRegistryRepository().list_providers()
+    assert_true([p["model_count"] for p in out] == [3, 4, 0], "counts coerced; empty id skipped")
+    assert_true(out[0]["aliases"] == ["x"] and out[1]["metadata"] == {"raw": "raw"}, "metadata normalized")
+
+
+def test_save_snapshot_skips_serialization_without_backend(monkeypatch) -> None:
+    """No model is serialized when the SQLite layer is unavailable."""
+    monkeypatch.setattr(db_store, "svcdb", None)
+
+    class _Exploding(ModelInfo):
+        def to_dict(self):  # pragma: no cover - must not be called
+            raise AssertionError("serialized without backend")
+
+    snap = ModelRegistrySnapshot(provider="p", models=[_Exploding(id="m", name="m", provider="p")])
+    ModelRegistryRepository().save_snapshot(snap)
+
+
+def test_save_through_one_instance_invalidates_other_readers(tmp_path: Path, monkeypatch) -> None:
+    """The cache is shared: per-call repositories hit it and see each other's saves."""
+    _db.init_db(str(tmp_path / "providers.db"), str(tmp_path))
+    ModelRegistryRepository().invalidate()
+    long_lived = ModelRegistryRepository(providers_root=tmp_path)
+    long_lived.save_snapshot(_snapshot("shared", "m1"))
+
+    loads = []
+    original = db_store.load_snapshot_rows_from_db
+    monkeypatch.setattr(db_store, "load_snapshot_rows_from_db", lambda p: loads.append(p) or original(p))
+
+    assert_true([m.id for m in long_lived.list_models("shared").models] == ["m1"], "initial snapshot")
+    ModelRegistryRepository(providers_root=tmp_path).list_models("shared")
+    assert_true(len(loads) == 1, "fresh instance served from the shared cache")
+
+    ModelRegistryRepository(providers_root=tmp_path).save_snapshot(_snapshot("shared", "m1", "m2"))
+    ids = [m.id for m in long_lived.list_models("shared").models]
+    assert_true(ids == ["m1", "m2"], "long-lived reader sees another instance's save")
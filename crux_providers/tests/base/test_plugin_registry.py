@@ -0,0 +1,90 @@
+"""Unit tests for PluginRegistry capability bookkeeping and lifecycle."""
+
+from __future__ import annotations
+
+import pytest
+
+from crux_providers.base.plugins.mcp import MCPPlugin
+from crux_providers.base.plugins.registry import PluginRegistry
+from crux_providers.tests.utils import assert_true
+
+
+class _FailingPlugin(MCPPlugin):
+    def initialize(self, config=None) -> None:
+        raise RuntimeError("boom")
+
+
+def test_capabilities_track_register_and_unregister() -> None:
+    """Capabilities stay present while any provider remains registered."""
+    reg = PluginRegistry()
+    reg.register(MCPPlugin("a", "1", ["mcp", "memory"]))
+    reg.register(MCPPlugin("b", "1", ["mcp"]))
+    assert_true(reg.get_capabilities() == frozenset({"mcp", "memory"}), "union of capabilities")
+    assert_true([p.metadata.name for p in reg.find_by_capability("mcp")] == ["a", "b"], "both provide mcp")
+
+    reg.unregister("a")
+    assert_true(reg.get_capabilities() == frozenset({"mcp"}), "memory dropped with its only provider")
+    assert_true(reg.find_by_capability("memory") == [], "no provider left for memory")
+
+    reg.shutdown_all()
+    assert_true(reg.get_capabilities() == frozenset(), "empty after shutdown")
+
+
+def test_failed_initialization_leaves_no_capabilities() -> None:
+    """A plugin whose initialize() fails is rolled back without indexing."""
+    reg = PluginRegistry()
+    with pytest.raises(RuntimeError):
+        reg.register(_FailingPlugin("bad", "1", ["docs"]))
+    assert_true(reg.get("bad") is None, "plugin rolled back")
+    assert_true(reg.get_capabilities() == frozenset(), "no capabilities recorded")
+
+
+def test_find_by_capability_returns_independent_lists() -> None:
+    """Callers may mutate the returned list without corrupting the index."""
+    reg = PluginRegistry()
+    plugin = MCPPlugin("a", "1", ["mcp"])
+    reg.register(plugin)
+    found = reg.find_by_capability("mcp")
+    found.clear()
+    assert_true(reg.find_by_capability("mcp") == [plugin], "index unaffected by caller mutation")
+
+
+def test_plugin_metadata_is_slotted_with_tuple_capabilities() -> None:
+    """PluginMetadata carries no per-instance ``__dict__``; capabilities are a tuple."""
+    meta = MCPPlugin("a", "1", ["mcp", "docs"]).metadata
+    assert_true(not hasattr(meta, "__dict__"), "slotted dataclass")
+    assert_true(meta.capabilities == ("mcp", "docs"), "capabilities normalized to tuple")
+    assert_true(MCPPlugin("b", "1").metadata.capabilities == ("mcp",), "default capability")
+
+
+def test_register_skips_info_payload_when_disabled() -> None:
+    """No INFO record is emitted for registration when INFO is disabled."""
+    reg = PluginRegistry()
+    calls = []
+    reg.logger = type("_L", (), {"isEnabledFor": lambda *_: False, "info": lambda *a, **k: calls.append(a)})()
+    reg.register(MCPPlugin("a", "1"))
+    reg.unregister("a")
+    assert_true(calls == [], "info never called")
+
+
+def test_register_reports_missing_dependencies() -> None:
+    """Unsatisfied dependencies are listed in order; satisfied ones register."""
+    reg = PluginRegistry()
+    reg.register(MCPPlugin("base", "1"))
+    dependent = MCPPlugin("child", "1")
+    dependent.metadata.dependencies = ["base", "x", "y"]
+    with pytest.raises(ValueError, match=r"\['x', 'y'\]"):
+        reg.register(dependent)
+    dependent.metadata.dependencies = ["base"]
+    reg.register(dependent)
+    assert_true(reg.get("child") is dependent, "registered once dependencies are met")
+
+
+def test_get_capabilities_reuses_snapshot_until_change() -> None:
+    """The same frozenset is returned until the registry changes."""
+    reg = PluginRegistry()
+    reg.register(MCPPlugin("a", "1", ["mcp"]))
+    first = reg.get_capabilities()
+    assert_true(reg.get_capabilities() is first, "cached snapshot reused")
+    reg.register(MCPPlugin("b", "1", ["docs"]))
+    assert_true(reg.get_capabilities() == frozenset({"mcp", "docs"}), "rebuilt after register")
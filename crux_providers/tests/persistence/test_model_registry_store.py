@@ -45,3 +45,117 @@ def test_save_and_load_snapshot_roundtrip():
     raw_entry = [m for m in model_list if m["id"] == "raw-string-model"]
     if not raw_entry:
         raise AssertionError("Raw string model not normalized into snapshot")
+
+
+def test_failed_snapshot_save_rolls_back(monkeypatch):
+    svcdb._reset_db_for_tests()  # type: ignore  # test-only internal helper
+    tmpdir = tempfile.TemporaryDirectory()
+    svcdb.init_db(os.path.join(tmpdir.name, "providers.db"), tmpdir.name)
+
+    store.save_models_snapshot("rollback-provider", [{"id": "keep"}], fetched_via="api")
+
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("meta write failed")
+
+    monkeypatch.setattr(store, "_upsert_registry_meta", _boom)
+    try:
+        store.save_models_snapshot("rollback-provider", [{"id": "new-1"}, {"id": "new-2"}])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Expected the failing save to raise")
+
+    ids = [m["id"] for m in store.load_models_snapshot("rollback-provider")["models"]]
+    if ids != ["keep"]:
+        raise AssertionError(f"Expected previous snapshot to survive rollback, got {ids}")
+    if svcdb._get_conn().in_transaction:  # type: ignore
+        raise AssertionError("Transaction left open after rollback")
+
+
+def test_concurrent_save_survives_other_threads_rollback(monkeypatch):
+    """A save racing a failing save is not rolled back with it."""
+    import threading
+
+    svcdb._reset_db_for_tests()  # type: ignore  # test-only internal helper
+    tmpdir = tempfile.TemporaryDirectory()
+    svcdb.init_db(os.path.join(tmpdir.name, "providers.db"), tmpdir.name)
+
+    original_meta = store._upsert_registry_meta
+    failing_started = threading.Event()
+    other_done = threading.Event()
+
+    def _meta(cur, provider, **kwargs):
+        if provider == "failing":
+            failing_started.set()
+            other_done.wait(0.5)  # with the lock held, the other save cannot finish
+            raise RuntimeError("meta write failed")
+        return original_meta(cur, provider, **kwargs)
+
+    monkeypatch.setattr(store, "_upsert_registry_meta", _meta)
+
+    def _failing_save() -> None:
+        try:
+            store.save_models_snapshot("failing", [{"id": "x"}])
+        except RuntimeError:
+            pass
+
+    def _other_save() -> None:
+        store.save_models_snapshot("other", [{"id": "keep-1"}, {"id": "keep-2"}])
+        other_done.set()
+
+    failing = threading.Thread(target=_failing_save)
+    failing.start()
+    if not failing_started.wait(5):
+        raise AssertionError("failing save never started")
+    other = threading.Thread(target=_other_save)
+    other.start()
+    failing.join(5)
+    other.join(5)
+
+    ids = sorted(m["id"] for m in store.load_models_snapshot("other")["models"])
+    if ids != ["keep-1", "keep-2"]:
+        raise AssertionError(f"Concurrent snapshot lost to another thread's rollback: {ids}")
+
+
+def test_snapshot_transaction_is_isolated_from_shared_connection_writers(monkeypatch):
+    """Observed-capability upserts neither publish nor lose a racing snapshot."""
+    import threading
+    import time
+
+    from crux_providers.persistence.sqlite import observed_capabilities_store as obs
+
+    svcdb._reset_db_for_tests()  # type: ignore  # test-only internal helper
+    tmpdir = tempfile.TemporaryDirectory()
+    svcdb.init_db(os.path.join(tmpdir.name, "providers.db"), tmpdir.name)
+    store.save_models_snapshot("racy", [{"id": "old"}], fetched_via="api")
+
+    original_meta = store._upsert_registry_meta
+    seen_mid_tx = []
+
+    def _upsert_observed() -> None:
+        obs.upsert_observation("racy", "old", "vision", True, "2024-01-01T00:00:00+00:00")
+
+    writer = threading.Thread(target=_upsert_observed)
+
+    def _meta(cur, provider, **kwargs):
+        # Rows are deleted and re-inserted but not committed at this point.
+        seen_mid_tx.append([m["id"] for m in store.load_models_snapshot("racy")["models"]])
+        writer.start()
+        time.sleep(0.1)  # let the other writer race the open transaction
+        raise RuntimeError("meta write failed")
+
+    monkeypatch.setattr(store, "_upsert_registry_meta", _meta)
+    try:
+        store.save_models_snapshot("racy", [{"id": "new-1"}, {"id": "new-2"}])
+    except RuntimeError:
+        pass
+    writer.join(10)
+    monkeypatch.setattr(store, "_upsert_registry_meta", original_meta)
+
+    if seen_mid_tx != [["old"]]:
+        raise AssertionError(f"Half-written snapshot visible to shared-connection readers: {seen_mid_tx}")
+    ids = [m["id"] for m in store.load_models_snapshot("racy")["models"]]
+    if ids != ["old"]:
+        raise AssertionError(f"Failed snapshot was not rolled back cleanly: {ids}")
+    if obs.load_observed_mapping("racy") != {"old": {"vision": True}}:
+        raise AssertionError("Concurrent observed-capability write was lost")
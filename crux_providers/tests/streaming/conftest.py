@@ -8,6 +8,12 @@ import time
 from typing import List
 import pytest
 
+from crux_providers.base.streaming import (
+    streaming_adapter,
+    streaming_adapter_async,
+    streaming_adapter_helpers,
+)
+
 # Simple mutable clock fixture
 def pytest_addoption(parser):  # pragma: no cover - hook
     pass
@@ -24,6 +30,9 @@ def fake_clock(monkeypatch):
     def advance(ms: float):
         state["t"] += ms / 1000.0
     monkeypatch.setattr(time, "perf_counter", perf_counter)
+    # The adapter modules bind ``perf_counter`` at import; patch those names too.
+    for module in (streaming_adapter, streaming_adapter_async, streaming_adapter_helpers):
+        monkeypatch.setattr(module, "perf_counter", perf_counter)
     return type("Clock", (), {"advance": staticmethod(advance)})
 
 @pytest.fixture()
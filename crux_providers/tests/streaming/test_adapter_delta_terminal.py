@@ -80,3 +80,111 @@ def test_streaming_emits_non_empty_delta():
     # Basic metric sanity (emitted count matches)
     if adapter.metrics.emitted != len(deltas):
         raise AssertionError("Emitted metric mismatch")
+
+
+def test_streaming_events_share_interned_provider_and_model():
+    """Every event carries the adapter's interned provider/model objects."""
+    import sys
+
+    model = "".join(["m", "1"])  # built at runtime so it is not already interned
+    adapter = BaseStreamingAdapter(
+        ctx=LogContext(provider="dummy", model=model),
+        provider_name="dummy",
+        model=model,
+        starter=_dummy_starter,
+        translator=_dummy_translator,
+        retry_config_factory=_retry_cfg_factory,
+        logger=DummyLogger(),
+    )
+    events = list(adapter.run())
+
+    if adapter.model is not sys.intern("m1"):
+        raise AssertionError("Expected the adapter model to be interned")
+    if any(e.model is not adapter.model or e.provider is not adapter.provider_name for e in events):
+        raise AssertionError("Expected events to reuse the interned provider/model")
+
+
+def test_chunk_event_returns_single_event_or_none():
+    """``chunk_event`` maps content to one event and empty chunks to None."""
+    from crux_providers.base.streaming.streaming_adapter_helpers import chunk_event
+
+    adapter = BaseStreamingAdapter(
+        ctx=LogContext(provider="dummy", model="m1"),
+        provider_name="dummy",
+        model="m1",
+        starter=_dummy_starter,
+        translator=_dummy_translator,
+        retry_config_factory=_retry_cfg_factory,
+        logger=DummyLogger(),
+    )
+    if chunk_event(adapter, "", 0.0, False) is not None:
+        raise AssertionError("Expected no event for an empty chunk")
+    evt = chunk_event(adapter, "hi", 0.0, False)
+    if evt is None or evt.delta != "hi" or adapter.metrics.emitted != 1:
+        raise AssertionError("Expected one delta event and an emitted count of 1")
+    if (evt.provider, evt.model, evt.structured, evt.finish) != ("dummy", "m1", None, False):
+        raise AssertionError(f"Unexpected event fields: {evt!r}")
+
+
+def test_batch_size_coalesces_text_deltas():
+    """With ``batch_size`` the adapter merges contiguous deltas without losing text."""
+    from crux_providers.base.streaming import accumulate_events
+
+    adapter = BaseStreamingAdapter(
+        ctx=LogContext(provider="dummy", model="m1"),
+        provider_name="dummy",
+        model="m1",
+        starter=_dummy_starter,
+        translator=_dummy_translator,
+        retry_config_factory=_retry_cfg_factory,
+        logger=DummyLogger(),
+        batch_size=2,
+    )
+    events = list(adapter.run())
+    if [e.delta for e in events] != ["Hello", " world", None]:
+        raise AssertionError(f"Unexpected coalesced deltas: {[e.delta for e in events]}")
+    if not events[-1].finish or accumulate_events(events).text != "Hello world":
+        raise AssertionError("Expected a terminal event and the full text after coalescing")
+
+
+def test_coalesce_window_flushes_when_elapsed(monkeypatch):
+    """Deltas merge until one arrives after the window; other events flush first."""
+    from crux_providers.base.streaming import ChatStreamEvent
+    from crux_providers.base.streaming import streaming_coalesce
+
+    clock = iter([0.0, 0.001, 0.003, 10.0, 10.0])
+    monkeypatch.setattr(streaming_coalesce.time, "perf_counter", lambda: next(clock))
+
+    def _evt(delta, **kw):
+        return ChatStreamEvent(provider="p", model="m", delta=delta, **kw)
+
+    events = [_evt("a"), _evt("b"), _evt("c"), _evt("d"), _evt(None, finish=True)]
+    out = list(streaming_coalesce.coalesce_text_events(events, max_batch=99, window_s=0.002))
+    if [e.delta for e in out] != ["abc", "d", None]:
+        raise AssertionError(f"Unexpected windowed coalescing: {[e.delta for e in out]}")
+
+
+def test_register_stream_cleanup_swallows_close_errors(caplog):
+    """A raising ``close`` runs on unwind, is logged at debug, and is not re-raised."""
+    import logging
+
+    from contextlib import ExitStack
+
+    from crux_providers.base.streaming.streaming_adapter_helpers import register_stream_cleanup
+
+    calls: List[str] = []
+
+    class _Stream:
+        def close(self):
+            calls.append("close")
+            raise RuntimeError("close failed")
+
+    helpers_logger = "crux_providers.base.streaming.streaming_adapter_helpers"
+    with caplog.at_level(logging.DEBUG, logger=helpers_logger):
+        with ExitStack() as stack:
+            register_stream_cleanup(_Stream(), stack)
+            register_stream_cleanup(object(), stack)
+    if calls != ["close"]:
+        raise AssertionError(f"Expected a single close call, got {calls}")
+    if not any("close failed" in r.getMessage() for r in caplog.records):
+        raise AssertionError("Expected the swallowed close error to be logged at debug")
@@ -153,3 +153,27 @@ def test_cancel_idempotent_and_safe_post_completion() -> None:
     # Ensure terminal event remains success (no error introduced by cancel)
     if ctrl.error is not None:
         raise AssertionError("controller.error should remain None after post-finish cancel")
+
+
+def test_controller_stops_at_terminal_and_lets_adapter_finish() -> None:
+    """Proves that events after the terminal are dropped while the adapter still completes."""
+    print("TEST: Trailing events after finish are not surfaced")
+    state = {"completed": False}
+
+    class _TrailingAdapter:
+        _cancellation_token = None
+
+        def run(self) -> Iterator[ChatStreamEvent]:
+            yield ChatStreamEvent(provider="fake", model="m", delta="a")
+            yield ChatStreamEvent(provider="fake", model="m", delta=None, finish=True)
+            yield ChatStreamEvent(provider="fake", model="m", delta="late")
+            state["completed"] = True
+
+    ctrl = StreamController(_TrailingAdapter())
+    events = list(ctrl)
+    if [e.delta for e in events] != ["a", None]:
+        raise AssertionError("expected iteration to stop at the terminal event")
+    if not state["completed"]:
+        raise AssertionError("adapter post-terminal bookkeeping should still run")
+    if ctrl.terminal_event is not events[-1]:
+        raise AssertionError("terminal_event should be the finish event")
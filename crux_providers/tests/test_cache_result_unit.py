@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from crux_providers.base.resilience.cache import cache_result
+
+
+def test_cache_result_hits_and_lru_eviction():
+    calls = []
+
+    @cache_result(maxsize=2, ttl=None)
+    def f(x, y=0):
+        calls.append((x, y))
+        return x + y
+
+    assert f(1) == 1 and f(1) == 1  # nosec B101 test assertion
+    assert f(1, y=2) == 3 and f(1, y=2) == 3  # nosec B101 test assertion
+    assert calls == [(1, 0), (1, 2)]  # nosec B101 test assertion
+    f(1)  # refresh recency; (1, y=2) becomes least recently used
+    f(5)
+    f(1, y=2)
+    assert calls == [(1, 0), (1, 2), (5, 0), (1, 2)]  # nosec B101 test assertion
+
+
+def test_cache_result_ttl_and_unhashable_args(monkeypatch):
+    import time
+
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    calls = []
+
+    @cache_result(ttl=10)
+    def g(items):
+        calls.append(list(items))
+        return len(items)
+
+    assert g([1, 2]) == 2 and g([1, 2]) == 2  # nosec B101 test assertion
+    assert len(calls) == 1  # nosec B101 test assertion
+    now[0] += 11
+    g([1, 2])
+    assert len(calls) == 2  # nosec B101 test assertion
+
+
+def test_cache_result_nonpositive_ttl_disables_caching():
+    calls = []
+
+    @cache_result(ttl=0)
+    def h(x):
+        calls.append(x)
+        return x
+
+    h(1)
+    h(1)
+    assert calls == [1, 1]  # nosec B101 test assertion
+
+
+def test_cache_result_keys_distinguish_argument_types():
+    calls = []
+
+    @cache_result(ttl=None)
+    def k(x, flag=None):
+        calls.append(x)
+        return type(x).__name__
+
+    assert [k(1), k(1.0), k(True)] == ["int", "float", "bool"]  # nosec B101 test assertion
+    k(1, flag=1)
+    k(1, flag=True)
+    assert len(calls) == 5  # nosec B101 test assertion
@@ -39,3 +39,11 @@ def test_raise_if_cancelled_raises_custom_error():
     token.cancel("terminate")
     with pytest.raises(CancelledError):
         token.raise_if_cancelled()
+
+
+def test_is_cancelled_flag_tracks_cancel_and_cascade():
+    parent = CancellationToken()
+    child = parent.child()
+    assert parent.is_cancelled is False and child.is_cancelled is False  # nosec B101 - pytest assert in tests
+    parent.cancel("stop")
+    assert parent.is_cancelled is True and child.is_cancelled is True  # nosec B101 - pytest assert in tests
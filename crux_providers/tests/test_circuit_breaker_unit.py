@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from crux_providers.base.resilience.circuit_breaker import CircuitBreaker
+
+
+def test_breaker_opens_at_threshold_and_filters_candidates():
+    now = [0.0]
+    cb = CircuitBreaker(threshold=2, cooldown=10.0, clock=lambda: now[0])
+    assert cb.available(["a", "b"]) == ["a", "b"]  # nosec B101 test assertion
+
+    cb.record_failure("a")
+    assert cb.state("a") == "closed" and cb.allow("a")  # nosec B101 test assertion
+    cb.record_failure("a")
+    assert cb.state("a") == "open"  # nosec B101 test assertion
+    assert cb.available(["a", "b"]) == ["b"]  # nosec B101 test assertion
+
+
+def test_success_resets_consecutive_failures():
+    cb = CircuitBreaker(threshold=2, cooldown=10.0, clock=lambda: 0.0)
+    cb.record_failure("a")
+    cb.record_success("a")
+    cb.record_failure("a")
+    assert cb.state("a") == "closed"  # nosec B101 test assertion
+
+
+def test_half_open_probe_closes_or_reopens():
+    now = [0.0]
+    cb = CircuitBreaker(threshold=1, cooldown=5.0, clock=lambda: now[0])
+    cb.record_failure("a")
+    assert not cb.allow("a")  # nosec B101 test assertion
+
+    now[0] = 5.0
+    assert cb.state("a") == "half_open" and cb.allow("a")  # nosec B101 test assertion
+    cb.record_failure("a")
+    assert cb.state("a") == "open" and not cb.allow("a")  # nosec B101 test assertion
+
+    now[0] = 10.0
+    assert cb.allow("a")  # nosec B101 test assertion
+    cb.record_success("a")
+    assert cb.state("a") == "closed"  # nosec B101 test assertion
+
+
+def test_invalid_threshold_rejected():
+    with pytest.raises(ValueError):
+        CircuitBreaker(threshold=0)
+
+
+def test_half_open_admits_a_single_probe_until_result_or_expiry():
+    now = [0.0]
+    cb = CircuitBreaker(threshold=1, cooldown=5.0, clock=lambda: now[0])
+    cb.record_failure("a")
+
+    now[0] = 5.0
+    assert cb.allow("a")  # nosec B101 test assertion
+    assert not cb.allow("a") and cb.available(["a", "b"]) == ["b"]  # nosec B101 test assertion
+    cb.record_success("a")
+    assert cb.allow("a") and cb.allow("a")  # nosec B101 test assertion
+
+    cb.record_failure("a")
+    now[0] = 10.0
+    assert cb.allow("a") and not cb.allow("a")  # nosec B101 test assertion
+    now[0] = 15.0  # probe result never recorded; the lease expires
+    assert cb.allow("a") and not cb.allow("a")  # nosec B101 test assertion
@@ -28,3 +28,14 @@ def test_classify_heuristics():
     assert classify_exception(Exception("timed out waiting")) is ErrorCode.TIMEOUT  # nosec B101 - assert is appropriate in unit tests
     assert classify_exception(Exception("unsupported parameter")) is ErrorCode.UNSUPPORTED  # nosec B101 - assert is appropriate in unit tests
     assert classify_exception(Exception("random")) is ErrorCode.UNKNOWN  # nosec B101 - assert is appropriate in unit tests
+
+
+def test_classify_timeout_subclass_cached_by_type():
+    class _SdkTimeout(TimeoutError):
+        pass
+
+    assert classify_exception(_SdkTimeout("x")) is ErrorCode.TIMEOUT  # nosec B101 - assert is appropriate in unit tests
+    assert classify_exception(_SdkTimeout("rate limit")) is ErrorCode.TIMEOUT  # nosec B101 - assert is appropriate in unit tests
+    # Generic exceptions are never cached by type; message heuristics still apply
+    assert classify_exception(Exception("auth failed")) is ErrorCode.AUTH  # nosec B101 - assert is appropriate in unit tests
+    assert classify_exception(Exception("random")) is ErrorCode.UNKNOWN  # nosec B101 - assert is appropriate in unit tests
@@ -14,6 +14,7 @@ from typing import Mapping
 from crux_providers.base.logging import (
     REQUIRED_NORMALIZED_KEYS,
     _parse_level,  # type: ignore[attr-defined]
+    info_enabled,
     normalized_log_event,
     get_logger,
 )
@@ -83,3 +84,14 @@ def test_coerce_tokens_mapping_and_tuple_pairs():
     )
     payload = json.loads(handler.messages[-1])
     assert payload["tokens"] == {"a": 1, "b": 2}  # nosec B101
+
+
+def test_normalized_log_event_skips_when_info_disabled():
+    logger = get_logger("providers.test.logging3", json_mode=False)
+    handler = _ListHandler()
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.WARNING)
+
+    assert info_enabled(logger) is False  # nosec B101
+    normalized_log_event(logger, "chat.start", LogContext(provider="p", model="m"), phase="start")
+    assert handler.messages == []  # nosec B101
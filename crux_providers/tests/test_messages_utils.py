@@ -47,3 +47,16 @@ def test_extract_system_and_user_without_system_or_empty_segments():
     assert sys_msg is None
     # Structured text part without explicit text becomes a compact tag line
     assert users == "[text]\nHi"
+
+
+def test_extract_system_and_user_single_turn_matches_general_path():
+    """The ``[user]``/``[system, user]`` fast path sanitizes like the general loop."""
+    assert extract_system_and_user([Message(role="user", content="  Hi  ")]) == (None, "Hi")
+    assert extract_system_and_user(
+        [Message(role="system", content="S"), Message(role="user", content="Hi")]
+    ) == ("S", "Hi")
+    # Multi-line and non-system leading messages still take the general path
+    assert extract_system_and_user([Message(role="user", content="a\n\n b ")]) == (None, "a\nb")
+    assert extract_system_and_user(
+        [Message(role="assistant", content="x"), Message(role="user", content="Hi")]
+    ) == (None, "Hi")
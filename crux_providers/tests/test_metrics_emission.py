@@ -4,6 +4,7 @@ import json
 from typing import List
 
 from crux_providers.base.logging import LogContext, get_logger
+from crux_providers.base.streaming import streaming_finalize
 from crux_providers.base.streaming.streaming_finalize import finalize_stream
 from crux_providers.base.streaming.streaming_metrics import StreamMetrics, apply_token_usage
 from crux_providers.base.metrics.exporter import StreamMetricsPayload, MetricsExporter
@@ -21,6 +22,8 @@ class _CaptureExporter(MetricsExporter):
 
 def test_finalize_emits_metrics_when_flag_set(monkeypatch, capsys) -> None:
     monkeypatch.setenv("PROVIDERS_METRICS_EXPORT", "1")
+    # The flag is read at import; re-evaluate it under the patched environment.
+    monkeypatch.setattr(streaming_finalize, "_METRICS_EXPORT_ENABLED", streaming_finalize._metrics_export_flag())
     capture = _CaptureExporter()
 
     def _make_capture() -> MetricsExporter:
@@ -54,6 +57,8 @@ def test_finalize_emits_metrics_when_flag_set(monkeypatch, capsys) -> None:
 
 def test_finalize_logs_on_export_failure(monkeypatch, capsys) -> None:
     monkeypatch.setenv("PROVIDERS_METRICS_EXPORT", "1")
+    # The flag is read at import; re-evaluate it under the patched environment.
+    monkeypatch.setattr(streaming_finalize, "_METRICS_EXPORT_ENABLED", streaming_finalize._metrics_export_flag())
 
     class _FailExporter(MetricsExporter):
         def emit_stream_metrics(self, payload: StreamMetricsPayload) -> None:
@@ -88,3 +93,11 @@ def test_finalize_logs_on_export_failure(monkeypatch, capsys) -> None:
     payload = json.loads(data["msg"])  # nested payload
     assert payload["event"] == "metrics.export.error"  # nosec B101
     assert payload["failure_class"] == "RuntimeError"  # nosec B101
+
+
+def test_metrics_export_flag_parsing(monkeypatch) -> None:
+    for raw, expected in (("1", True), (" TRUE ", True), ("true", True), ("0", False), ("", False), ("yes", False)):
+        monkeypatch.setenv("PROVIDERS_METRICS_EXPORT", raw)
+        assert streaming_finalize._metrics_export_flag() is expected  # nosec B101
+    monkeypatch.delenv("PROVIDERS_METRICS_EXPORT")
+    assert streaming_finalize._metrics_export_flag() is False  # nosec B101
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from crux_providers.base.openai_style_parts.structured import translate_openai_structured_chunk
+from crux_providers.base.openai_style_parts.structured_stream import StreamingStructuredTranslator
 from crux_providers.base.dto.structured_output import StructuredOutputDTO
 
 
@@ -63,3 +64,135 @@ def test_translator_accepts_mapping_arguments():
     assert dto.function_call is not None  # nosec B101 - test assertion
     assert dto.function_call.name == 'sum'  # nosec B101 - test assertion
     assert dto.function_call.arguments == {"a": 1, "b": 2}  # nosec B101 - test assertion
+
+
+def _fragment(name=None, arguments=None):
+    return _Chunk([_Choice(_Delta([_Call(_Fn(name=name, arguments=arguments))]))])
+
+
+def test_streaming_translator_assembles_split_arguments():
+    tr = StreamingStructuredTranslator()
+    first = tr(_fragment(name="add", arguments='{"x": "a}'))
+    second = tr(_fragment(arguments='b", "y": [1, '))
+    final = tr(_fragment(arguments='2]}'))
+    assert first.partial == '{"x": "a}' and first.function_call is None  # nosec B101 - test assertion
+    assert second.metadata == {"function_name": "add"}  # nosec B101 - test assertion
+    assert final.function_call is not None  # nosec B101 - test assertion
+    assert final.function_call.name == "add"  # nosec B101 - test assertion
+    assert final.function_call.arguments == {"x": "a}b", "y": [1, 2]}  # nosec B101 - test assertion
+
+
+def test_streaming_translator_resets_after_completion_and_keeps_name_only():
+    tr = StreamingStructuredTranslator()
+    assert tr(_fragment(name="f")).metadata == {"function_name": "f"}  # nosec B101 - test assertion
+    assert tr(_fragment(arguments='{"a": 1}')).function_call.arguments == {"a": 1}  # nosec B101 - test assertion
+    # A new call under the same index starts from a fresh buffer without a name
+    dto = tr(_fragment(arguments='{"b": 2}'))
+    assert dto.function_call is None and dto.partial == '{"b": 2}'  # nosec B101 - test assertion
+    assert tr(_Chunk([])) is None  # nosec B101 - test assertion
+
+
+def test_translator_parses_bytes_arguments_without_decoding_first():
+    dto = translate_openai_structured_chunk(_fragment(name="add", arguments=b'{"x": 1}'))
+    assert dto.function_call.arguments == {"x": 1}  # nosec B101 - test assertion
+    partial = translate_openai_structured_chunk(_fragment(name="add", arguments=b'{"x"'))
+    assert partial.partial == '{"x"'  # nosec B101 - test assertion
+
+
+def test_loads_json_matches_stdlib_semantics():
+    import math
+
+    from crux_providers.base.utils.json_fast import loads_json
+
+    assert loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]}  # nosec B101 - test assertion
+    assert math.isnan(loads_json('{"n": NaN}')["n"])  # nosec B101 - stdlib-only literal still decodes
+    try:
+        loads_json('{"a":')
+    except ValueError:
+        pass
+    else:  # pragma: no cover - defensive
+        raise AssertionError("invalid JSON must raise ValueError")
+
+
+def test_translator_ignores_text_and_empty_chunks():
+    class _TextDelta:
+        tool_calls = None
+        content = "hi"
+
+    assert translate_openai_structured_chunk(_Chunk([_Choice(_TextDelta())])) is None  # nosec B101 - test assertion
+    assert translate_openai_structured_chunk(_Chunk([])) is None  # nosec B101 - test assertion
+    assert translate_openai_structured_chunk(object()) is None  # nosec B101 - test assertion
+
+
+def test_translator_mapping_arguments_are_not_aliased():
+    args = {"a": 1}
+    dto = translate_openai_structured_chunk(_fragment(name="f", arguments=args))
+    args["a"] = 2
+    assert dto.function_call.arguments == {"a": 1}  # nosec B101 - test assertion
+
+
+def test_translator_skips_decoding_obvious_partials(monkeypatch):
+    from crux_providers.base.openai_style_parts import structured as mod
+
+    calls = []
+    monkeypatch.setattr(mod, "loads_json", lambda data: calls.append(data) or {"ok": True})
+    assert translate_openai_structured_chunk(_fragment(name="f", arguments='{"a": ')).partial == '{"a": '  # nosec B101
+    assert translate_openai_structured_chunk(_fragment(name="f", arguments=b' "x"}')).partial == ' "x"}'  # nosec B101
+    assert calls == []  # nosec B101 - decoder never invoked for partials
+    dto = translate_openai_structured_chunk(_fragment(name="f", arguments=' {"a": 1} \n'))
+    assert dto.function_call is not None and len(calls) == 1  # nosec B101 - test assertion
+
+
+def test_streaming_translator_events_do_not_share_metadata():
+    tr = StreamingStructuredTranslator()
+    a = tr(_fragment(name="f", arguments='{"a": '))
+    b = tr(_fragment(arguments='1'))
+    a.metadata["mutated"] = True
+    assert b.metadata == {"function_name": "f"}  # nosec B101 - each event owns its metadata
+
+
+def test_streaming_translator_delegates_mapping_arguments():
+    dto = StreamingStructuredTranslator()(_fragment(name="sum", arguments={"a": 1}))
+    assert dto.function_call.name == "sum" and dto.function_call.arguments == {"a": 1}  # nosec B101
+
+
+def _dict_chunk(name=None, arguments=None, index=0):
+    fn = {"name": name, "arguments": arguments}
+    return {"choices": [{"delta": {"tool_calls": [{"index": index, "function": fn}]}}]}
+
+
+def test_translators_accept_decoded_dict_chunks():
+    dto = translate_openai_structured_chunk(_dict_chunk(name="add", arguments='{"x": 1}'))
+    assert dto.function_call.arguments == {"x": 1}  # nosec B101 - test assertion
+    assert translate_openai_structured_chunk({"choices": [{"delta": {"content": "hi"}}]}) is None  # nosec B101
+    tr = StreamingStructuredTranslator()
+    assert tr(_dict_chunk(name="add", arguments='{"x": ')).partial == '{"x": '  # nosec B101 - test assertion
+    assert tr(_dict_chunk(arguments="2}")).function_call.arguments == {"x": 2}  # nosec B101 - test assertion
+
+
+def test_batched_translation_emits_one_dto_per_call():
+    from crux_providers.base.openai_style_parts.structured_stream import translate_openai_structured_chunks
+
+    chunks = [
+        _dict_chunk(name="a", arguments='{"x"', index=0),
+        _dict_chunk(name="b", arguments='[', index=1),
+        _dict_chunk(arguments=": 1}", index=0),
+        _dict_chunk(arguments="1", index=1),
+        {"choices": [{"delta": {"content": "text"}}]},
+    ]
+    out = list(translate_openai_structured_chunks(chunks))
+    assert len(out) == 2  # nosec B101 - one final call, one flushed partial
+    assert out[0].function_call.name == "a" and out[0].function_call.arguments == {"x": 1}  # nosec B101
+    assert out[1].partial == "[1" and out[1].metadata == {"function_name": "b"}  # nosec B101
+
+
+def test_batched_translation_drops_invalid_and_empty_chunks():
+    from crux_providers.base.openai_style_parts.structured_stream import translate_openai_structured_chunks
+
+    chunks = [
+        _dict_chunk(name="bad", arguments={1: 2}, index=0),  # DTO validation error
+        _dict_chunk(arguments=5, index=1),  # untranslatable payload -> None
+        _dict_chunk(name="ok", arguments='{"y": 2}', index=2),
+    ]
+    out = list(translate_openai_structured_chunks(chunks))
+    assert len(out) == 1 and out[0].function_call.arguments == {"y": 2}  # nosec B101 - errors dropped, no None
@@ -9,6 +9,7 @@ import pytest
 
 from crux_providers.base.models import ChatRequest, Message
 from crux_providers.base.openai_style_parts.style_helpers import (
+    build_openai_messages,
     extract_openai_text,
     prepare_response_format,
     extract_messages_and_format,
@@ -41,6 +42,16 @@ def test_extract_openai_text_missing():
     assert extract_openai_text(_Bad()) == ""  # nosec B101 - test assertion
 
 
+def test_extract_openai_text_empty_and_partial_shapes():
+    import types
+
+    ns = types.SimpleNamespace
+    assert extract_openai_text(ns(choices=[])) == ""  # nosec B101 - test assertion
+    assert extract_openai_text(ns(choices={"x": 1})) == ""  # nosec B101 - non-indexable choices
+    assert extract_openai_text(ns(choices=[ns(message=None)])) == ""  # nosec B101 - test assertion
+    assert extract_openai_text(ns(choices=[ns(message=ns())])) == ""  # nosec B101 - test assertion
+
+
 def test_prepare_response_format_variants():
     req = ChatRequest(model="gpt-x", messages=[Message(role="user", content="x")], response_format="json_object")
     rf, structured = prepare_response_format(req)
@@ -71,6 +82,12 @@ def test_extract_messages_and_format():
     assert rf2 == {"type": "json_schema", "json_schema": {"foo": "bar"}} and is_struct2 is False  # nosec B101
 
 
+def test_build_openai_messages_shapes():
+    sys_only = ChatRequest(model="gpt-x", messages=[Message(role="system", content="s")])
+    assert build_openai_messages(sys_only) == [{"role": "system", "content": "s"}]  # nosec B101
+    assert build_openai_messages(ChatRequest(model="gpt-x", messages=[])) == []  # nosec B101
+
+
 def test_build_chat_params_minimal_and_options():
     req = ChatRequest(model="gpt-x", messages=[Message(role="user", content="u")], max_tokens=10, temperature=0.2, tools=[{"type": "function"}])
     params = build_chat_params("gpt-x", [{"role": "user", "content": "u"}], req, {"type": "json_object"})
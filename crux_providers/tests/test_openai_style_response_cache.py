@@ -0,0 +1,112 @@
+"""Unit tests for the opt-in OpenAI-style response cache.
+
+Covers:
+- Deterministic requests are served from cache with ``cache_hit`` metadata.
+- Sampling, tools, and schema requests bypass the cache.
+- Error responses are never stored; TTL expiry and LRU eviction apply.
+"""
+
+from __future__ import annotations
+
+import types
+
+from ..base.models import ChatRequest, ChatResponse, Message, ProviderMetadata
+from ..base.openai_style_parts import BaseOpenAIStyleProvider, ResponseCache, _ProviderInit
+
+
+class _CountingProvider(BaseOpenAIStyleProvider):
+    @property
+    def provider_name(self) -> str:
+        return "fake-cached"
+
+    def __init__(self, cache: ResponseCache | None) -> None:
+        super().__init__(
+            _ProviderInit(
+                api_key="k",
+                base_url=None,
+                default_model="m",
+                logger_name="providers.fake",
+                sdk_sentinel=object(),
+                response_cache=cache,
+            )
+        )
+        self.calls = 0
+
+    def _make_client(self):  # noqa: D401 - returns fake SDK client
+        def _create(**params):
+            self.calls += 1
+            msg = types.SimpleNamespace(content=f"answer-{self.calls}")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+
+        return types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=_create)))
+
+
+def _req(**kwargs) -> ChatRequest:
+    return ChatRequest(model="m", messages=[Message(role="user", content="hi")], **kwargs)
+
+
+def test_deterministic_request_served_from_cache():
+    p = _CountingProvider(ResponseCache())
+    first = p.chat(_req())
+    second = p.chat(_req())
+    assert p.calls == 1  # nosec B101 test assertion
+    assert second.text == first.text == "answer-1"  # nosec B101 test assertion
+    assert second.meta.latency_ms == 0.0  # nosec B101 test assertion
+    assert second.meta.extra.get("cache_hit") is True  # nosec B101 test assertion
+    assert "cache_hit" not in first.meta.extra  # nosec B101 test assertion
+
+
+def test_non_deterministic_requests_bypass_cache():
+    p = _CountingProvider(ResponseCache())
+    for req in (
+        _req(temperature=0.7),
+        _req(temperature=0.7),
+        _req(tools=[{"type": "function", "function": {"name": "f"}}]),
+        _req(json_schema={"type": "object"}),
+    ):
+        p.chat(req)
+    assert p.calls == 4  # nosec B101 test assertion
+
+
+def test_no_cache_configured_always_invokes():
+    p = _CountingProvider(None)
+    p.chat(_req())
+    p.chat(_req())
+    assert p.calls == 2  # nosec B101 test assertion
+
+
+def test_key_distinguishes_inputs():
+    k = ResponseCache.key_for
+    assert k("m", _req()) == k("m", _req(temperature=0.0))  # nosec B101 test assertion
+    assert k("m", _req()) != k("m2", _req())  # nosec B101 test assertion
+    assert k("m", _req()) != k("m", _req(max_tokens=5))  # nosec B101 test assertion
+    assert k("m", _req()) != k("m", _req(response_format="json_object"))  # nosec B101 test assertion
+
+
+def _resp(text: str, **extra) -> ChatResponse:
+    meta = ProviderMetadata(provider_name="p", model_name="m", latency_ms=12.0, extra=dict(extra))
+    return ChatResponse(text=text, parts=None, raw=None, meta=meta)
+
+
+def test_errors_not_stored_and_hits_are_isolated_copies():
+    cache = ResponseCache()
+    cache.put(b"err", _resp("", error="boom"))
+    assert cache.get(b"err") is None  # nosec B101 test assertion
+    cache.put(b"ok", _resp("x"))
+    hit = cache.get(b"ok")
+    hit.meta.extra["mutated"] = True
+    assert "mutated" not in cache.get(b"ok").meta.extra  # nosec B101 test assertion
+
+
+def test_ttl_expiry_and_lru_eviction():
+    expired = ResponseCache(ttl_seconds=0)
+    expired.put(b"a", _resp("a"))
+    assert expired.get(b"a") is None  # nosec B101 test assertion
+
+    lru = ResponseCache(maxsize=2)
+    lru.put(b"a", _resp("a"))
+    lru.put(b"b", _resp("b"))
+    assert lru.get(b"a") is not None  # nosec B101 test assertion
+    lru.put(b"c", _resp("c"))
+    assert lru.get(b"b") is None  # nosec B101 test assertion
+    assert lru.get(b"a") is not None  # nosec B101 test assertion
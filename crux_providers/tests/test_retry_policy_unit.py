@@ -7,6 +7,7 @@ from crux_providers.base.errors import ErrorCode, ProviderError
 from crux_providers.base.resilience.retry import (
     RetryConfig,
     retry,
+    retry_call,
 )
 
 
@@ -60,3 +61,122 @@ def test_retry_stops_on_non_retryable():
     assert ei.value.code is ErrorCode.VALIDATION  # nosec B101 - asserts are appropriate in unit tests
     # Should not exhaust all attempts because non-retryable
     assert flaky.calls == 1  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_retry_call_matches_decorator_semantics(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
+    cfg = RetryConfig(max_attempts=3, delay_base=1.0)
+    flaky = _Flaky(fail_times=1, code=ErrorCode.RATE_LIMIT)
+
+    assert retry_call(cfg, flaky) == "ok"  # nosec B101 - asserts are appropriate in unit tests
+    assert flaky.calls == 2  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_delay_schedule_precomputed_once():
+    cfg = RetryConfig(max_attempts=4, delay_base=2.0)
+    assert cfg._delay_schedule == (1.0, 2.0, 4.0, None)  # nosec B101 - asserts are appropriate in unit tests
+    assert cfg._delay_schedule is cfg._delay_schedule  # nosec B101 - asserts are appropriate in unit tests
+    assert list(cfg.delays()) == [1.0, 2.0, 4.0]  # nosec B101 - asserts are appropriate in unit tests
+    assert RetryConfig(max_attempts=1)._delay_schedule == (None,)  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_jitter_modes_bound_delays():
+    full = RetryConfig(max_attempts=4, delay_base=2.0)
+    delays = list(full.attempt_delays())
+    assert delays[-1] is None and len(delays) == 4  # nosec B101 - asserts are appropriate in unit tests
+    assert all(0.0 <= d <= c for d, c in zip(delays, (1.0, 2.0, 4.0)))  # nosec B101 - asserts are appropriate in unit tests
+
+    deco = RetryConfig(max_attempts=6, delay_base=1.0, jitter="decorrelated", delay_cap=5.0)
+    assert all(1.0 <= d <= 5.0 for d in list(deco.attempt_delays())[:-1])  # nosec B101 - asserts are appropriate in unit tests
+
+    fixed = RetryConfig(max_attempts=3, jitter="none")
+    assert fixed.attempt_delays() is fixed._delay_schedule  # nosec B101 - asserts are appropriate in unit tests
+    with pytest.raises(ValueError):
+        RetryConfig(jitter="bogus")  # type: ignore[arg-type]
+
+
+def test_cancelled_token_aborts_backoff():
+    import threading
+
+    from crux_providers.base.cancellation import CancellationToken
+
+    token = CancellationToken()
+    cfg = RetryConfig(max_attempts=3, delay_base=30.0, jitter="none", delay_cap=30.0)
+    flaky = _Flaky(fail_times=99, code=ErrorCode.TRANSIENT)
+    threading.Timer(0.05, token.cancel, args=("user abort",)).start()
+
+    started = time.monotonic()
+    with pytest.raises(ProviderError) as ei:
+        retry(cfg, cancellation_token=token)(flaky)()
+    assert ei.value.code is ErrorCode.CANCELLED  # nosec B101 - asserts are appropriate in unit tests
+    assert ei.value.message == "user abort"  # nosec B101 - asserts are appropriate in unit tests
+    assert time.monotonic() - started < 5.0  # nosec B101 - asserts are appropriate in unit tests
+    assert flaky.calls == 1  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_total_duration_budget_raises_timeout(monkeypatch):
+    clock = [100.0]
+    slept = []
+
+    def _sleep(delay):
+        slept.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", _sleep)
+    cfg = RetryConfig(max_attempts=5, delay_base=2.0, jitter="none", max_total_duration=2.5)
+    flaky = _Flaky(fail_times=99, code=ErrorCode.RATE_LIMIT)
+
+    with pytest.raises(ProviderError) as ei:
+        retry_call(cfg, flaky)
+    assert ei.value.code is ErrorCode.TIMEOUT  # nosec B101 - asserts are appropriate in unit tests
+    assert ei.value.raw.code is ErrorCode.RATE_LIMIT  # nosec B101 - asserts are appropriate in unit tests
+    # 1s fits the 2.5s budget; the following 2s backoff would overrun it.
+    assert slept == [1.0] and flaky.calls == 2  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_first_attempt_success_skips_schedule(monkeypatch):
+    def _no_schedule(self):
+        raise AssertionError("schedule built on the success path")
+
+    monkeypatch.setattr(RetryConfig, "attempt_delays", _no_schedule)
+    attempt_log = []
+    cfg = RetryConfig(attempt_logger=lambda **kw: attempt_log.append(kw))
+
+    assert retry_call(cfg, lambda: "ok") == "ok"  # nosec B101 - asserts are appropriate in unit tests
+    assert attempt_log == [{"attempt": 0, "max_attempts": 3, "delay": None, "error": None}]  # nosec B101
+
+
+def test_exhausted_retries_log_every_attempt(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
+    attempt_log = []
+    cfg = RetryConfig(max_attempts=3, jitter="none", attempt_logger=lambda **kw: attempt_log.append(kw))
+    flaky = _Flaky(fail_times=99, code=ErrorCode.TRANSIENT)
+
+    with pytest.raises(ProviderError) as ei:
+        retry_call(cfg, flaky)
+    assert ei.value.__context__ is None  # nosec B101 - asserts are appropriate in unit tests
+    assert [(e["attempt"], e["delay"]) for e in attempt_log] == [(0, 1.0), (1, 2.0), (2, None)]  # nosec B101
+    assert flaky.calls == 3  # nosec B101 - asserts are appropriate in unit tests
+
+
+def test_retry_decorates_coroutines_with_async_backoff(monkeypatch):
+    import asyncio
+    import inspect
+
+    slept = []
+
+    async def _fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+    monkeypatch.setattr(time, "sleep", lambda *_: pytest.fail("blocking sleep in async retry"))
+    flaky = _Flaky(fail_times=2, code=ErrorCode.TRANSIENT)
+
+    @retry(RetryConfig(max_attempts=3, delay_base=1.0, jitter="none"))
+    async def run():
+        return flaky()
+
+    assert inspect.iscoroutinefunction(run)  # nosec B101 - asserts are appropriate in unit tests
+    assert asyncio.run(run()) == "ok"  # nosec B101 - asserts are appropriate in unit tests
+    assert slept == [1.0, 1.0] and flaky.calls == 3  # nosec B101 - asserts are appropriate in unit tests
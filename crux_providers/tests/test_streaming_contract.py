@@ -133,3 +133,29 @@ def test_accumulate_error_event_short_circuits():
     print(
         "test_accumulate_error_event_short_circuits: ensured error terminal stops accumulation and ignores later deltas"
     )
+
+
+def test_accumulate_consumes_iterator_once_and_stops_at_error():
+    consumed = []
+
+    def _events():
+        for evt in (
+            ChatStreamEvent(provider="fake", model="m", delta="a"),
+            ChatStreamEvent(provider="fake", model="m", delta=None, finish=True, error="boom"),
+            ChatStreamEvent(provider="fake", model="m", delta="late"),
+        ):
+            consumed.append(evt.delta)
+            yield evt
+
+    resp = accumulate_events(_events())
+    assert resp.meta.model_name == "m"  # nosec B101 test assertion
+    assert resp.meta.extra.get("stream_error") == "boom"  # nosec B101 test assertion
+    assert consumed == ["a", None]  # nosec B101 test assertion
+
+    ok = accumulate_events(iter([ChatStreamEvent(provider="fake", model="m", delta=d) for d in ("x", "", "y")]))
+    assert ok.text == "xy" and ok.meta.extra.get("stream_events") == 3  # nosec B101 test assertion
+
+
+def test_chat_stream_event_is_slotted():
+    evt = ChatStreamEvent(provider="fake", model="m", delta="x")
+    assert not hasattr(evt, "__dict__")  # nosec B101 test assertion
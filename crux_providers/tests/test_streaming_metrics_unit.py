@@ -51,3 +51,10 @@ def test_validate_tokens_mapping_shape_and_raise_on_error():
     m.total_tokens = -5
     with pytest.raises(ValueError):
         validate_token_usage(m, raise_on_error=True)
+
+
+def test_stream_metrics_is_slotted():
+    m = StreamMetrics()
+    assert not hasattr(m, "__dict__")  # nosec B101 - pytest assert in tests
+    with pytest.raises(AttributeError):
+        m.unknown_field = 1  # type: ignore[attr-defined]
@@ -0,0 +1,28 @@
+"""Unit tests for start sub-phase timeout configuration.
+
+Proves that the init/first-token budgets default to the start timeout (so
+existing deployments keep identical behavior) and honor their overrides.
+"""
+
+from __future__ import annotations
+
+from crux_providers.base.timeouts import get_timeout_config
+
+
+def test_start_subphase_budgets_default_to_start_timeout(monkeypatch):
+    monkeypatch.setenv("PT_TIMEOUT_START_SECONDS", "12")
+    monkeypatch.delenv("PT_TIMEOUT_INIT_SECONDS", raising=False)
+    monkeypatch.delenv("PT_TIMEOUT_FIRST_TOKEN_SECONDS", raising=False)
+    cfg = get_timeout_config()
+    assert cfg.init_timeout_seconds == 12.0  # nosec B101 - pytest assertion
+    assert cfg.first_token_timeout_seconds == 12.0  # nosec B101 - pytest assertion
+
+
+def test_start_subphase_budgets_env_overrides(monkeypatch):
+    monkeypatch.setenv("PT_TIMEOUT_START_SECONDS", "60")
+    monkeypatch.setenv("PT_TIMEOUT_INIT_SECONDS", "45")
+    monkeypatch.setenv("PT_TIMEOUT_FIRST_TOKEN_SECONDS", "5")
+    cfg = get_timeout_config()
+    assert cfg.start_timeout_seconds == 60.0  # nosec B101 - pytest assertion
+    assert cfg.init_timeout_seconds == 45.0  # nosec B101 - pytest assertion
+    assert cfg.first_token_timeout_seconds == 5.0  # nosec B101 - pytest assertion
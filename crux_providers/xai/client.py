@@ -10,9 +10,10 @@ from __future__ import annotations
 from typing import Any, Optional
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
 
 from ..base.interfaces import HasDefaultModel
 from ..base.logging import get_logger
@@ -48,3 +49,8 @@ class XAIProvider(BaseOpenAIStyleProvider, HasDefaultModel):
 
     def _make_client(self):
         return OpenAI(api_key=self._api_key, base_url=self._base_url)  # type: ignore[arg-type]
+
+    def _make_async_client(self):
+        if AsyncOpenAI is None:
+            return None
+        return AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)  # type: ignore[arg-type]